@@ -1,4 +1,7 @@
 from .field_utils import *  # noqa: 401
 from .model_generator.generator import BaseClassEnum, ModelGenerator  # noqa: 401
+from .parallel import AvroCodecPool  # noqa: 401
+from .precompile import warmup  # noqa: 401
 from .schema_generator import AvroModel  # noqa: 401
+from .schema_store import ModelRegistry, SchemaStore  # noqa: 401
 from .types import *  # noqa: 401
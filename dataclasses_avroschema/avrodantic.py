@@ -1,7 +1,5 @@
 from typing import Any, Callable, Optional, Type, TypeVar
 
-from fastavro.validation import validate
-
 from .schema_generator import AvroModel
 from .types import JsonDict
 from .utils import standardize_custom_type
@@ -36,12 +34,11 @@ class AvroBaseModel(BaseModel, AvroModel):  # type: ignore
             for key, value in data.items()
         }
 
-    def validate_avro(self) -> bool:
+    def validate_avro(self, collect_errors: bool = False) -> bool:
         """
-        Validate that instance matches the avro schema
+        Validate that instance matches the avro schema. Check `AvroModel.validate`
         """
-        schema = self.avro_schema_to_python()
-        return validate(self.asdict(), schema)
+        return self._validate_schema(collect_errors=collect_errors)
 
     @classmethod
     def fake(cls: Type[CT], **data: Any) -> CT:
@@ -0,0 +1,593 @@
+"""
+Generation of specialised functions per model.
+
+The functions are created with `exec` the first time that they are needed,
+so the type introspection happens only once per model instead of once per call.
+"""
+import array
+import collections
+import dataclasses
+import decimal
+import enum
+import functools
+import inspect
+import itertools
+import math
+import numbers
+import typing
+
+from dacite import MissingValueError
+from dacite.types import is_instance
+from fastavro import validation
+from typing_extensions import get_args, get_origin
+
+from . import field_utils, types, utils
+
+SEQUENCE_ORIGINS = (list, collections.abc.Sequence, collections.abc.MutableSequence)
+MAPPING_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+NoneType = type(None)
+
+INT_MIN_VALUE, INT_MAX_VALUE = -(1 << 31), (1 << 31) - 1
+LONG_MIN_VALUE, LONG_MAX_VALUE = -(1 << 63), (1 << 63) - 1
+# biggest value that can be written as an avro float (32 bits)
+FLOAT32_MAX_VALUE = 3.4028234663852886e38
+# the same checks that `fastavro` does for each primitive type. Floats are also checked to be in the 32 bits range
+PRIMITIVE_CHECKS = {
+    "null": "{value} is None",
+    "boolean": "isinstance({value}, bool)",
+    "string": "isinstance({value}, str)",
+    "bytes": "isinstance({value}, (bytes, bytearray))",
+    "int": "(isinstance({value}, Integral) and not isinstance({value}, bool) "
+    f"and {INT_MIN_VALUE} <= {{value}} <= {INT_MAX_VALUE})",
+    "long": "(isinstance({value}, Integral) and not isinstance({value}, bool) "
+    f"and {LONG_MIN_VALUE} <= {{value}} <= {LONG_MAX_VALUE})",
+    "float": "(isinstance({value}, Real) and not isinstance({value}, bool) "
+    f"and (-{FLOAT32_MAX_VALUE} <= {{value}} <= {FLOAT32_MAX_VALUE} or not isfinite({{value}})))",
+    "double": "(isinstance({value}, Real) and not isinstance({value}, bool))",
+}
+VALIDATION_OPTIONS = {"strict": False, "disable_tuple_notation": False}
+
+
+def is_union_type(a_type: typing.Any) -> bool:
+    return get_origin(a_type) is typing.Union or (types.UnionType is not None and isinstance(a_type, types.UnionType))
+
+
+def is_compilable_model(a_type: typing.Any) -> bool:
+    """
+    Only models that are python dataclasses can be compiled.
+    pydantic and faust models have their own way to create instances.
+    """
+    return (
+        inspect.isclass(a_type)
+        and dataclasses.is_dataclass(a_type)
+        and hasattr(a_type, "_compiled_parser")
+        and not utils.is_faust_model(a_type)
+        and not utils.is_pydantic_model(a_type)
+    )
+
+
+def parse_union(
+    branches: typing.Tuple[typing.Tuple[typing.Optional[typing.Callable], typing.Any], ...], value: typing.Any
+) -> typing.Any:
+    """
+    Return the value converted to the first type of the union that matches,
+    the same way that `dacite` does it without `strict_unions_match`.
+    If there is not a match the value is returned as it is.
+    """
+    for convert, a_type in branches:
+        try:
+            result = value if convert is None else convert(value)
+        except Exception:
+            continue
+
+        if is_instance(result, a_type):
+            return result
+    return value
+
+
+def standardize_value(value: typing.Any) -> typing.Any:
+    """
+    Convert a value which type is not known beforehand, for example an union member,
+    into the python representation expected by `fastavro`.
+    It is equivalent to `dataclasses.asdict` together with `utils.standardize_custom_type`.
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    model = type(value)
+    if is_compilable_model(model):
+        return model._compiled_dict_converter()(value)  # type: ignore
+    elif dataclasses.is_dataclass(value):
+        return dataclasses.asdict(
+            value, dict_factory=lambda x: {key: utils.standardize_custom_type(item) for key, item in x}  # type: ignore
+        )
+    elif isinstance(value, dict):
+        return {key: standardize_value(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [standardize_value(item) for item in value]
+    return value
+
+
+def get_field_types(model: typing.Type) -> typing.Dict[str, typing.Any]:
+    """
+    Return the python type of each field, the same types that are used to generate the schema.
+    """
+    if utils.is_pydantic_model(model):
+        return {field.name: field.annotation for field in model.__fields__.values()}
+    return {field.name: field.type for field in dataclasses.fields(model)}
+
+
+def exceeds_float32(schema: typing.Any, value: typing.Any) -> bool:
+    """
+    Whether the value is a float, or contains floats in arrays or maps, that can not be written as an avro float.
+    `fastavro` does not check it when validating, but it fails when writing the value.
+    """
+    avro_type = schema.get("type") if isinstance(schema, dict) else schema
+
+    if avro_type == field_utils.FLOAT:
+        return (
+            isinstance(value, numbers.Real)
+            and not isinstance(value, bool)
+            and math.isfinite(value)
+            and abs(float(value)) > FLOAT32_MAX_VALUE
+        )
+    elif avro_type == field_utils.ARRAY and isinstance(value, (list, tuple)):
+        return any(exceeds_float32(schema["items"], item) for item in value)
+    elif avro_type == field_utils.MAP and isinstance(value, dict):
+        return any(exceeds_float32(schema["values"], item) for item in value.values())
+    return False
+
+
+def to_avro_value(value: typing.Any) -> typing.Any:
+    """
+    Convert a value into the python representation used to serialize it,
+    using the model converter when the value is a model instance.
+    """
+    if hasattr(value, "_dict_converter") and not inspect.isclass(value):
+        return value._dict_converter()(value)
+    return standardize_value(value)
+
+
+def validate_value(
+    schema: typing.Any,
+    named_schemas: typing.Dict[str, typing.Any],
+    value: typing.Any,
+    field: str = "",
+    raise_errors: bool = False,
+) -> bool:
+    """
+    Validate the value with `fastavro`. `schema` must be part of a schema already parsed
+    and `named_schemas` the named types of that schema.
+    """
+    return validation._validate(  # type: ignore
+        to_avro_value(value), schema, named_schemas, field, raise_errors, VALIDATION_OPTIONS
+    )
+
+
+def validation_errors(
+    schema: typing.Any, named_schemas: typing.Dict[str, typing.Any], value: typing.Any, field: str
+) -> typing.List[validation.ValidationErrorData]:
+    """
+    Return the errors of the value of a field, found by `fastavro`
+    """
+    try:
+        validate_value(schema, named_schemas, value, field=field, raise_errors=True)
+    except validation.ValidationError as error:
+        return list(error.errors)
+
+    if exceeds_float32(schema, value):
+        return [validation.ValidationErrorData(value, schema, field)]
+    return []
+
+
+class Compiler:
+    """
+    Base class to generate python functions for a model
+    """
+
+    def __init__(self, model: typing.Type) -> None:
+        self.model = model
+        self.namespace: typing.Dict[str, typing.Any] = {"model": model}
+        self.counter = itertools.count()
+
+    def add_to_namespace(self, value: typing.Any, prefix: str) -> str:
+        name = f"{prefix}_{next(self.counter)}"
+        self.namespace[name] = value
+        return name
+
+    def get_type_hints(self) -> typing.Dict[str, typing.Any]:
+        return typing.get_type_hints(self.model, localns={self.model.__name__: self.model})
+
+    def exec_function(self, function_name: str, lines: typing.List[str]) -> typing.Callable:
+        source = "\n".join(lines)
+        code = compile(source, f"<dataclasses_avroschema {self.model.__qualname__}>", "exec")
+        exec(code, self.namespace)
+
+        return self.namespace[function_name]
+
+
+def compile_row_builder(
+    model: typing.Type, names: typing.Sequence[str]
+) -> typing.Callable[..., typing.Dict[str, typing.Any]]:
+    """
+    Return a function that receives the values of the fields `names`, as positional arguments,
+    and returns the python dict used to serialize them. It is used with `map` over many columns.
+    """
+    arguments = ", ".join(f"value_{index}" for index in range(len(names)))
+    items = ", ".join(f"{name!r}: value_{index}" for index, name in enumerate(names))
+    lines = [f"def build_row({arguments}):", f"    return {{{items}}}"]
+
+    return Compiler(model).exec_function("build_row", lines)
+
+
+class ParserCompiler(Compiler):
+    """
+    Generate a function that creates a model instance from a python dict, for example
+    the payload returned by `fastavro`. It is equivalent to `dacite.from_dict` with the
+    default `AvroModel` config (`check_types=False` and cast to `Tuple` and `Enum`)
+    """
+
+    def __init__(self, model: typing.Type) -> None:
+        super().__init__(model)
+        self.namespace["MissingValueError"] = MissingValueError
+
+    def convert(self, a_type: typing.Any, value: str) -> typing.Optional[str]:
+        """
+        Return a python expression that converts the expression `value` to `a_type`.
+        None is returned when the value does not need to be converted.
+        """
+        origin = get_origin(a_type)
+
+        if is_union_type(a_type):
+            return self.convert_union(a_type, value)
+        elif origin in SEQUENCE_ORIGINS:
+            item = f"item_{next(self.counter)}"
+            expression = self.convert(get_args(a_type)[0], item)
+
+            if expression is None:
+                return f"list({value})"
+            return f"[{expression} for {item} in {value}]"
+        elif origin is tuple:
+            item = f"item_{next(self.counter)}"
+            args = get_args(a_type)
+            expression = self.convert(args[0], item) if args else None
+
+            if expression is None:
+                return f"tuple({value})"
+            return f"tuple({expression} for {item} in {value})"
+        elif origin in MAPPING_ORIGINS:
+            key, item = f"key_{next(self.counter)}", f"item_{next(self.counter)}"
+            expression = self.convert(get_args(a_type)[1], item)
+
+            if expression is None:
+                return f"dict({value})"
+            return f"{{{key}: {expression} for {key}, {item} in {value}.items()}}"
+        elif origin is None and inspect.isclass(a_type):
+            if a_type is tuple:
+                return f"tuple({value})"
+            elif issubclass(a_type, enum.Enum):
+                return f"{self.add_to_namespace(a_type, 'enum')}({value})"
+            elif is_compilable_model(a_type):
+                parser = self.add_to_namespace(a_type._compiled_parser(), "parse")  # type: ignore
+                return f"({parser}({value}) if isinstance({value}, dict) else {value})"
+
+        # primitive types, logical types and self relationships are used as they are
+        return None
+
+    def convert_union(self, a_type: typing.Any, value: str) -> typing.Optional[str]:
+        args = get_args(a_type)
+        not_null_args = [arg for arg in args if arg is not NoneType]
+
+        if len(args) == 2 and len(not_null_args) == 1:
+            # typing.Optional, the type is used directly
+            expression = self.convert(not_null_args[0], value)
+        else:
+            branches = []
+            for arg in args:
+                arg_expression = self.convert(arg, "value")
+                convert = None
+                if arg_expression is not None:
+                    convert = eval(f"lambda value: {arg_expression}", self.namespace)
+                branches.append((convert, arg))
+
+            union = self.add_to_namespace(functools.partial(parse_union, tuple(branches)), "union")
+            expression = f"{union}({value})"
+
+        if expression is None or len(not_null_args) == len(args):
+            return expression
+        return f"(None if {value} is None else {expression})"
+
+    def field_lines(self, field: dataclasses.Field, a_type: typing.Any) -> typing.List[str]:
+        name = field.name
+        variable = f"field_{name}"
+        expression = self.convert(a_type, "value") or "value"
+
+        if field.default is not dataclasses.MISSING:
+            missing = f"{variable} = {self.add_to_namespace(field.default, 'default')}"
+        elif field.default_factory is not dataclasses.MISSING:  # type: ignore
+            missing = f"{variable} = {self.add_to_namespace(field.default_factory, 'default_factory')}()"  # type: ignore
+        elif is_union_type(a_type) and NoneType in get_args(a_type):
+            missing = f"{variable} = None"
+        elif field.init:
+            missing = f"raise MissingValueError({name!r})"
+        else:
+            missing = "pass"
+
+        return [
+            f"    if {name!r} in data:",
+            f"        value = data[{name!r}]",
+            f"        {variable} = {expression}",
+            "    else:",
+            f"        {missing}",
+        ]
+
+    def compile(self) -> typing.Callable[[typing.Dict], typing.Any]:
+        type_hints = self.get_type_hints()
+        fields = dataclasses.fields(self.model)
+        init_fields = [field for field in fields if field.init]
+        no_init_fields = [field for field in fields if not field.init]
+
+        function_name = f"parse_{self.model.__name__}"
+        lines = [f"def {function_name}(data):"]
+
+        for field in fields:
+            lines.extend(self.field_lines(field, type_hints[field.name]))
+
+        arguments = ", ".join(f"{field.name}=field_{field.name}" for field in init_fields)
+        lines.append(f"    instance = model({arguments})")
+
+        if not self.model.__dataclass_params__.frozen:  # type: ignore
+            for field in no_init_fields:
+                lines.append(f"    if {field.name!r} in data:")
+                lines.append(f"        instance.{field.name} = field_{field.name}")
+
+        lines.append("    return instance")
+
+        return self.exec_function(function_name, lines)
+
+
+class DictConverterCompiler(Compiler):
+    """
+    Generate a function that converts a model instance into the python dict expected by `fastavro`.
+    It is equivalent to `dataclasses.asdict` with `utils.standardize_custom_type` as factory, but only
+    the conversions needed by each field type are done and the immutable values are not copied.
+    """
+
+    def __init__(self, model: typing.Type) -> None:
+        super().__init__(model)
+        self.namespace["standardize_value"] = standardize_value
+        self.namespace["Enum"] = enum.Enum
+
+    def convert(self, a_type: typing.Any, value: str) -> typing.Optional[str]:
+        """
+        Return a python expression that converts the expression `value` of type `a_type`.
+        None is returned when the value does not need to be converted.
+        """
+        origin = get_origin(a_type)
+
+        if is_union_type(a_type):
+            args = get_args(a_type)
+            not_null_args = [arg for arg in args if arg is not NoneType]
+
+            if len(args) == 2 and len(not_null_args) == 1:
+                expression = self.convert(not_null_args[0], value)
+                if expression is None:
+                    return None
+                return f"(None if {value} is None else {expression})"
+            # the value can be any of the types, then it must be checked at runtime
+            return f"standardize_value({value})"
+        elif origin in SEQUENCE_ORIGINS or origin is tuple:
+            args = get_args(a_type)
+            item = f"item_{next(self.counter)}"
+            expression = self.convert(args[0], item) if args else f"standardize_value({item})"
+
+            if expression is None:
+                return None
+            return f"[{expression} for {item} in {value}]"
+        elif origin in MAPPING_ORIGINS:
+            key, item = f"key_{next(self.counter)}", f"item_{next(self.counter)}"
+            expression = self.convert(get_args(a_type)[1], item)
+
+            if expression is None:
+                return None
+            return f"{{{key}: {expression} for {key}, {item} in {value}.items()}}"
+        elif origin is None and inspect.isclass(a_type):
+            if a_type in field_utils.PRIMITIVE_AND_LOGICAL_TYPES or a_type in (decimal.Decimal, types.Fixed):
+                return None
+            elif issubclass(a_type, enum.Enum):
+                return f"({value}.value if isinstance({value}, Enum) else {value})"
+            elif is_compilable_model(a_type):
+                converter = self.add_to_namespace(a_type._compiled_dict_converter(), "to_dict")  # type: ignore
+                model = self.add_to_namespace(a_type, "model")
+                return f"({converter}({value}) if type({value}) is {model} else standardize_value({value}))"
+
+        # self relationships, bare containers and unknown types
+        return f"standardize_value({value})"
+
+    def compile(self) -> typing.Callable[[typing.Any], typing.Dict]:
+        type_hints = self.get_type_hints()
+
+        function_name = f"to_dict_{self.model.__name__}"
+        lines = [f"def {function_name}(instance):"]
+        items = []
+
+        for field in dataclasses.fields(self.model):
+            variable = f"field_{field.name}"
+            expression = self.convert(type_hints[field.name], variable)
+
+            if expression is None:
+                items.append(f"{field.name!r}: instance.{field.name}")
+            else:
+                lines.append(f"    {variable} = instance.{field.name}")
+                items.append(f"{field.name!r}: {expression}")
+
+        lines.append(f"    return {{{', '.join(items)}}}")
+
+        return self.exec_function(function_name, lines)
+
+
+class ValidatorCompiler(Compiler):
+    """
+    Generate a function that returns whether an instance matches the model schema. The attributes
+    are checked directly, without converting the instance into a python dict first.
+
+    The types that do not have a specific check, like logical types or unions, are validated with `fastavro`.
+    """
+
+    def __init__(self, model: typing.Type) -> None:
+        super().__init__(model)
+        self.schema = model._parsed_schema()
+        self.named_schemas = self.schema["__named_schemas"]
+        # names of the functions generated for each model
+        self.record_validators: typing.Dict[typing.Type, str] = {}
+        self.lines: typing.List[str] = []
+        self.namespace.update(
+            {
+                "Integral": numbers.Integral,
+                "Real": numbers.Real,
+                "Sequence": collections.abc.Sequence,
+                "Mapping": collections.abc.Mapping,
+                "array": array.array,
+                "isfinite": math.isfinite,
+            }
+        )
+
+    def fallback(self, schema: typing.Any, value: str) -> str:
+        validator = self.add_to_namespace(functools.partial(validate_value, schema, self.named_schemas), "validate")
+        return f"{validator}({value})"
+
+    def check(self, a_type: typing.Any, schema: typing.Any, value: str) -> str:
+        """
+        Return a python expression that is True when the expression `value`,
+        which python type is `a_type`, matches the avro `schema`.
+        """
+        if isinstance(schema, list):
+            args = get_args(a_type) if is_union_type(a_type) else ()
+            not_null_args = [arg for arg in args if arg is not NoneType]
+
+            if len(schema) == 2 and "null" in schema and len(not_null_args) == 1:
+                # typing.Optional
+                not_null_schema = schema[1] if schema[0] == "null" else schema[0]
+                return f"({value} is None or {self.check(not_null_args[0], not_null_schema, value)})"
+            return self.fallback(schema, value)
+        elif isinstance(schema, str):
+            if schema in PRIMITIVE_CHECKS:
+                return PRIMITIVE_CHECKS[schema].format(value=value)
+            # named type defined before in the schema
+            return self.check_named_type(a_type, schema, value)
+        elif "logicalType" in schema:
+            return self.fallback(schema, value)
+
+        avro_type = schema["type"]
+        origin = get_origin(a_type)
+
+        if avro_type in PRIMITIVE_CHECKS:
+            return PRIMITIVE_CHECKS[avro_type].format(value=value)
+        elif avro_type == field_utils.ARRAY and (origin in SEQUENCE_ORIGINS or origin is tuple) and get_args(a_type):
+            item = f"item_{next(self.counter)}"
+            expression = self.check(get_args(a_type)[0], schema["items"], item)
+            return (
+                f"(isinstance({value}, (Sequence, array)) and not isinstance({value}, str) "
+                f"and all({expression} for {item} in {value}))"
+            )
+        elif avro_type == field_utils.MAP and origin in MAPPING_ORIGINS and get_args(a_type):
+            key, item = f"key_{next(self.counter)}", f"item_{next(self.counter)}"
+            expression = self.check(get_args(a_type)[1], schema["values"], item)
+            return (
+                f"(isinstance({value}, Mapping) "
+                f"and all(isinstance({key}, str) and {expression} for {key}, {item} in {value}.items()))"
+            )
+        elif avro_type == field_utils.FIXED:
+            return f"(isinstance({value}, bytes) and len({value}) == {schema['size']})"
+        elif avro_type in (field_utils.RECORD, field_utils.ENUM):
+            return self.check_named_type(a_type, schema, value)
+
+        return self.fallback(schema, value)
+
+    def check_named_type(self, a_type: typing.Any, schema: typing.Any, value: str) -> str:
+        if inspect.isclass(a_type) and issubclass(a_type, enum.Enum):
+            enum_type = self.add_to_namespace(a_type, "enum")
+            symbols = self.add_to_namespace([member.value for member in a_type if member.name != "Meta"], "symbols")
+            return f"(({value}.value if isinstance({value}, {enum_type}) else {value}) in {symbols})"
+        elif inspect.isclass(a_type) and hasattr(a_type, "_compiled_validator"):
+            record_schema = self.named_schemas.get(schema) if isinstance(schema, str) else schema
+
+            if record_schema is not None:
+                model = self.add_to_namespace(a_type, "model")
+                return f"(type({value}) is {model} and {self.record_validator(a_type, record_schema)}({value}))"
+
+        # the value will be converted, for example a dict instead of a model instance
+        return self.fallback(schema, value)
+
+    def record_validator(self, model: typing.Type, schema: typing.Dict[str, typing.Any]) -> str:
+        """
+        Generate the function that validates the instances of a model, the root or a nested record,
+        and return its name. Each model has only one function, so models can reference each other.
+        """
+        function_name = self.record_validators.get(model)
+        if function_name is not None:
+            return function_name
+
+        function_name = self.record_validators[model] = f"is_valid_{model.__name__}_{next(self.counter)}"
+        field_types = get_field_types(model)
+        lines = [f"def {function_name}(instance):"]
+
+        for field in schema["fields"]:
+            name = field["name"]
+            variable = f"field_{name}"
+            lines.append(f"    {variable} = instance.{name}")
+            lines.append(f"    if not {self.check(field_types.get(name), field['type'], variable)}:")
+            lines.append("        return False")
+
+        lines.append("    return True")
+        self.lines.extend(lines)
+
+        return function_name
+
+    def compile(self) -> typing.Callable[[typing.Any], bool]:
+        function_name = self.record_validator(self.model, self.schema)
+        return self.exec_function(function_name, self.lines)
+
+    def compile_fields(self) -> typing.Dict[str, typing.Callable[[typing.Any], bool]]:
+        """
+        Generate a function for each field of the model, that returns whether a value of the field is valid
+        """
+        field_types = get_field_types(self.model)
+        function_names = {}
+
+        for field in self.schema["fields"]:
+            name = field["name"]
+            function_name = function_names[name] = f"is_valid_{name}_{next(self.counter)}"
+            check = self.check(field_types.get(name), field["type"], "value")
+            self.lines.extend([f"def {function_name}(value):", f"    return {check}"])
+
+        self.exec_function(function_name, self.lines)
+        return {name: self.namespace[function_name] for name, function_name in function_names.items()}
+
+
+def compile_parser(model: typing.Type) -> typing.Callable[[typing.Dict], typing.Any]:
+    """
+    Return a function that creates instances of `model` from python dicts.
+    """
+    return ParserCompiler(model).compile()
+
+
+def compile_dict_converter(model: typing.Type) -> typing.Callable[[typing.Any], typing.Dict]:
+    """
+    Return a function that converts instances of `model` into python dicts ready to be serialized.
+    """
+    return DictConverterCompiler(model).compile()
+
+
+def compile_validator(model: typing.Type) -> typing.Callable[[typing.Any], bool]:
+    """
+    Return a function that returns whether instances of `model` match the model schema.
+    """
+    return ValidatorCompiler(model).compile()
+
+
+def compile_field_validators(model: typing.Type) -> typing.Dict[str, typing.Callable[[typing.Any], bool]]:
+    """
+    Return a function for each field of `model` that returns whether a value of the field is valid.
+    """
+    return ValidatorCompiler(model).compile_fields()
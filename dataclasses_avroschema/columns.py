@@ -0,0 +1,156 @@
+"""
+Columnar data, a python dict with a list or a NumPy array of values for each field,
+converted into the rows used to serialize them, and from the deserialized payloads,
+without creating the model instances.
+"""
+import dataclasses
+import itertools
+import operator
+import typing
+
+from . import codegen, schema_generator, utils
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore # pragma: no cover
+
+# values of these avro types, including their logical types, are written as they are
+PRIMITIVE_TYPES = ("null", "boolean", "int", "long", "float", "double", "bytes", "string")
+
+# NumPy dtypes used for the fields when columns are deserialized as arrays
+NUMPY_DTYPES = {
+    "boolean": "bool",
+    "int": "int32",
+    "long": "int64",
+    "float": "float32",
+    "double": "float64",
+}
+NUMPY_LOGICAL_DTYPES = {
+    "date": "datetime64[D]",
+    "timestamp-millis": "datetime64[ms]",
+    "timestamp-micros": "datetime64[us]",
+}
+
+
+def to_list(column: typing.Iterable) -> typing.List:
+    """
+    Return the column values as a python list. NumPy arrays are converted with `tolist`,
+    which creates the python ints and floats in C.
+    """
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column.tolist()
+    return list(column)
+
+
+def is_primitive(schema: typing.Any) -> bool:
+    avro_type = schema.get("type") if isinstance(schema, dict) else schema
+    return isinstance(avro_type, str) and avro_type in PRIMITIVE_TYPES
+
+
+def get_defaults(model: typing.Type["schema_generator.AvroModel"]) -> typing.Dict[str, typing.Any]:
+    """
+    Return the default value of each field that has one. Default factories are called once.
+    """
+    defaults: typing.Dict[str, typing.Any] = {}
+
+    if utils.is_pydantic_model(model):
+        for model_field in model.__fields__.values():  # type: ignore
+            if model_field.default_factory is not None:
+                defaults[model_field.name] = model_field.default_factory()
+            elif not model_field.required:
+                defaults[model_field.name] = model_field.default
+        return defaults
+
+    for field in dataclasses.fields(model):  # type: ignore
+        if field.default_factory is not dataclasses.MISSING:  # type: ignore
+            defaults[field.name] = field.default_factory()  # type: ignore
+        elif field.default is not dataclasses.MISSING:
+            defaults[field.name] = field.default
+    return defaults
+
+
+def iter_rows(
+    model: typing.Type["schema_generator.AvroModel"], columns: typing.Mapping[str, typing.Iterable]
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """
+    Return the python dicts used to serialize each row of `columns`, built with a function generated
+    for the model. All the columns must have the same length.
+    The fields without a column use their default value.
+    """
+    fields = model._parsed_schema()["fields"]
+    unknown = set(columns) - {field["name"] for field in fields}
+    if unknown:
+        raise ValueError(f"Columns {sorted(unknown)} are not fields of {model.__name__}")
+
+    defaults = get_defaults(model)
+    names = []
+    values: typing.List[typing.Iterable] = []
+    lengths = set()
+
+    for field in fields:
+        name = field["name"]
+
+        if name in columns:
+            column = to_list(columns[name])
+            if not is_primitive(field["type"]):
+                column = list(map(codegen.to_avro_value, column))
+            lengths.add(len(column))
+            values.append(column)
+        elif name in defaults:
+            values.append(itertools.repeat(codegen.to_avro_value(defaults[name])))
+        else:
+            raise ValueError(f"Column {name} is required, the field does not have a default value")
+        names.append(name)
+
+    if len(lengths) > 1:
+        raise ValueError(f"All the columns must have the same length, got lengths {sorted(lengths)}")
+    elif not lengths:
+        return iter(())
+
+    build_row = model._from_cache("row_builder", lambda: codegen.compile_row_builder(model, names))
+    return map(build_row, *values)
+
+
+def get_numpy_dtype(schema: typing.Any) -> typing.Optional[str]:
+    """
+    Return the NumPy dtype used for the values of a field, or None if they are kept in a list
+    """
+    if isinstance(schema, str):
+        return NUMPY_DTYPES.get(schema)
+    elif isinstance(schema, dict) and "logicalType" in schema:
+        return NUMPY_LOGICAL_DTYPES.get(schema["logicalType"])
+    elif isinstance(schema, dict) and isinstance(schema["type"], str):
+        return NUMPY_DTYPES.get(schema["type"])
+    return None
+
+
+def to_array(column: typing.List, dtype: str) -> typing.Any:
+    if dtype in ("datetime64[ms]", "datetime64[us]"):
+        # fastavro returns datetimes in UTC, NumPy does not support timezones
+        column = [value.replace(tzinfo=None) for value in column]
+    return numpy.array(column, dtype=dtype)
+
+
+def to_columns(
+    model: typing.Type["schema_generator.AvroModel"],
+    payloads: typing.Iterable[typing.Dict[str, typing.Any]],
+    as_numpy: bool = False,
+) -> typing.Dict[str, typing.Any]:
+    """
+    Return the values of each field of the payloads, in a list. With `as_numpy` the numeric, boolean,
+    date and timestamp fields are returned as NumPy arrays.
+    """
+    if as_numpy and numpy is None:
+        raise ImportError("NumPy is required to deserialize columns as arrays. Install it with `pip install numpy`")
+
+    payloads = list(payloads)
+    result = {}
+
+    for field in model._parsed_schema()["fields"]:
+        name = field["name"]
+        column = list(map(operator.itemgetter(name), payloads))
+        dtype = get_numpy_dtype(field["type"]) if as_numpy else None
+
+        result[name] = column if dtype is None else to_array(column, dtype)
+    return result
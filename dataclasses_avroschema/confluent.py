@@ -0,0 +1,193 @@
+"""
+Confluent wire format: the magic byte 0, the schema id as a 4 bytes big endian integer
+and the avro binary payload. The schemas are looked up by id with a `SchemaResolver`.
+"""
+import abc
+import json
+import struct
+import typing
+import urllib.error
+import urllib.request
+
+import fastavro
+
+from . import resolution
+from .exceptions import InvalidWireFormat, SchemaIdLookupNotSupported, UnknownSchemaId
+from .schema_generator import AVRO, AvroModel
+from .types import Buffer, JsonDict
+
+CT = typing.TypeVar("CT", bound=AvroModel)
+
+MAGIC_BYTE = 0
+HEADER = struct.Struct(">bI")
+SCHEMA_CACHE_SIZE = 128
+
+
+class SchemaResolver(abc.ABC):
+    """
+    Source of the schemas used in the wire format, for example a schema registry.
+    """
+
+    @abc.abstractmethod
+    def get_schema(self, schema_id: int) -> JsonDict:
+        """
+        Return the schema with `schema_id`. If it does not exist `UnknownSchemaId` must be raised.
+        """
+
+    def get_schema_id(self, schema: JsonDict) -> int:
+        """
+        Return the id of `schema`, needed to encode events when the id is not provided.
+        Resolvers that can not look up the ids raise `SchemaIdLookupNotSupported`.
+        """
+        raise SchemaIdLookupNotSupported(type(self).__name__)
+
+
+class InMemorySchemaResolver(SchemaResolver):
+    """
+    Resolver that keeps the schemas in memory, useful for tests and for services
+    that know all the schemas beforehand.
+    """
+
+    def __init__(self, schemas: typing.Optional[typing.Dict[int, JsonDict]] = None) -> None:
+        self.schemas: typing.Dict[int, JsonDict] = {}
+        self.ids: typing.Dict[str, int] = {}
+
+        for schema_id, schema in (schemas or {}).items():
+            self.register(schema, schema_id=schema_id)
+
+    def register(
+        self, schema: typing.Union[JsonDict, typing.Type[AvroModel]], schema_id: typing.Optional[int] = None
+    ) -> int:
+        """
+        Add a schema, or the schema of a model, and return its id.
+        If `schema_id` is not provided the next free id is used.
+        """
+        if isinstance(schema, type) and issubclass(schema, AvroModel):
+            schema = schema.avro_schema_to_python()
+
+        fingerprint = resolution.schema_fingerprint(schema)
+        if schema_id is None:
+            schema_id = self.ids.get(fingerprint, max(self.schemas, default=0) + 1)
+
+        self.schemas[schema_id] = schema
+        self.ids.setdefault(fingerprint, schema_id)
+
+        return schema_id
+
+    def get_schema(self, schema_id: int) -> JsonDict:
+        try:
+            return self.schemas[schema_id]
+        except KeyError:
+            raise UnknownSchemaId(schema_id) from None
+
+    def get_schema_id(self, schema: JsonDict) -> int:
+        try:
+            return self.ids[resolution.schema_fingerprint(schema)]
+        except KeyError:
+            raise ValueError("The schema is not registered") from None
+
+
+class HTTPSchemaResolver(SchemaResolver):
+    """
+    Resolver that gets the schemas from a Confluent compatible schema registry using its REST API.
+    To look up the ids of the schemas, the `subject` where they are registered is needed.
+    """
+
+    def __init__(self, url: str, subject: typing.Optional[str] = None, timeout: float = 10) -> None:
+        self.url = url.rstrip("/")
+        self.subject = subject
+        self.timeout = timeout
+
+    def request(self, path: str, data: typing.Optional[JsonDict] = None) -> JsonDict:
+        request = urllib.request.Request(
+            f"{self.url}{path}",
+            data=None if data is None else json.dumps(data).encode("utf-8"),
+            headers={"Content-Type": "application/vnd.schemaregistry.v1+json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+    def get_schema(self, schema_id: int) -> JsonDict:
+        try:
+            response = self.request(f"/schemas/ids/{schema_id}")
+        except urllib.error.HTTPError as error:
+            if error.code == 404:
+                raise UnknownSchemaId(schema_id) from None
+            raise
+        return json.loads(response["schema"])
+
+    def get_schema_id(self, schema: JsonDict) -> int:
+        if self.subject is None:
+            raise SchemaIdLookupNotSupported(type(self).__name__, "the subject is needed to look up the ids")
+        return self.request(f"/subjects/{self.subject}", {"schema": json.dumps(schema)})["id"]
+
+
+class WireFormat:
+    """
+    Encode and decode events with the Confluent wire format.
+
+    The schemas returned by the resolver are parsed once and kept in a LRU cache by id,
+    so decoding an event only adds a dictionary lookup to `AvroModel.deserialize`.
+
+    Example:
+        resolver = InMemorySchemaResolver()
+        schema_id = resolver.register(User)
+        wire_format = WireFormat(resolver)
+
+        event = wire_format.encode(User(name="john"), schema_id=schema_id)
+        wire_format.decode(event, User)
+    """
+
+    def __init__(self, resolver: SchemaResolver, cache_size: int = SCHEMA_CACHE_SIZE) -> None:
+        self.resolver = resolver
+        self.schemas = resolution.LRUCache(maxsize=cache_size)
+        self.schema_ids = resolution.LRUCache(maxsize=cache_size)
+
+    def get_writer_schema(self, schema_id: int) -> JsonDict:
+        """
+        Return the schema with `schema_id` parsed by fastavro
+        """
+        return self.schemas.get(schema_id, lambda: fastavro.parse_schema(self.resolver.get_schema(schema_id)))
+
+    def get_schema_id(self, model: typing.Type[AvroModel]) -> int:
+        """
+        Return the id of the model schema, asking the resolver only the first time
+        """
+        return self.schema_ids.get(model, lambda: self.resolver.get_schema_id(model.avro_schema_to_python()))
+
+    def encode(self, instance: AvroModel, schema_id: typing.Optional[int] = None) -> bytes:
+        """
+        Serialize the instance with the wire format header. If `schema_id` is not provided,
+        it is looked up with the resolver.
+        """
+        if schema_id is None:
+            schema_id = self.get_schema_id(type(instance))
+
+        return HEADER.pack(MAGIC_BYTE, schema_id) + instance.serialize()
+
+    def decode(self, data: Buffer, model: typing.Type[CT], create_instance: bool = True) -> typing.Union[JsonDict, CT]:
+        """
+        Deserialize the event to `model`, using the schema of the header id as writer schema.
+        """
+        schema_id, payload = read_header(data)
+
+        return model.deserialize(
+            payload,
+            serialization_type=AVRO,
+            create_instance=create_instance,
+            writer_schema=self.get_writer_schema(schema_id),
+        )
+
+
+def read_header(data: Buffer) -> typing.Tuple[int, memoryview]:
+    """
+    Return the schema id of an event with the wire format and its payload,
+    which is a view of `data` so it is not copied.
+    """
+    view = memoryview(data).cast("B")
+
+    if len(view) < HEADER.size or view[0] != MAGIC_BYTE:
+        raise InvalidWireFormat()
+
+    _, schema_id = HEADER.unpack_from(view)
+    return schema_id, view[HEADER.size :]
@@ -0,0 +1,237 @@
+"""
+Cache of the rendered schemas stored on disk, so short lived processes that use many models
+do not generate the same schemas every time that they start.
+
+It is disabled by default. It can be enabled with `enable(directory)` or with the environment
+variable `DATACLASSES_AVROSCHEMA_CACHE_DIR`.
+"""
+import dataclasses
+import enum
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import typing
+import warnings
+from collections import OrderedDict
+
+import fastavro
+from typing_extensions import get_args
+
+from . import schema_generator, utils
+
+CACHE_DIR_ENV = "DATACLASSES_AVROSCHEMA_CACHE_DIR"
+
+try:
+    from importlib.metadata import PackageNotFoundError, version
+except ImportError:  # pragma: no cover
+    # python 3.7
+    LIBRARY_VERSION = "unknown"
+else:
+    try:
+        LIBRARY_VERSION = version("dataclasses-avroschema")
+    except PackageNotFoundError:  # pragma: no cover
+        LIBRARY_VERSION = "unknown"
+
+# schemas also depend on how the library renders them
+VERSION = f"{LIBRARY_VERSION}-fastavro-{fastavro.__version__}"
+
+
+def qualified_name(value: typing.Any) -> str:
+    """
+    Return the qualified name of a class or a function
+    """
+    # builtin methods do not have a module, it is taken from their class
+    owner = getattr(value, "__objclass__", None) or getattr(value, "__self__", None)
+    module = getattr(value, "__module__", None) or getattr(owner, "__module__", "")
+    return f"{module}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+
+
+def stable_repr(value: typing.Any) -> str:
+    """
+    Return a representation of the value that is the same in every process. Functions and classes,
+    for example default factories or `dacite` type hooks, are represented by their qualified name,
+    because their `repr` can contain memory addresses.
+    """
+    if value is dataclasses.MISSING:
+        return "MISSING"
+    elif isinstance(value, enum.Enum):
+        return f"{qualified_name(type(value))}.{value.name}"
+    elif inspect.isclass(value) or inspect.isroutine(value):
+        return qualified_name(value)
+    elif isinstance(value, dict):
+        items = sorted(f"{stable_repr(key)}: {stable_repr(item)}" for key, item in value.items())
+        return "{" + ", ".join(items) + "}"
+    elif isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(stable_repr(item) for item in value)) + "}"
+    elif isinstance(value, (list, tuple)):
+        return "[" + ", ".join(stable_repr(item) for item in value) + "]"
+
+    representation = repr(value)
+    if " at 0x" in representation:
+        # default object repr, it contains the memory address
+        return qualified_name(type(value))
+    return representation
+
+
+def model_definition_hash(model: typing.Type["schema_generator.AvroModel"]) -> str:
+    """
+    Return a hash of everything used to generate the model schema: the fields with their types,
+    defaults and metadata, the docstring and the Meta class, including the nested models and enums.
+
+    It is calculated without generating the schema, so a stored schema can be validated cheaply.
+    Default factories are not called, they are represented by their qualified name, so the hash
+    is the same in every process.
+    """
+    hasher = hashlib.sha256()
+    seen: typing.Set[int] = set()
+
+    def add(*values: typing.Any) -> None:
+        for value in values:
+            hasher.update(stable_repr(value).encode("utf-8"))
+
+    def add_meta(meta: typing.Any) -> None:
+        if meta is not None:
+            add({name: value for name, value in vars(meta).items() if not name.startswith("__")})
+
+    def add_type(a_type: typing.Any) -> None:
+        add(a_type)
+
+        if inspect.isclass(a_type) and id(a_type) not in seen:
+            seen.add(id(a_type))
+
+            if issubclass(a_type, schema_generator.AvroModel):
+                add_model(a_type)
+            elif issubclass(a_type, enum.Enum):
+                # the enum Meta class is a member
+                meta = a_type.__members__.get("Meta")
+                add(a_type.__doc__, [(member.name, member.value) for member in a_type if member.name != "Meta"])
+                add_meta(meta.value if meta is not None else None)
+
+        for arg in get_args(a_type):
+            add_type(arg)
+
+    def add_model(klass: typing.Type["schema_generator.AvroModel"]) -> None:
+        klass._model_metadata()
+        add(qualified_name(klass), klass.__doc__)
+        add_meta(getattr(klass, "Meta", None))
+
+        if utils.is_pydantic_model(klass):
+            for model_field in klass.__fields__.values():  # type: ignore
+                add(
+                    model_field.name,
+                    model_field.required,
+                    model_field.default,
+                    model_field.default_factory,
+                    model_field.field_info.extra,
+                )
+                add_type(model_field.annotation)
+        else:
+            for field in dataclasses.fields(klass):  # type: ignore
+                add(field.name, field.default, field.default_factory, dict(field.metadata))  # type: ignore
+                add_type(field.type)
+
+    seen.add(id(model))
+    add_model(model)
+
+    return hasher.hexdigest()
+
+
+class DiskCache:
+    """
+    Rendered schemas stored in `directory`, one json file for each model.
+
+    Each file contains the hash of the model definition and the library version used to generate
+    the schema. When they do not match the current ones, or the file can not be read,
+    the schema is generated again and the file is replaced.
+
+    The directory is created when the first schema is stored. If it can not be created or written,
+    a warning is shown and the schemas are not stored anymore.
+    """
+
+    def __init__(self, directory: typing.Union[str, "os.PathLike[str]"]) -> None:
+        self.directory = os.fspath(directory)
+        self.writable = True
+
+    def get_path(self, model: type) -> str:
+        name = hashlib.sha256(qualified_name(model).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def get_key(self, model: typing.Type["schema_generator.AvroModel"]) -> typing.Dict[str, str]:
+        return {
+            "model": qualified_name(model),
+            "definition": model_definition_hash(model),
+            "version": VERSION,
+        }
+
+    def get_schema(self, model: typing.Type["schema_generator.AvroModel"]) -> typing.Optional[OrderedDict]:
+        """
+        Return the stored schema of the model, or None if it is not stored or the model changed
+        """
+        try:
+            with open(self.get_path(model), encoding="utf-8") as fo:
+                content = json.load(fo, object_pairs_hook=OrderedDict)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(content, dict) or content.get("key") != self.get_key(model):
+            return None
+        return content.get("schema")
+
+    def set_schema(self, model: typing.Type["schema_generator.AvroModel"], schema: OrderedDict) -> None:
+        """
+        Store the schema of the model. The file is replaced atomically,
+        so many processes can use the same directory.
+        """
+        if not self.writable:
+            return
+
+        content = {"key": self.get_key(model), "schema": schema}
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError as error:
+            # the cache is only an optimization
+            self.writable = False
+            warnings.warn(f"The schemas can not be stored in {self.directory}, the disk cache is disabled: {error}")
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fo:
+                json.dump(content, fo)
+            os.replace(temp_path, self.get_path(model))
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def clear(self) -> None:
+        if not os.path.isdir(self.directory):
+            return
+
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+
+# cache in use, if it is enabled
+cache: typing.Optional[DiskCache] = None
+
+
+def enable(directory: typing.Union[str, "os.PathLike[str]"]) -> DiskCache:
+    """
+    Store the rendered schemas in `directory` and use them the next time that the models are used
+    """
+    global cache
+    cache = DiskCache(directory)
+    return cache
+
+
+def disable() -> None:
+    global cache
+    cache = None
+
+
+if os.environ.get(CACHE_DIR_ENV):
+    enable(os.environ[CACHE_DIR_ENV])
@@ -12,3 +12,47 @@ class InvalidMap(Exception):
 
     def __str__(self) -> str:
         return f"Invalid map on field {self.field_name}. Keys must be string not {self.key_type}"
+
+
+class InvalidSingleObjectEncoding(ValueError):
+    def __str__(self) -> str:
+        return "Invalid single object encoding. Events must start with the marker C3 01 and the schema fingerprint"
+
+
+class UnknownSchemaFingerprint(ValueError):
+    def __init__(self, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+
+    def __str__(self) -> str:
+        return f"The event was written with an unknown schema. Schema fingerprint {self.fingerprint}"
+
+
+class BufferTooSmall(ValueError):
+    def __init__(self, size: int, needed: int) -> None:
+        self.size = size
+        self.needed = needed
+
+    def __str__(self) -> str:
+        return f"The event does not fit in the buffer. It has {self.size} bytes and at least {self.needed} are needed"
+
+
+class InvalidWireFormat(ValueError):
+    def __str__(self) -> str:
+        return "Invalid wire format. Events must start with the magic byte 0 and a 4 bytes schema id"
+
+
+class UnknownSchemaId(ValueError):
+    def __init__(self, schema_id: int) -> None:
+        self.schema_id = schema_id
+
+    def __str__(self) -> str:
+        return f"There is not a schema with id {self.schema_id}"
+
+
+class SchemaIdLookupNotSupported(ValueError):
+    def __init__(self, resolver: str, reason: str = "it can not look up the ids of the schemas") -> None:
+        self.resolver = resolver
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"The schema id must be provided to encode events with {self.resolver}: {self.reason}"
@@ -1,5 +1,3 @@
-from fastavro.validation import validate
-
 from .schema_generator import AvroModel
 
 try:
@@ -9,9 +7,8 @@ except ImportError as ex:  # pragma: no cover
 
 
 class AvroRecord(Record, AvroModel):  # type: ignore
-    def validate_avro(self) -> bool:
+    def validate_avro(self, collect_errors: bool = False) -> bool:
         """
-        Validate that instance matches the avro schema
+        Validate that instance matches the avro schema. Check `AvroModel.validate`
         """
-        schema = self.avro_schema_to_python()
-        return validate(self.asdict(), schema)
+        return self._validate_schema(collect_errors=collect_errors)
@@ -136,16 +136,16 @@ class BaseField:
         return None
 
     def exist_type(self) -> int:
-        # filter by the same field types
-        same_types = [
-            field.type
-            for field in self.parent.user_defined_types
-            if field.type == self.type and field.name != self.name
-        ]
+        user_defined_types = self.parent.user_defined_types
+        if not isinstance(user_defined_types, utils.UserDefinedTypes):
+            user_defined_types = utils.UserDefinedTypes(user_defined_types)
+
+        # names used to define the same type
+        names = user_defined_types.get_names(self.type)
 
         # If length > 0, means that it is the first appearance
         # of this type, otherwise exist already.
-        return len(same_types)
+        return len(names) - (self.name in names)
 
 
 class ImmutableField(BaseField):
@@ -0,0 +1,174 @@
+"""
+Serialization and deserialization of big batches in a process pool.
+
+The workers receive the rendered schemas only once, when they start, so they do not need
+to import or compile the models. Then each batch is split into chunks: python dicts are sent
+to serialize them and the events of each chunk are sent concatenated in one `bytes` object
+to deserialize them.
+"""
+import concurrent.futures
+import itertools
+import typing
+
+import fastavro
+
+from . import resolution, serialization
+from .schema_generator import AVRO, AvroModel
+from .types import Buffer, JsonDict
+
+DEFAULT_CHUNK_SIZE = 5_000
+
+# schemas used by the worker process, set when it starts
+worker_schemas: typing.Optional[resolution.ResolvedSchemas] = None
+
+
+def initialize_worker(schema: JsonDict, writer_schema: typing.Optional[JsonDict] = None) -> None:
+    global worker_schemas
+
+    reader_schema: JsonDict = fastavro.parse_schema(schema)  # type: ignore
+    worker_schemas = resolution.resolve(writer_schema or reader_schema, reader_schema)
+
+
+def get_worker_schemas() -> resolution.ResolvedSchemas:
+    if worker_schemas is None:
+        raise RuntimeError("The worker was not initialized with the model schema")
+    return worker_schemas
+
+
+def serialize_chunk(
+    payloads: typing.List[JsonDict], serialization_type: str, fingerprint: typing.Optional[str]
+) -> typing.Tuple[bytes, typing.List[int]]:
+    return serialization.serialize_many(
+        payloads,
+        get_worker_schemas().reader_schema,
+        serialization_type=serialization_type,
+        fingerprint=fingerprint,
+    )
+
+
+def deserialize_chunk(
+    data: bytes, offsets: typing.List[int], serialization_type: str, fingerprint: typing.Optional[str]
+) -> typing.List[JsonDict]:
+    schemas = get_worker_schemas()
+    view = memoryview(data)
+
+    return list(
+        serialization.deserialize_many(
+            (view[start:end] for start, end in zip(offsets, offsets[1:])),
+            schemas.reader_schema,
+            serialization_type=serialization_type,
+            writer_schema=schemas.writer_schema,
+            fingerprint=fingerprint,
+        )
+    )
+
+
+def join_events(events: typing.Sequence[Buffer]) -> typing.Tuple[bytes, typing.List[int]]:
+    """
+    Return the events in one buffer and the offsets where each event starts
+    """
+    offsets = [0, *itertools.accumulate(memoryview(event).nbytes for event in events)]
+    return b"".join(events), offsets
+
+
+class AvroCodecPool:
+    """
+    Process pool that serializes and deserializes big batches of `model`, preserving their order.
+
+    Usage:
+        with AvroCodecPool(User, processes=4) as pool:
+            events = pool.serialize_many(users)
+            users = list(pool.deserialize_many(events))
+
+    Attributes:
+        model: AvroModel to serialize and deserialize
+        processes: Optional[int] number of worker processes, by default the number of CPUs
+        writer_schema: AvroModel or python dict used to serialize the events that are deserialized
+        chunk_size: int number of events sent to a worker at once
+    """
+
+    def __init__(
+        self,
+        model: typing.Type[AvroModel],
+        processes: typing.Optional[int] = None,
+        writer_schema: typing.Optional[typing.Union[JsonDict, typing.Type[AvroModel]]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.model = model
+        self.writer_schema = writer_schema
+        self.chunk_size = chunk_size
+
+        if isinstance(writer_schema, type) and issubclass(writer_schema, AvroModel):
+            rendered_writer_schema: typing.Optional[JsonDict] = writer_schema.avro_schema_to_python()
+        else:
+            rendered_writer_schema = writer_schema  # type: ignore
+
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=initialize_worker,
+            initargs=(model.avro_schema_to_python(), rendered_writer_schema),
+        )
+
+    def __enter__(self) -> "AvroCodecPool":
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown()
+
+    def get_chunks(self, items: typing.Sequence) -> typing.List[typing.Sequence]:
+        return [items[start : start + self.chunk_size] for start in range(0, len(items), self.chunk_size)]
+
+    def serialize_many(
+        self,
+        instances: typing.Iterable[AvroModel],
+        serialization_type: str = AVRO,
+        concatenate: bool = False,
+    ) -> typing.Union[typing.List[bytes], typing.Tuple[bytes, typing.List[int]]]:
+        """
+        The same as `AvroModel.serialize_many`, with the events serialized in the worker processes
+        """
+        to_dict = self.model._dict_converter()
+        chunks = self.get_chunks([to_dict(instance) for instance in instances])
+        fingerprint = self.model._single_object_fingerprint(serialization_type)
+
+        buffers = []
+        offsets = [0]
+        for data, chunk_offsets in self.executor.map(
+            serialize_chunk, chunks, itertools.repeat(serialization_type), itertools.repeat(fingerprint)
+        ):
+            start = offsets[-1]
+            offsets.extend(start + offset for offset in chunk_offsets[1:])
+            buffers.append(data)
+
+        value = b"".join(buffers)
+        if concatenate:
+            return value, offsets
+        return serialization.split_events(value, offsets, serialization_type=serialization_type)
+
+    def deserialize_many(
+        self,
+        payloads: typing.Iterable[Buffer],
+        serialization_type: str = AVRO,
+        create_instance: bool = True,
+    ) -> typing.Iterator[typing.Union[JsonDict, AvroModel]]:
+        """
+        The same as `AvroModel.deserialize_many`, with the events decoded in the worker processes.
+        The instances are created in the current process.
+        """
+        chunks = [join_events(chunk) for chunk in self.get_chunks(list(payloads))]
+        fingerprint = self.model._single_object_fingerprint(serialization_type, self.writer_schema)
+        parse_obj = self.model._object_parser()
+
+        for rows in self.executor.map(
+            deserialize_chunk,
+            [data for data, _ in chunks],
+            [offsets for _, offsets in chunks],
+            itertools.repeat(serialization_type),
+            itertools.repeat(fingerprint),
+        ):
+            for row in rows:
+                obj = parse_obj(row)
+                yield obj if create_instance else obj.asdict()
@@ -0,0 +1,41 @@
+"""
+Compile the models before they are used, for example when a service starts,
+so the first events after a deploy are not slower than the rest.
+"""
+import time
+import typing
+from concurrent import futures
+
+from .schema_generator import AvroModel, precompile_models
+
+
+def warmup(
+    models: typing.Optional[typing.Iterable[typing.Type[AvroModel]]] = None, max_workers: int = 1
+) -> typing.Dict[typing.Type[AvroModel], float]:
+    """
+    Compile the schemas and converters of the models.
+
+    Arguments:
+        models: Iterable of models. If it is not provided, the models with `precompile = True`
+            in their `Meta` class are compiled
+        max_workers: int amount of threads used to compile the models
+
+    Returns:
+        dict with the seconds that took to compile each model
+    """
+    if models is None:
+        models = list(precompile_models)
+
+    def compile_model(model: typing.Type[AvroModel]) -> float:
+        start = time.perf_counter()
+        model.precompile()
+        return time.perf_counter() - start
+
+    models = list(models)
+    if max_workers > 1:
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            timings = list(executor.map(compile_model, models))
+    else:
+        timings = [compile_model(model) for model in models]
+
+    return dict(zip(models, timings))
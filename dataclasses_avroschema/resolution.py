@@ -0,0 +1,151 @@
+"""
+Cache of the schemas used to deserialize events written with a different (writer) schema.
+"""
+import collections
+import copy
+import hashlib
+import json
+import threading
+import typing
+
+import fastavro
+
+from .types import JsonDict
+
+WRITER_SCHEMA_CACHE_SIZE = 128
+
+
+class CacheInfo(typing.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ResolvedSchemas(typing.NamedTuple):
+    writer_schema: JsonDict
+    reader_schema: JsonDict
+
+
+class LRUCache:
+    """
+    Thread safe cache that keeps the `maxsize` most recently used values,
+    with hit and miss counters like `functools.lru_cache`.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: typing.OrderedDict[typing.Any, typing.Any] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: typing.Any, factory: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        Return the value stored under `key`. If it does not exist, it is created with `factory`
+        and the least recently used value is removed when the cache is full.
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return value
+
+        # the factory is called without the lock, so it can use the cache as well
+        value = factory()
+
+        with self._lock:
+            value = self._data.setdefault(key, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return value
+
+    def set(self, key: typing.Any, value: typing.Any) -> None:
+        """
+        Store `value` under `key`, replacing the previous value
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(hits=self.hits, misses=self.misses, maxsize=self.maxsize, currsize=len(self._data))
+
+    def remove(self, predicate: typing.Callable[[typing.Any], bool]) -> int:
+        """
+        Remove the values whose key matches `predicate`, keeping the counters.
+
+        Returns the number of values removed.
+        """
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+
+        return len(keys)
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# writer and reader schemas resolved, keyed by (writer schema fingerprint, reader class)
+writer_schema_cache = LRUCache(maxsize=WRITER_SCHEMA_CACHE_SIZE)
+
+# fingerprints of the python dicts used as writer schemas, keyed by the dict id.
+# The dict and a copy of it are stored together with the fingerprint, to check that the cached
+# fingerprint belongs to the same dict and that it was not modified
+dict_fingerprints = LRUCache(maxsize=WRITER_SCHEMA_CACHE_SIZE)
+
+
+def schema_fingerprint(schema: JsonDict) -> str:
+    """
+    Return a fingerprint of the whole schema, including defaults, docs and logical types,
+    which are not part of the avro Parsing Canonical Form but are relevant to deserialize events.
+    """
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def dict_fingerprint(schema: JsonDict) -> str:
+    """
+    Return the fingerprint of a writer schema python dict. The fingerprint is cached for each dict
+    object and it is used while the dict is equal to the one that was fingerprinted, which is much
+    cheaper than serializing it again. If the dict was modified the fingerprint is calculated again.
+    """
+
+    def create() -> typing.Tuple[JsonDict, JsonDict, str]:
+        return schema, copy.deepcopy(schema), schema_fingerprint(schema)
+
+    key = id(schema)
+    stored_schema, snapshot, fingerprint = dict_fingerprints.get(key, create)
+
+    if stored_schema is not schema or snapshot != schema:
+        # the dict was modified, or it is another dict with the same id
+        value = create()
+        dict_fingerprints.set(key, value)
+        fingerprint = value[2]
+    return fingerprint
+
+
+def resolve(writer_schema: JsonDict, reader_schema: JsonDict) -> ResolvedSchemas:
+    """
+    Return the writer and reader schemas parsed by fastavro.
+
+    When both schemas are equal the reader schema is used for both of them,
+    then fastavro does not resolve one against the other when reading.
+    """
+    if "__fastavro_parsed" not in writer_schema:
+        writer_schema = fastavro.parse_schema(writer_schema)  # type: ignore
+
+    if writer_schema == reader_schema:
+        return ResolvedSchemas(reader_schema, reader_schema)
+    return ResolvedSchemas(writer_schema, reader_schema)
@@ -8,6 +8,21 @@ from dataclasses_avroschema import utils
 from dataclasses_avroschema.fields import AvroField, FieldType
 
 
+@dataclasses.dataclass
+class SchemaGenerationContext:
+    """
+    State shared by all the records of a schema while it is generated.
+
+    A new context is created for each root model, so generating a schema does not modify
+    the model classes and many schemas can be generated at the same time.
+    """
+
+    # metadata of the root model
+    metadata: utils.SchemaMetadata
+    # named types (records and enums) already defined in the schema
+    user_defined_types: utils.UserDefinedTypes = dataclasses.field(default_factory=utils.UserDefinedTypes)
+
+
 @dataclasses.dataclass  # type: ignore
 class BaseSchemaDefinition(abc.ABC):
     """
@@ -35,7 +50,7 @@ class BaseSchemaDefinition(abc.ABC):
         ...  # pragma: no cover
 
     def get_schema_name(self) -> str:
-        return self.klass.metadata.schema_name or self.klass.__name__
+        return self.metadata.schema_name or self.klass.__name__
 
     def generate_documentation(self) -> typing.Optional[str]:
         if isinstance(self.metadata.schema_doc, str):
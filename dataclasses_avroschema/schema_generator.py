@@ -1,24 +1,41 @@
+import copy
 import dataclasses
 import enum
+import functools
 import inspect
 import json
+import threading
+import weakref
 from collections import OrderedDict
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, TypeVar, Union
 
+import fastavro
 from dacite import Config, from_dict
-from fastavro.validation import validate
+from fastavro.validation import ValidationError
 
-from . import case, fields, serialization
-from .schema_definition import AvroSchemaDefinition
-from .types import JsonDict
+from . import case, codegen, columns, disk_cache, fields, resolution, serialization, validation
+from .schema_definition import AvroSchemaDefinition, SchemaGenerationContext
+from .types import Buffer, JsonDict
 from .utils import SchemaMetadata, standardize_custom_type
 
 AVRO = "avro"
 AVRO_JSON = "avro-json"
+AVRO_SINGLE_OBJECT = "avro-single-object"
+CRC_64_AVRO = "CRC-64-AVRO"
+# Approximate size in bytes of the blocks written in object container files
+CONTAINER_SYNC_INTERVAL = 16000
 
 
 CT = TypeVar("CT", bound="AvroModel")
 
+# Lock used to create the cache of each class and to apply `dataclasses.dataclass`, which modifies the class.
+# The cached values are created without it (see `AvroModel._from_cache`): when many threads create the same
+# value at the same time it can be built more than once, and the first one stored is used by all of them
+_cache_lock = threading.Lock()
+
+# models with `precompile = True` in their Meta class, compiled by `warmup` when no models are provided
+precompile_models: "weakref.WeakSet[Type[AvroModel]]" = weakref.WeakSet()
+
 
 class AvroModel:
     schema_def: Optional[AvroSchemaDefinition] = None
@@ -28,6 +45,12 @@ class AvroModel:
     parent: Any = None
     rendered_schema: OrderedDict = dataclasses.field(default_factory=OrderedDict)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if SchemaMetadata.create(getattr(cls, "Meta", type)).precompile:
+            precompile_models.add(cls)
+
     @classmethod
     def generate_dataclass(cls: Type[CT]) -> Type[CT]:
         if dataclasses.is_dataclass(cls):
@@ -40,74 +63,270 @@ class AvroModel:
 
         return SchemaMetadata.create(meta)
 
+    @classmethod
+    def _model_metadata(cls: Type[CT]) -> SchemaMetadata:
+        """
+        Return the metadata of the class, created only once.
+        `klass` and `metadata` are also set as class attributes.
+        """
+
+        def create_metadata() -> SchemaMetadata:
+            with _cache_lock:
+                # `dataclasses.dataclass` modifies the class, it must not be applied by many threads
+                cls.klass = cls.generate_dataclass()
+            return cls.generate_metadata()
+
+        metadata = cls._from_cache("metadata", create_metadata)
+        if cls.__dict__.get("metadata") is not metadata:
+            cls.metadata = metadata
+        return metadata
+
     @classmethod
     def generate_schema(cls: Type[CT], schema_type: str = "avro") -> Optional[OrderedDict]:
-        if cls.schema_def is None or cls.__mro__[1] != AvroModel:
-            # Generate dataclass and metadata
-            cls.klass = cls.generate_dataclass()
-
-            # let's live open the possibility to define different
-            # schema definitions like json
-            if schema_type == "avro":
-                # cache the schema
-                cls.schema_def = cls._generate_avro_schema()
-                cls.rendered_schema = cls.schema_def.render()
-            else:
-                raise ValueError("Invalid type. Expected avro schema type.")
+        # let's live open the possibility to define different
+        # schema definitions like json
+        if schema_type != "avro":
+            raise ValueError("Invalid type. Expected avro schema type.")
+
+        # a copy, so the caller can not modify the cached schema
+        return copy.deepcopy(cls._rendered_schema())
+
+    @classmethod
+    def _rendered_schema(cls: Type[CT]) -> OrderedDict:
+        """
+        Return the rendered schema stored in the class cache. It must be treated as read only.
+        """
+        return cls._from_cache("rendered_schema", cls._render_schema)
+
+    @classmethod
+    def _render_schema(cls: Type[CT]) -> OrderedDict:
+        """
+        Return the schema of the class when it is the root of the tree. If the disk cache is enabled,
+        the stored schema is used when the model did not change.
+        """
+        schema_cache = disk_cache.cache
+        if schema_cache is not None:
+            rendered_schema = schema_cache.get_schema(cls)
+            if rendered_schema is not None:
+                return rendered_schema
+
+        _, rendered_schema = cls._root_schema_definition()
+
+        if schema_cache is not None:
+            schema_cache.set_schema(cls, rendered_schema)
+        return rendered_schema
+
+    @classmethod
+    def _root_schema_definition(cls: Type[CT]) -> Tuple[AvroSchemaDefinition, OrderedDict]:
+        """
+        Return the schema definition of the class when it is the root of the tree, and the rendered schema.
+
+        They are generated only once with a new `SchemaGenerationContext` and then taken from the class cache,
+        so the result does not depend on other schemas that use the class as a nested record.
+        """
+
+        def generate() -> Tuple[AvroSchemaDefinition, OrderedDict]:
+            schema_def = cls._generate_avro_schema()
+            return schema_def, schema_def.render()
+
+        schema_def, rendered_schema = cls._from_cache("schema_definition", generate)
 
-        return cls.rendered_schema
+        # kept as class attributes for backwards compatibility, they are always the cached objects
+        if cls.__dict__.get("schema_def") is not schema_def:
+            cls.schema_def = schema_def
+            cls.rendered_schema = rendered_schema
+        return schema_def, rendered_schema
 
     @classmethod
-    def _generate_avro_schema(cls: Type[CT]) -> AvroSchemaDefinition:
-        metadata = cls.generate_metadata()
-        cls.metadata = metadata
-        return AvroSchemaDefinition("record", cls.klass, metadata=metadata, parent=cls.parent or cls)
+    def _generate_avro_schema(cls: Type[CT], context: Optional[Any] = None) -> AvroSchemaDefinition:
+        """
+        Return a new schema definition of the class. When it is a nested record, `context`
+        is the generation context of the root, otherwise a new one is created.
+        """
+        metadata = cls._model_metadata()
+
+        if context is None:
+            context = SchemaGenerationContext(metadata=metadata)
+        return AvroSchemaDefinition("record", cls.klass, metadata=metadata, parent=context)
 
     @classmethod
     def avro_schema(cls: Type[CT], case_type: Optional[str] = None) -> str:
-        return json.dumps(cls.avro_schema_to_python(case_type=case_type))
+        return json.dumps(cls._compiled_schema(case_type=case_type))
 
     @classmethod
     def avro_schema_to_python(
-        cls: Type[CT], parent: Optional["AvroModel"] = None, case_type: Optional[str] = None
+        cls: Type[CT], parent: Optional[Any] = None, case_type: Optional[str] = None
     ) -> Dict[str, Any]:
-        if parent is not None:
-            # in this case the current class is a child with a parent
-            # we recalculate the schema definition to prevent re usages
-            cls.parent = parent
-            cls.schema_def = None
-        else:
-            # This happens when an AvroModel is the root of the tree (first class in the hierarchy)
-            # Because intermediate schemas can be reused as a root later, we need to reset them
-            # Example with A as a root:
-            #     A -> B -> C -> D
-            #
-            # After generating the A.avro_schema the parent of B is A,
-            # if we want to do B.avro_schema (now B is the root)
-            # B should clean the data that was only valid when it was the child
-            cls._reset_schema_definition()
-
-        avro_schema = cls.generate_schema(schema_type=AVRO)
+        if parent is None:
+            # This happens when an AvroModel is the root of the tree (first class in the hierarchy).
+            # The root schema is compiled only once and then it is taken from the class cache.
+            # A copy is returned so the end user can not modify the cached schema
+            return json.loads(json.dumps(cls._compiled_schema(case_type=case_type)))
+
+        # In this case the current class is a nested record and `parent` is the generation context
+        # of the root. A new schema definition is rendered and the class is not modified,
+        # so the same class can be the root or a child of other schemas at the same time
+        avro_schema: Dict[str, Any] = cls._generate_avro_schema(context=parent).render()
 
         if case_type is not None:
-            avro_schema = case.case_record(cls.rendered_schema, case_type)  # type: ignore
+            avro_schema = case.case_record(avro_schema, case_type)
 
         return json.loads(json.dumps(avro_schema))
 
     @classmethod
-    def get_fields(cls: Type[CT]) -> List[fields.FieldType]:
-        if cls.schema_def is None:
-            cls.generate_schema()
-        return cls.schema_def.fields  # type: ignore
+    def parsing_canonical_form(cls: Type[CT]) -> str:
+        """
+        Return the avro Parsing Canonical Form of the schema, which is the same for all the schemas
+        that are equivalent for parsing, no matter the docs, aliases, defaults or order of attributes.
+
+        It is calculated only once and then taken from the class cache.
+        """
+        return cls._from_cache(
+            "parsing_canonical_form", lambda: fastavro.schema.to_parsing_canonical_form(cls._compiled_schema())
+        )
 
     @classmethod
-    def _reset_schema_definition(cls: Type[CT]) -> None:
+    def fingerprint(cls: Type[CT], algorithm: str = CRC_64_AVRO) -> str:
         """
-        Reset all the values to original state.
+        Return the fingerprint, as an hexadecimal string, of the schema Parsing Canonical Form.
+
+        It is calculated only once per algorithm and then taken from the class cache.
+
+        Attributes:
+            algorithm: str `CRC-64-AVRO` (Rabin fingerprint), `MD5`, `SHA-256`
+                or any other algorithm supported by `hashlib`
+
+        Returns:
+            str the fingerprint
         """
-        cls.user_defined_types = set()
-        cls.schema_def = None
-        cls.parent = None
+        return cls._from_cache(
+            ("fingerprint", algorithm),
+            lambda: fastavro.schema.fingerprint(cls.parsing_canonical_form(), algorithm),
+        )
+
+    @classmethod
+    def precompile(cls: Type[CT]) -> None:
+        """
+        Compile everything needed to serialize, deserialize and validate instances: the avro schema,
+        the schema parsed by fastavro and the converters from and to python dicts.
+        Then the first event does not pay the cost.
+        """
+        cls._parsed_schema()
+        cls._schema_fingerprint()
+        cls._dict_converter()
+        cls._object_parser()
+        cls._compiled_validator()
+
+    @classmethod
+    def _get_cache(cls: Type[CT]) -> Dict[Any, Any]:
+        """
+        Return the cache that belongs to the class.
+
+        The cache is looked up in the class `__dict__` so subclasses never
+        share it with their parents.
+        """
+        cache = cls.__dict__.get("_avro_cache")
+        if cache is None:
+            with _cache_lock:
+                cache = cls.__dict__.get("_avro_cache")
+                if cache is None:
+                    cache = {}
+                    setattr(cls, "_avro_cache", cache)
+        return cache
+
+    @classmethod
+    def _from_cache(cls: Type[CT], key: Any, factory: Callable[[], Any]) -> Any:
+        """
+        Return the value stored in the class cache under `key`.
+        If it does not exist, it is created with `factory` and stored.
+
+        Values are created without holding any lock, so many models can be compiled at the same time,
+        and they are published only when they are complete. If two threads create the same value
+        at the same time, both of them return the one that was published first.
+        """
+        cache = cls._get_cache()
+
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        return cache.setdefault(key, factory())
+
+    @classmethod
+    def _compiled_schema(cls: Type[CT], case_type: Optional[str] = None) -> JsonDict:
+        """
+        Return the avro schema (python dict) of the class when it is the root of the tree.
+
+        The schema is generated the first time and then it is returned from the class cache,
+        so it must be treated as read only. Use `clear_cache` to force the generation again.
+        """
+
+        def compile_schema() -> JsonDict:
+            # `case_record` modifies the schema, so it is applied to a copy of the cached one
+            avro_schema = json.loads(json.dumps(cls._rendered_schema()))
+
+            if case_type is not None:
+                avro_schema = case.case_record(avro_schema, case_type)
+
+            return avro_schema
+
+        return cls._from_cache(("schema", case_type), compile_schema)
+
+    @classmethod
+    def _parsed_schema(cls: Type[CT]) -> JsonDict:
+        """
+        Return the avro schema parsed by fastavro, so it is not parsed again
+        on each serialization, deserialization or validation.
+        """
+        return cls._from_cache("parsed_schema", lambda: fastavro.parse_schema(cls._compiled_schema()))
+
+    @classmethod
+    def _schema_fingerprint(cls: Type[CT]) -> str:
+        """
+        Return the fingerprint of the class schema used to look up the resolved writer schemas.
+        """
+        return cls._from_cache("schema_fingerprint", lambda: resolution.schema_fingerprint(cls._compiled_schema()))
+
+    @classmethod
+    def _resolve_schemas(
+        cls: Type[CT], writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = None
+    ) -> resolution.ResolvedSchemas:
+        """
+        Return the parsed writer and reader schemas to deserialize events written with `writer_schema`.
+
+        They are stored in a LRU cache keyed by the writer schema fingerprint and the class,
+        so each writer schema version is parsed and compared with the class schema only once.
+        """
+        reader_schema = cls._parsed_schema()
+
+        if writer_schema is None:
+            return resolution.ResolvedSchemas(reader_schema, reader_schema)
+        elif inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            writer_model = writer_schema
+            return resolution.writer_schema_cache.get(
+                (writer_model._schema_fingerprint(), cls),
+                lambda: resolution.resolve(writer_model._parsed_schema(), reader_schema),
+            )
+
+        schema: JsonDict = writer_schema  # type: ignore
+        return resolution.writer_schema_cache.get(
+            (resolution.dict_fingerprint(schema), cls), lambda: resolution.resolve(schema, reader_schema)
+        )
+
+    @classmethod
+    def clear_cache(cls: Type[CT]) -> None:
+        """
+        Remove everything that was compiled and cached for the class, for example the avro schema
+        and the writer schemas resolved against it. The next usage will compile it again.
+        """
+        cls._get_cache().clear()
+        resolution.writer_schema_cache.remove(lambda key: key[1] is cls)
+
+    @classmethod
+    def get_fields(cls: Type[CT]) -> List[fields.FieldType]:
+        schema_def, _ = cls._root_schema_definition()
+        return schema_def.fields
 
     def asdict(self, standardize_factory: Optional[Callable[..., Any]] = None) -> JsonDict:
         if standardize_factory is not None:
@@ -115,29 +334,144 @@ class AvroModel:
         return dataclasses.asdict(self)  # type: ignore
 
     def serialize(self, serialization_type: str = AVRO) -> bytes:
-        schema = self.avro_schema_to_python()
+        schema = self._parsed_schema()
 
         return serialization.serialize(
-            self.asdict(standardize_factory=standardize_custom_type),
+            self._dict_converter()(self),
             schema,
             serialization_type=serialization_type,
+            fingerprint=self._single_object_fingerprint(serialization_type),
+        )
+
+    def serialize_into(
+        self, buffer: Union[IO[bytes], bytearray, memoryview], serialization_type: str = AVRO, offset: int = 0
+    ) -> int:
+        """
+        Serialize the instance directly into `buffer`, which can be a writable file-like object
+        or a pre-allocated `bytearray` or `memoryview`. In the last case the event is written
+        in place starting at `offset`, and `BufferTooSmall` is raised if it does not fit.
+
+        Returns the offset where the event ends in the buffer, or the number of bytes written
+        to the file-like object.
+        """
+        return serialization.serialize_into(
+            self._dict_converter()(self),
+            self._parsed_schema(),
+            buffer,
+            serialization_type=serialization_type,
+            fingerprint=self._single_object_fingerprint(serialization_type),
+            offset=offset,
+        )
+
+    @classmethod
+    def _single_object_fingerprint(
+        cls: Type[CT], serialization_type: str, writer_schema: Optional[Union[JsonDict, Type["AvroModel"]]] = None
+    ) -> Optional[str]:
+        """
+        Return the fingerprint of the schema used to write `avro-single-object` events.
+        For other serialization types, or when the writer schema is a python dict, None is returned.
+        """
+        if serialization_type != AVRO_SINGLE_OBJECT:
+            return None
+        elif writer_schema is None:
+            return cls.fingerprint()
+        elif inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
+            return writer_schema.fingerprint()
+        return None
+
+    @classmethod
+    def _dict_converter(cls: Type[CT]) -> Callable[[CT], JsonDict]:
+        """
+        Return a callable that converts instances into the python dicts used to serialize them.
+        For python dataclasses a function generated specifically for the model is used.
+        """
+        if cls.asdict is AvroModel.asdict and codegen.is_compilable_model(cls):
+            return cls._compiled_dict_converter()
+
+        return functools.partial(cls.asdict, standardize_factory=standardize_custom_type)
+
+    @classmethod
+    def _compiled_dict_converter(cls: Type[CT]) -> Callable[[CT], JsonDict]:
+        """
+        Return the function generated for the model that converts instances into python dicts.
+        """
+        return cls._from_cache("compiled_dict_converter", lambda: codegen.compile_dict_converter(cls))
+
+    @classmethod
+    def serialize_many(
+        cls: Type[CT],
+        instances: Iterable[CT],
+        serialization_type: str = AVRO,
+        concatenate: bool = False,
+    ) -> Union[List[bytes], Tuple[bytes, List[int]]]:
+        """
+        Serialize many instances of the model using one output buffer.
+
+        Attributes:
+            instances: Iterable[AvroModel] instances to serialize
+            serialization_type: str `avro`, `avro-json` or `avro-single-object`
+            concatenate: bool if True returns one buffer with all the events and a list of offsets,
+                where the event `n` is `buffer[offsets[n]:offsets[n + 1]]`. Otherwise a list of events
+
+        Returns:
+            List[bytes] or Tuple[bytes, List[int]]
+        """
+        to_dict = cls._dict_converter()
+        payloads = (to_dict(instance) for instance in instances)
+        return cls._serialize_payloads(payloads, serialization_type=serialization_type, concatenate=concatenate)
+
+    @classmethod
+    def serialize_columns(
+        cls: Type[CT],
+        data: Dict[str, Iterable],
+        serialization_type: str = AVRO,
+        concatenate: bool = False,
+    ) -> Union[List[bytes], Tuple[bytes, List[int]]]:
+        """
+        Serialize columnar data, one event for each row, without creating the model instances.
+
+        Attributes:
+            data: Dict[str, Iterable] the values of each field, as lists or NumPy arrays with the same length.
+                Fields with default values can be omitted
+            serialization_type: str `avro`, `avro-json` or `avro-single-object`
+            concatenate: bool the same as in `serialize_many`
+
+        Returns:
+            List[bytes] or Tuple[bytes, List[int]]
+        """
+        payloads = columns.iter_rows(cls, data)
+        return cls._serialize_payloads(payloads, serialization_type=serialization_type, concatenate=concatenate)
+
+    @classmethod
+    def _serialize_payloads(
+        cls: Type[CT], payloads: Iterable[JsonDict], serialization_type: str, concatenate: bool
+    ) -> Union[List[bytes], Tuple[bytes, List[int]]]:
+        value, offsets = serialization.serialize_many(
+            payloads,
+            cls._parsed_schema(),
+            serialization_type=serialization_type,
+            fingerprint=cls._single_object_fingerprint(serialization_type),
         )
 
+        if concatenate:
+            return value, offsets
+        return serialization.split_events(value, offsets, serialization_type=serialization_type)
+
     @classmethod
     def deserialize(
         cls: Type[CT],
-        data: bytes,
+        data: Buffer,
         serialization_type: str = AVRO,
         create_instance: bool = True,
         writer_schema: Optional[Union[JsonDict, Type[CT]]] = None,
     ) -> Union[JsonDict, CT]:
-        if inspect.isclass(writer_schema) and issubclass(writer_schema, AvroModel):
-            # mypy does not undersdtand redefinitions
-            writer_schema: JsonDict = writer_schema.avro_schema_to_python()  # type: ignore
-
-        schema = cls.avro_schema_to_python()
+        schemas = cls._resolve_schemas(writer_schema)
         payload = serialization.deserialize(
-            data, schema, serialization_type=serialization_type, writer_schema=writer_schema  # type: ignore
+            data,
+            schemas.reader_schema,
+            serialization_type=serialization_type,
+            writer_schema=schemas.writer_schema,
+            fingerprint=cls._single_object_fingerprint(serialization_type, writer_schema),
         )
         obj = cls.parse_obj(payload)
 
@@ -145,13 +479,269 @@ class AvroModel:
             return obj.asdict()
         return obj
 
+    @classmethod
+    def deserialize_many(
+        cls: Type[CT],
+        payloads: Iterable[Buffer],
+        serialization_type: str = AVRO,
+        create_instance: bool = True,
+        writer_schema: Optional[Union[JsonDict, Type[CT]]] = None,
+    ) -> Iterator[Union[JsonDict, CT]]:
+        """
+        Deserialize many events. The schemas and the dacite config are resolved
+        only once for the whole batch and the results are yielded lazily.
+
+        Attributes:
+            payloads: Iterable of events to deserialize, any object that supports the buffer protocol
+            serialization_type: str `avro`, `avro-json` or `avro-single-object`
+            create_instance: bool if False python dicts are yielded instead of instances
+            writer_schema: AvroModel or python dict used to serialize the events
+
+        Returns:
+            Iterator of AvroModel instances or python dicts
+        """
+        schemas = cls._resolve_schemas(writer_schema)
+        parse_obj = cls._object_parser()
+
+        for payload in serialization.deserialize_many(
+            payloads,
+            schemas.reader_schema,
+            serialization_type=serialization_type,
+            writer_schema=schemas.writer_schema,
+            fingerprint=cls._single_object_fingerprint(serialization_type, writer_schema),
+        ):
+            obj = parse_obj(payload)
+
+            if not create_instance:
+                yield obj.asdict()
+            else:
+                yield obj
+
+    @classmethod
+    def deserialize_columns(
+        cls: Type[CT],
+        payloads: Iterable[Buffer],
+        serialization_type: str = AVRO,
+        writer_schema: Optional[Union[JsonDict, Type[CT]]] = None,
+        as_numpy: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Deserialize many events into columns, a python dict with the values of each field,
+        without creating the model instances.
+
+        Attributes:
+            payloads: Iterable of events to deserialize, any object that supports the buffer protocol
+            serialization_type: str `avro`, `avro-json` or `avro-single-object`
+            writer_schema: AvroModel or python dict used to serialize the events
+            as_numpy: bool if True the numeric, boolean, date and timestamp fields are NumPy arrays
+
+        Returns:
+            Dict[str, Any] with a list or a NumPy array for each field
+        """
+        schemas = cls._resolve_schemas(writer_schema)
+        rows = serialization.deserialize_many(
+            payloads,
+            schemas.reader_schema,
+            serialization_type=serialization_type,
+            writer_schema=schemas.writer_schema,
+            fingerprint=cls._single_object_fingerprint(serialization_type, writer_schema),
+        )
+        return columns.to_columns(cls, rows, as_numpy=as_numpy)
+
+    @classmethod
+    def write_json(cls: Type[CT], fo: IO[str], instances: Iterable[CT]) -> int:
+        """
+        Write the instances to the text stream `fo` as newline delimited avro-json.
+        The instances are consumed lazily and written in chunks of up to `JSON_CHUNK_SIZE` instances.
+
+        Attributes:
+            fo: IO[str] writable text stream
+            instances: Iterable of instances to write
+
+        Returns:
+            int the number of instances written
+        """
+        dict_converter = cls._dict_converter()
+
+        return serialization.write_json(fo, (dict_converter(instance) for instance in instances), cls._parsed_schema())
+
+    @classmethod
+    def iter_json(cls: Type[CT], fo: IO, create_instance: bool = True) -> Iterator[Union[JsonDict, CT]]:
+        """
+        Read newline delimited avro-json records lazily, in chunks of up to `JSON_CHUNK_SIZE` lines,
+        so the memory used does not depend on the size of the stream.
+
+        Attributes:
+            fo: IO text or binary readable stream
+            create_instance: bool if False python dicts are yielded instead of instances
+        """
+        parse_obj = cls._object_parser()
+
+        for record in serialization.iter_json(fo, cls._parsed_schema()):
+            obj = parse_obj(record)
+
+            if not create_instance:
+                yield obj.asdict()
+            else:
+                yield obj
+
+    @classmethod
+    def write_container(
+        cls: Type[CT],
+        fo: IO[bytes],
+        instances: Iterable[CT],
+        codec: str = "null",
+        sync_interval: int = CONTAINER_SYNC_INTERVAL,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Write the instances to `fo` as an avro object container file.
+        The instances are consumed lazily, so any iterable can be used.
+
+        Attributes:
+            fo: IO[bytes] writable file-like object
+            instances: Iterable of instances to write
+            codec: str compression codec, for example `null`, `deflate`, `bzip2` or `snappy`
+                (the last one only when its library is installed)
+            sync_interval: int approximate size in bytes of each block
+            metadata: Dict[str, str] extra metadata included in the file header
+
+        Returns:
+            int the number of instances written
+        """
+        dict_converter = cls._dict_converter()
+
+        return serialization.write_container(
+            fo,
+            (dict_converter(instance) for instance in instances),
+            cls._parsed_schema(),
+            codec=codec,
+            sync_interval=sync_interval,
+            metadata=metadata,
+        )
+
+    @classmethod
+    def read_container(cls: Type[CT], fo: IO[bytes], create_instance: bool = True) -> Iterator[Union[JsonDict, CT]]:
+        """
+        Read the records of an avro object container file lazily. Only one block is kept
+        in memory at a time. The schema used to write the file is resolved to the model schema.
+
+        Attributes:
+            fo: IO[bytes] readable file-like object
+            create_instance: bool if False python dicts are yielded instead of instances
+        """
+        parse_obj = cls._object_parser()
+
+        for record in serialization.read_container(fo, cls._parsed_schema()):
+            obj = parse_obj(record)
+
+            if not create_instance:
+                yield obj.asdict()
+            else:
+                yield obj
+
     @classmethod
     def parse_obj(cls: Type[CT], data: Dict) -> CT:
-        return from_dict(data_class=cls, data=data, config=cls.config())
+        return cls._object_parser()(data)
+
+    @classmethod
+    def _object_parser(cls: Type[CT]) -> Callable[[Dict], CT]:
+        """
+        Return a callable that creates instances from python dicts.
+        It is equivalent to `parse_obj`, the callable is created once per class with the cached dacite config.
+
+        If the model has `compiled_parser = True` in its `Meta` class, a function generated
+        specifically for the model is used instead of `dacite`.
+        """
+        return cls._from_cache("object_parser", cls._create_object_parser)
+
+    @classmethod
+    def _create_object_parser(cls: Type[CT]) -> Callable[[Dict], CT]:
+        if cls.parse_obj.__func__ is not AvroModel.parse_obj.__func__:  # type: ignore
+            # parse_obj was overridden, for example by pydantic
+            return cls.parse_obj
 
-    def validate(self) -> bool:
-        schema = self.avro_schema_to_python()
-        return validate(self.asdict(), schema)
+        metadata = cls._model_metadata()
+
+        if metadata.compiled_parser and metadata.dacite_config is None and codegen.is_compilable_model(cls):
+            return cls._compiled_parser()
+
+        return functools.partial(from_dict, cls, config=cls.config())
+
+    @classmethod
+    def _compiled_parser(cls: Type[CT]) -> Callable[[Dict], CT]:
+        """
+        Return the function generated for the model that creates instances from python dicts.
+        """
+        return cls._from_cache("compiled_parser", lambda: codegen.compile_parser(cls))
+
+    @classmethod
+    def _compiled_validator(cls: Type[CT]) -> Callable[[CT], bool]:
+        """
+        Return the function generated for the model that checks whether an instance matches the schema.
+        """
+        return cls._from_cache("compiled_validator", lambda: codegen.compile_validator(cls))
+
+    @classmethod
+    def _compiled_field_validators(cls: Type[CT]) -> Dict[str, Callable[[Any], bool]]:
+        """
+        Return the functions generated for each field that check whether a value of the field is valid.
+        """
+        return cls._from_cache("compiled_field_validators", lambda: codegen.compile_field_validators(cls))
+
+    @classmethod
+    def validate_many(
+        cls: Type[CT], instances: Iterable[CT], collect_errors: bool = True, processes: Optional[int] = None
+    ) -> "validation.ValidationReport":
+        """
+        Validate many instances at once, field by field
+
+        Arguments:
+            instances: Iterable of instances of the model
+            collect_errors: bool if True all the errors are reported, otherwise the validation stops
+                with the first invalid value
+            processes: Optional[int] number of processes used to validate big batches
+
+        Returns:
+            ValidationReport with the errors found and the indexes of the invalid rows
+        """
+        return validation.validate_many(cls, instances, collect_errors=collect_errors, processes=processes)
+
+    def validate(self, collect_errors: bool = False) -> bool:
+        """
+        Validate that instance matches the avro schema
+
+        Arguments:
+            collect_errors: bool if True all the fields are validated and the `ValidationError`
+                contains all the errors, otherwise it is raised with the first invalid field
+
+        Returns:
+            True if the instance is valid, otherwise `fastavro.validation.ValidationError` is raised
+        """
+        return self._validate_schema(collect_errors=collect_errors)
+
+    def _validate_schema(self, collect_errors: bool = False) -> bool:
+        if self._compiled_validator()(self):
+            return True
+
+        # the instance is not valid, fastavro validates each field to report the errors
+        schema = self._parsed_schema()
+        errors = []
+
+        for field in schema["fields"]:
+            field_errors = codegen.validation_errors(
+                field["type"],
+                schema["__named_schemas"],
+                getattr(self, field["name"]),
+                field=f"{schema['name']}.{field['name']}",
+            )
+            if field_errors and not collect_errors:
+                raise ValidationError(*field_errors)
+            errors.extend(field_errors)
+
+        if errors:
+            raise ValidationError(*errors)
+        return True
 
     def to_dict(self) -> JsonDict:
         # Serialize using the current AVRO schema to get proper field representations
@@ -166,11 +756,16 @@ class AvroModel:
     def config(cls: Type[CT]) -> Config:
         """
         Get the default config for dacite and always include the self reference
+
+        The config is created once per class and then it is returned from the class cache,
+        so it must not be modified. Use `clear_cache` to create it again.
         """
-        # We need to make sure that the `avro schemas` has been generated, otherwise cls.klass is empty
-        # It won't affect the performance because the rendered schema will be store in cls.rendered_schema
-        cls.generate_schema()
-        dacite_user_config = cls.metadata.dacite_config  # type: ignore
+        return cls._from_cache("dacite_config", cls._create_config)
+
+    @classmethod
+    def _create_config(cls: Type[CT]) -> Config:
+        # We need to make sure that the metadata has been generated, otherwise cls.klass is empty
+        dacite_user_config = cls._model_metadata().dacite_config
 
         dacite_config = {
             "check_types": False,
@@ -183,12 +778,11 @@ class AvroModel:
         if dacite_user_config is not None:
             dacite_config.update(dacite_user_config)
 
-        config = Config(**dacite_config)  # type: ignore
+        # we always need to have this values regardless the user config.
+        # A new tuple is created so the user config is not modified and the cast can not grow
+        dacite_config["cast"] = tuple(dacite_config["cast"]) + (Tuple, tuple, enum.Enum)  # type: ignore
 
-        # we always need to have this values regardless
-        # the user config
-        config.cast.extend([Tuple, tuple, enum.Enum])  # type: ignore
-        return config
+        return Config(**dacite_config)  # type: ignore
 
     @classmethod
     def fake(cls: Type[CT], **data: Dict[str, Any]) -> CT:
@@ -0,0 +1,170 @@
+import typing
+
+import fastavro
+
+from . import confluent, resolution, serialization
+from .exceptions import UnknownSchemaFingerprint
+from .schema_generator import AVRO, AvroModel
+from .types import Buffer, JsonDict
+
+MT = typing.TypeVar("MT", bound=typing.Type[AvroModel])
+
+
+class SchemaStore:
+    """
+    Registry of models indexed by their CRC-64-AVRO schema fingerprint, used to decode
+    `avro-single-object` events without knowing beforehand which model wrote them.
+
+    Example:
+        store = SchemaStore([User, Address])
+        store.decode(User(name="john").serialize(serialization_type="avro-single-object"))
+    """
+
+    def __init__(self, models: typing.Iterable[typing.Type[AvroModel]] = ()) -> None:
+        self.models: typing.Dict[str, typing.Type[AvroModel]] = {}
+
+        for model in models:
+            self.register(model)
+
+    def register(self, model: MT) -> MT:
+        """
+        Add the model to the store. It returns the model, so it can be used as a class decorator.
+        If there is a model with the same fingerprint, it is replaced.
+        """
+        # compile everything needed to decode now, so decoding the first event is not slower
+        model.precompile()
+        self.models[model.fingerprint()] = model
+
+        return model
+
+    def get_model(self, fingerprint: str) -> typing.Type[AvroModel]:
+        """
+        Return the model with the CRC-64-AVRO `fingerprint`
+        """
+        try:
+            return self.models[fingerprint]
+        except KeyError:
+            raise UnknownSchemaFingerprint(fingerprint) from None
+
+    def decode(self, data: Buffer, create_instance: bool = True) -> typing.Union[JsonDict, AvroModel]:
+        """
+        Deserialize an `avro-single-object` event with the model that wrote it.
+
+        Arguments:
+            data: Buffer event encoded with `avro-single-object`
+            create_instance: bool if False a python dict is returned instead of an instance
+
+        Returns:
+            AvroModel instance or python dict
+        """
+        fingerprint, payload = serialization.read_single_object_header(data)
+
+        return self.get_model(fingerprint).deserialize(
+            payload, serialization_type=AVRO, create_instance=create_instance
+        )
+
+    def __contains__(self, model: typing.Type[AvroModel]) -> bool:
+        return self.models.get(model.fingerprint()) is model
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+
+def schema_full_name(schema: JsonDict) -> str:
+    name = schema["name"]
+    namespace = schema.get("namespace")
+
+    if namespace and "." not in name:
+        return f"{namespace}.{name}"
+    return name
+
+
+class ModelRegistry(SchemaStore):
+    """
+    Decode events of many models, for example from topics that contain several record types,
+    routing each event to its model with an index instead of trying to deserialize it with every model.
+
+    Events can be encoded with `avro-single-object`, where the model is found by the schema fingerprint,
+    or with the Confluent wire format if a `resolver` is provided. In the last case the schema of each id
+    is requested only once and the model is found by its fingerprint or, for previous versions of the
+    schema, by its full name.
+
+    Example:
+        registry = ModelRegistry([User, Address], resolver=InMemorySchemaResolver())
+
+        for event in registry.decode_many(events):
+            ...
+    """
+
+    def __init__(
+        self,
+        models: typing.Iterable[typing.Type[AvroModel]] = (),
+        resolver: typing.Optional[confluent.SchemaResolver] = None,
+        cache_size: int = confluent.SCHEMA_CACHE_SIZE,
+    ) -> None:
+        self.names: typing.Dict[str, typing.Type[AvroModel]] = {}
+        self.resolver = resolver
+        # model and parsed writer schema by schema id
+        self.schema_ids = resolution.LRUCache(maxsize=cache_size)
+        super().__init__(models)
+
+    def register(self, model: MT) -> MT:
+        super().register(model)
+        self.names[schema_full_name(model._compiled_schema())] = model
+
+        # the models found for the schema ids could be different now
+        self.schema_ids.cache_clear()
+
+        return model
+
+    def get_model_by_schema_id(self, schema_id: int) -> typing.Tuple[typing.Type[AvroModel], JsonDict]:
+        """
+        Return the model of the schema with `schema_id` and the schema parsed by fastavro
+        """
+        if self.resolver is None:
+            raise ValueError("A resolver is needed to decode events with the Confluent wire format")
+        resolver = self.resolver
+
+        def find_model() -> typing.Tuple[typing.Type[AvroModel], JsonDict]:
+            schema = resolver.get_schema(schema_id)
+            fingerprint = fastavro.schema.fingerprint(fastavro.schema.to_parsing_canonical_form(schema), "CRC-64-AVRO")
+            model = self.models.get(fingerprint) or self.names.get(schema_full_name(schema))
+
+            if model is None:
+                raise UnknownSchemaFingerprint(fingerprint)
+            return model, fastavro.parse_schema(schema)  # type: ignore
+
+        return self.schema_ids.get(schema_id, find_model)
+
+    def decode(self, data: Buffer, create_instance: bool = True) -> typing.Union[JsonDict, AvroModel]:
+        """
+        Deserialize an event encoded with `avro-single-object` or with the Confluent wire format
+        with the model that wrote it.
+
+        Arguments:
+            data: Buffer event
+            create_instance: bool if False a python dict is returned instead of an instance
+
+        Returns:
+            AvroModel instance or python dict
+        """
+        if data[:1] == serialization.SINGLE_OBJECT_MARKER[:1] or self.resolver is None:
+            return super().decode(data, create_instance=create_instance)
+
+        schema_id, payload = confluent.read_header(data)
+        model, writer_schema = self.get_model_by_schema_id(schema_id)
+
+        return model.deserialize(
+            payload, serialization_type=AVRO, create_instance=create_instance, writer_schema=writer_schema
+        )
+
+    def decode_many(
+        self, payloads: typing.Iterable[Buffer], create_instance: bool = True
+    ) -> typing.Iterator[typing.Union[JsonDict, AvroModel]]:
+        """
+        Deserialize the events lazily, each one with the model that wrote it.
+        """
+        decode = self.decode
+
+        for data in payloads:
+            yield decode(data, create_instance=create_instance)
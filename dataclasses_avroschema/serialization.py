@@ -2,67 +2,395 @@ import datetime
 import decimal
 import enum
 import io
+import itertools
+import mmap
 import typing
 import uuid
 
 import fastavro
 
-from .schema_generator import AvroModel
-from .types import JsonDict
+from .exceptions import BufferTooSmall, InvalidSingleObjectEncoding, UnknownSchemaFingerprint
+from .schema_generator import CONTAINER_SYNC_INTERVAL, AvroModel
+from .types import Buffer, JsonDict
 
 DATETIME_STR_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
 DATE_STR_FORMAT = "%Y-%m-%d"
 TIME_STR_FORMAT = "%H:%M:%S"
 
+# newline delimited avro-json records are read and written with one `fastavro` call for each chunk of records.
+# The first chunk has one record and the next ones double their size until `JSON_CHUNK_SIZE`
+JSON_CHUNK_SIZE = 1000
+
+# Avro single object encoding: marker followed by the CRC-64-AVRO schema fingerprint (little endian)
+SINGLE_OBJECT_MARKER = b"\xc3\x01"
+SINGLE_OBJECT_HEADER_SIZE = 10
+
+SERIALIZATION_TYPES = ("avro", "avro-json", "avro-single-object")
+SERIALIZATION_TYPES_NAMES = "`avro`, `avro-json` or `avro-single-object`"
+
 decimal_context = decimal.Context()
 
 
-def serialize(payload: typing.Dict, schema: typing.Dict, serialization_type: str = "avro") -> bytes:
+def get_input_stream(data: Buffer) -> io.BytesIO:
+    """
+    Return a file-like object to read data, which can be any object that supports
+    the buffer protocol, for example `bytes`, `bytearray`, `memoryview` or `mmap.mmap`.
+
+    `mmap.mmap` objects are read in place by `read_mmap`. Other objects than `bytes` are copied
+    once into the `io.BytesIO`, because `fastavro` reads each value with a call to `read`,
+    which is much faster in C than in a python file-like object.
+    """
+    if isinstance(data, bytes):
+        # io.BytesIO shares the memory with bytes objects
+        return io.BytesIO(data)
+    return io.BytesIO(memoryview(data).cast("B"))
+
+
+def read_mmap(data: mmap.mmap, schema: typing.Dict, writer_schema: typing.Dict, start: int = 0) -> typing.Dict:
+    """
+    Read an avro event that starts at `start` directly from the memory map, without copying it.
+    `mmap.mmap` is a file-like object implemented in C, so its position is restored after reading.
+    """
+    position = data.tell()
+    data.seek(start)
+
+    try:
+        return fastavro.schemaless_reader(data, writer_schema=writer_schema, reader_schema=schema)  # type: ignore
+    finally:
+        data.seek(position)
+
+
+class BufferWriter:
+    """
+    File-like object that writes to a file-like object, or in place into a writable buffer
+    (`bytearray` or `memoryview`) starting at `offset`, keeping the number of bytes written.
+    """
+
+    __slots__ = ("buffer", "offset", "bytes_written")
+
+    def __init__(self, buffer: typing.Union[typing.IO[bytes], bytearray, memoryview], offset: int = 0) -> None:
+        if isinstance(buffer, (bytearray, memoryview)):
+            view = memoryview(buffer).cast("B")
+
+            if view.readonly:
+                raise ValueError("The buffer must be writable")
+            if not 0 <= offset <= len(view):
+                raise ValueError(f"The offset {offset} is out of the buffer, which has {len(view)} bytes")
+            self.buffer: typing.Union[typing.IO[bytes], memoryview] = view
+        elif offset:
+            raise ValueError("The offset can only be used with a `bytearray` or a `memoryview`")
+        else:
+            self.buffer = buffer
+
+        self.offset = offset
+        self.bytes_written = 0
+
+    def write(self, data: bytes) -> int:
+        size = len(data)
+
+        if isinstance(self.buffer, memoryview):
+            start = self.offset + self.bytes_written
+            end = start + size
+
+            if end > len(self.buffer):
+                raise BufferTooSmall(len(self.buffer), end)
+            self.buffer[start:end] = data
+        else:
+            self.buffer.write(data)
+        self.bytes_written += size
+
+        return size
+
+    def release(self) -> None:
+        """
+        Release the view of the buffer, so a `bytearray` can be resized again
+        """
+        if isinstance(self.buffer, memoryview):
+            self.buffer.release()
+
+
+def single_object_header(fingerprint: typing.Optional[str]) -> bytes:
+    """
+    Return the header of the single object encoding for the schema with the CRC-64-AVRO `fingerprint`
+    """
+    if fingerprint is None:
+        raise ValueError("The schema fingerprint is required to use `avro-single-object`")
+    return SINGLE_OBJECT_MARKER + bytes.fromhex(fingerprint)
+
+
+def read_single_object_header(data: Buffer) -> typing.Tuple[str, memoryview]:
+    """
+    Return the CRC-64-AVRO schema fingerprint of a single object encoded event and its payload,
+    which is a view of `data` so it is not copied.
+    """
+    view = memoryview(data).cast("B")
+
+    if len(view) < SINGLE_OBJECT_HEADER_SIZE or view[:2] != SINGLE_OBJECT_MARKER:
+        raise InvalidSingleObjectEncoding()
+    return view[2:SINGLE_OBJECT_HEADER_SIZE].hex(), view[SINGLE_OBJECT_HEADER_SIZE:]
+
+
+def serialize(
+    payload: typing.Dict,
+    schema: typing.Dict,
+    serialization_type: str = "avro",
+    fingerprint: typing.Optional[str] = None,
+) -> bytes:
     if serialization_type == "avro":
         file_like_output: typing.Union[io.BytesIO, io.StringIO] = io.BytesIO()
 
         fastavro.schemaless_writer(file_like_output, schema, payload)
 
+        value = file_like_output.getvalue()
+    elif serialization_type == "avro-single-object":
+        file_like_output = io.BytesIO(single_object_header(fingerprint))
+        file_like_output.seek(0, io.SEEK_END)
+
+        fastavro.schemaless_writer(file_like_output, schema, payload)
+
         value = file_like_output.getvalue()
     elif serialization_type == "avro-json":
         file_like_output = io.StringIO()
         fastavro.json_writer(file_like_output, schema, [payload])
         value = file_like_output.getvalue().encode("utf-8")
     else:
-        raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
+        raise ValueError(f"Serialization type should be {SERIALIZATION_TYPES_NAMES}, not {serialization_type}")
 
     file_like_output.flush()
 
     return value  # type: ignore
 
 
+def serialize_into(
+    payload: typing.Dict,
+    schema: typing.Dict,
+    buffer: typing.Union[typing.IO[bytes], bytearray, memoryview],
+    serialization_type: str = "avro",
+    fingerprint: typing.Optional[str] = None,
+    offset: int = 0,
+) -> int:
+    """
+    Write the payload into a writable file-like object, or in place into a pre-allocated
+    `bytearray` or `memoryview` starting at `offset`. The buffer is not resized,
+    `BufferTooSmall` is raised when the event does not fit in it.
+
+    Returns the offset where the event ends in the buffer, or the number of bytes written
+    to the file-like object.
+    """
+    output = BufferWriter(buffer, offset=offset)
+
+    try:
+        if serialization_type == "avro":
+            fastavro.schemaless_writer(output, schema, payload)  # type: ignore
+        elif serialization_type == "avro-single-object":
+            output.write(single_object_header(fingerprint))
+            fastavro.schemaless_writer(output, schema, payload)  # type: ignore
+        elif serialization_type == "avro-json":
+            output.write(serialize(payload, schema, serialization_type=serialization_type))
+        else:
+            raise ValueError(f"Serialization type should be {SERIALIZATION_TYPES_NAMES}, not {serialization_type}")
+    finally:
+        output.release()
+
+    return output.offset + output.bytes_written
+
+
+def serialize_many(
+    payloads: typing.Iterable[typing.Dict],
+    schema: typing.Dict,
+    serialization_type: str = "avro",
+    fingerprint: typing.Optional[str] = None,
+) -> typing.Tuple[bytes, typing.List[int]]:
+    """
+    Serialize all the payloads into one buffer.
+
+    Returns the buffer and the offsets where each payload starts. The last offset is the
+    buffer length, so the payload `n` is `buffer[offsets[n]:offsets[n + 1]]`.
+    With `avro-json` each payload is written in its own line.
+    """
+    file_like_output = io.BytesIO()
+    offsets = [0]
+
+    if serialization_type == "avro":
+        for payload in payloads:
+            fastavro.schemaless_writer(file_like_output, schema, payload)
+            offsets.append(file_like_output.tell())
+    elif serialization_type == "avro-single-object":
+        header = single_object_header(fingerprint)
+
+        for payload in payloads:
+            file_like_output.write(header)
+            fastavro.schemaless_writer(file_like_output, schema, payload)
+            offsets.append(file_like_output.tell())
+    elif serialization_type == "avro-json":
+        json_output = io.StringIO()
+
+        for payload in payloads:
+            json_output.seek(0)
+            json_output.truncate()
+            fastavro.json_writer(json_output, schema, [payload])
+            json_output.write("\n")
+
+            file_like_output.write(json_output.getvalue().encode("utf-8"))
+            offsets.append(file_like_output.tell())
+    else:
+        raise ValueError(f"Serialization type should be {SERIALIZATION_TYPES_NAMES}, not {serialization_type}")
+
+    return file_like_output.getvalue(), offsets
+
+
+def split_events(buffer: bytes, offsets: typing.List[int], serialization_type: str = "avro") -> typing.List[bytes]:
+    """
+    Return each event of a buffer created by `serialize_many`
+    """
+    # with avro-json each event ends with a new line that is not part of the single event
+    separator_size = 1 if serialization_type == "avro-json" else 0
+    return [buffer[start : end - separator_size] for start, end in zip(offsets, offsets[1:])]
+
+
 def deserialize(
-    data: bytes,
+    data: Buffer,
     schema: typing.Dict,
     serialization_type: str = "avro",
     writer_schema: typing.Optional[JsonDict] = None,
+    fingerprint: typing.Optional[str] = None,
 ) -> typing.Dict:
-    if serialization_type == "avro":
-        input_stream: typing.Union[io.BytesIO, io.StringIO] = io.BytesIO(data)
-
+    """
+    Deserialize one event. With `avro-single-object`, if `fingerprint` is provided
+    it must be the fingerprint of the schema used to write the event.
+    """
+    start = 0
+
+    if serialization_type == "avro-single-object":
+        if isinstance(data, mmap.mmap):
+            # only the header is copied, the payload is read in place
+            schema_fingerprint, _ = read_single_object_header(data[:SINGLE_OBJECT_HEADER_SIZE])
+            start = SINGLE_OBJECT_HEADER_SIZE
+        else:
+            schema_fingerprint, data = read_single_object_header(data)
+
+        if fingerprint is not None and schema_fingerprint != fingerprint:
+            raise UnknownSchemaFingerprint(schema_fingerprint)
+        serialization_type = "avro"
+
+    if serialization_type == "avro" and isinstance(data, mmap.mmap):
+        payload = read_mmap(data, schema, writer_schema or schema, start=start)
+    elif serialization_type == "avro":
         payload = fastavro.schemaless_reader(
-            input_stream,
+            get_input_stream(data),  # type: ignore
             writer_schema=writer_schema or schema,
             reader_schema=schema,
         )
-
     elif serialization_type == "avro-json":
-        input_stream = io.StringIO(data.decode())
-        # This is an iterator, but not a container
-        records = fastavro.json_reader(input_stream, schema)
-        # records can have multiple payloads, but in this case we return the first one
-        payload = list(records)[0]
+        # data can have multiple records, but in this case only the first one is decoded
+        for payload in iter_json(io.StringIO(str(data, "utf-8")), schema):
+            break
+        else:
+            raise ValueError("There is not any avro-json record to deserialize")
     else:
-        raise ValueError(f"Serialization type should be `avro` or `avro-json`, not {serialization_type}")
+        raise ValueError(f"Serialization type should be {SERIALIZATION_TYPES_NAMES}, not {serialization_type}")
+
+    return payload  # type: ignore
+
+
+def deserialize_many(
+    payloads: typing.Iterable[Buffer],
+    schema: typing.Dict,
+    serialization_type: str = "avro",
+    writer_schema: typing.Optional[JsonDict] = None,
+    fingerprint: typing.Optional[str] = None,
+) -> typing.Iterator[typing.Dict]:
+    """
+    Deserialize the payloads lazily, one at a time.
+    """
+    if serialization_type not in SERIALIZATION_TYPES:
+        raise ValueError(f"Serialization type should be {SERIALIZATION_TYPES_NAMES}, not {serialization_type}")
+
+    for data in payloads:
+        yield deserialize(
+            data, schema, serialization_type=serialization_type, writer_schema=writer_schema, fingerprint=fingerprint
+        )
+
+
+def iter_chunks(items: typing.Iterable) -> typing.Iterator[typing.List]:
+    """
+    Consume the items lazily in chunks of 1, 2, 4... items, up to `JSON_CHUNK_SIZE` items
+    """
+    items = iter(items)
+    size = 1
+    chunk = list(itertools.islice(items, size))
+
+    while chunk:
+        yield chunk
+        size = min(size * 2, JSON_CHUNK_SIZE)
+        chunk = list(itertools.islice(items, size))
+
+
+def write_json(fo: typing.IO[str], payloads: typing.Iterable[typing.Dict], schema: typing.Dict) -> int:
+    """
+    Write the payloads as newline delimited avro-json. They are consumed lazily and written
+    in chunks (see `iter_chunks`), each chunk with one `fastavro.json_writer` call.
+
+    Returns the number of records written.
+    """
+    count = 0
+
+    for chunk in iter_chunks(payloads):
+        # fastavro writes the records of a chunk separated by new lines
+        fastavro.json_writer(fo, schema, chunk)
+        fo.write("\n")
+        count += len(chunk)
+
+    return count
+
+
+def iter_json(fo: typing.IO, schema: typing.Dict) -> typing.Iterator[typing.Dict]:
+    """
+    Read newline delimited avro-json records lazily, in chunks of lines (see `iter_chunks`),
+    each chunk with one `fastavro.json_reader` call. `fo` can be a text or a binary stream.
+    Empty lines are skipped.
+    """
+    lines = (line.decode("utf-8") if isinstance(line, bytes) else line for line in fo)
+    records = (line if line.endswith("\n") else line + "\n" for line in lines if line.strip())
+
+    for chunk in iter_chunks(records):
+        yield from fastavro.json_reader(io.StringIO("".join(chunk)), schema)  # type: ignore
+
+
+def write_container(
+    fo: typing.IO[bytes],
+    payloads: typing.Iterable[typing.Dict],
+    schema: typing.Dict,
+    codec: str = "null",
+    sync_interval: int = CONTAINER_SYNC_INTERVAL,
+    metadata: typing.Optional[typing.Dict[str, str]] = None,
+) -> int:
+    """
+    Write the payloads as an avro object container file.
+
+    The payloads are consumed lazily and written in compressed blocks of about `sync_interval` bytes.
+    Returns the number of records written.
+    """
+    count = 0
+
+    def counter() -> typing.Iterator[typing.Dict]:
+        nonlocal count
+        for payload in payloads:
+            count += 1
+            yield payload
+
+    fastavro.writer(fo, schema, counter(), codec=codec, sync_interval=sync_interval, metadata=metadata)
+
+    return count
+
 
-    input_stream.flush()
+def read_container(fo: typing.IO[bytes], schema: typing.Dict) -> typing.Iterator[typing.Dict]:
+    """
+    Read the records of an avro object container file lazily, one block at a time.
 
-    return payload
+    The writer schema is taken from the file header and the records are resolved to `schema`.
+    """
+    yield from fastavro.reader(fo, reader_schema=schema)  # type: ignore
 
 
 def datetime_to_str(value: datetime.datetime) -> str:
@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import mmap
 import sys
 import typing
 
@@ -15,6 +16,8 @@ else:
 
 T = typing.TypeVar("T")
 JsonDict = typing.Dict[str, typing.Any]
+# objects that support the buffer protocol and can be deserialized
+Buffer = typing.Union[bytes, bytearray, memoryview, mmap.mmap]
 
 
 class FieldInfo:
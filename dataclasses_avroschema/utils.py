@@ -91,6 +91,8 @@ class SchemaMetadata:
     aliases: typing.Optional[typing.List[str]] = None
     alias_nested_items: typing.Dict[str, str] = dataclasses.field(default_factory=dict)
     dacite_config: typing.Optional[JsonDict] = None
+    compiled_parser: bool = False
+    precompile: bool = False
 
     @classmethod
     def create(cls: typing.Type["SchemaMetadata"], klass: type) -> typing.Any:
@@ -101,6 +103,8 @@ class SchemaMetadata:
             aliases=getattr(klass, "aliases", None),
             alias_nested_items=getattr(klass, "alias_nested_items", {}),
             dacite_config=getattr(klass, "dacite_config", None),
+            compiled_parser=getattr(klass, "compiled_parser", False),
+            precompile=getattr(klass, "precompile", False),
         )
 
     def get_alias_nested_items(self, name: str) -> typing.Optional[str]:
@@ -130,5 +134,39 @@ class UserDefinedType(typing.NamedTuple):
     type: typing.Any
 
 
+class UserDefinedTypes:
+    """
+    Named types (records and enums) defined while a schema is generated.
+    The names are indexed by python type, so finding whether a type was defined
+    does not depend on how many types the schema has.
+    """
+
+    def __init__(self, user_defined_types: typing.Iterable[UserDefinedType] = ()) -> None:
+        self.names: typing.Dict[typing.Any, typing.Set[str]] = {}
+
+        for user_defined_type in user_defined_types:
+            self.add(user_defined_type)
+
+    def add(self, user_defined_type: UserDefinedType) -> None:
+        self.names.setdefault(user_defined_type.type, set()).add(user_defined_type.name)
+
+    def get_names(self, type: typing.Any) -> typing.Set[str]:
+        """
+        Return the names used to define the python `type`
+        """
+        return self.names.get(type, set())
+
+    def __iter__(self) -> typing.Iterator[UserDefinedType]:
+        for type, names in self.names.items():
+            for name in names:
+                yield UserDefinedType(name=name, type=type)
+
+    def __contains__(self, user_defined_type: typing.Any) -> bool:
+        return user_defined_type.name in self.get_names(user_defined_type.type)
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self.names.values())
+
+
 epoch: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
 epoch_naive: datetime = datetime(1970, 1, 1)
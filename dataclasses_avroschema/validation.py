@@ -0,0 +1,251 @@
+"""
+Validation of many instances of a model at once.
+
+The instances are validated column by column. Columns of primitive types, enums and fixed are checked
+at once with builtins that loop in C, like `set(map(type, column))`, `min` and `max`. When that is not
+possible, or the check fails, the values are checked one by one with the function generated for the field,
+and only the invalid values are validated again with `fastavro` to report the errors.
+"""
+import concurrent.futures
+import dataclasses
+import enum
+import functools
+import inspect
+import itertools
+import math
+import operator
+import typing
+
+from fastavro.validation import ValidationError
+from typing_extensions import get_args
+
+from . import codegen, field_utils, schema_generator
+
+# batches smaller than this are not worth sending to other processes
+MIN_ROWS_PER_PROCESS = 10_000
+
+# python types of the values of each avro primitive type that can be checked for a whole column
+COLUMN_TYPES = {
+    "null": frozenset({codegen.NoneType}),
+    "boolean": frozenset({bool}),
+    "string": frozenset({str}),
+    "bytes": frozenset({bytes, bytearray}),
+    "int": frozenset({int}),
+    "long": frozenset({int}),
+    "float": frozenset({int, float}),
+    "double": frozenset({int, float}),
+}
+COLUMN_LIMITS = {
+    "int": (codegen.INT_MIN_VALUE, codegen.INT_MAX_VALUE),
+    "long": (codegen.LONG_MIN_VALUE, codegen.LONG_MAX_VALUE),
+    "float": (-codegen.FLOAT32_MAX_VALUE, codegen.FLOAT32_MAX_VALUE),
+}
+
+ColumnCheck = typing.Callable[[typing.List[typing.Any]], bool]
+
+
+class RowError(typing.NamedTuple):
+    row: int
+    field: str
+    message: str
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    """
+    Result of validating many instances.
+
+    Attributes:
+        total: number of validated instances
+        errors: errors found, sorted by row and in the order of the fields
+    """
+
+    total: int
+    errors: typing.List[RowError] = dataclasses.field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def invalid_rows(self) -> typing.List[int]:
+        return sorted({error.row for error in self.errors})
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def raise_for_errors(self) -> None:
+        """
+        Raise `ValidationError` with all the errors, if any
+        """
+        if self.errors:
+            raise ValidationError(*(f"row {error.row}: {error.message}" for error in self.errors))
+
+
+def field_errors(
+    schema: typing.Dict[str, typing.Any], field: typing.Dict[str, typing.Any], value: typing.Any
+) -> typing.List[str]:
+    path = f"{schema['name']}.{field['name']}"
+
+    try:
+        errors = codegen.validation_errors(field["type"], schema["__named_schemas"], value, field=path)
+    except (ValueError, TypeError, OverflowError) as error:
+        # fastavro raises them for values that can not be prepared, like decimals with a bigger precision
+        return [f"{path} is <{value}> of type {type(value)}: {error}"]
+    return [str(error) for error in errors]
+
+
+def column_check(a_type: typing.Any, schema: typing.Any) -> typing.Optional[ColumnCheck]:
+    """
+    Return a function that returns True when all the values of a column of the python type `a_type`
+    match the avro `schema`, or None when the values can only be checked one by one.
+
+    False does not mean that the column has invalid values, for example values of subclasses or
+    infinite floats are not accepted, then the values have to be checked one by one.
+    """
+    if isinstance(schema, list):
+        args = [arg for arg in get_args(a_type) if arg is not codegen.NoneType] if codegen.is_union_type(a_type) else []
+
+        if len(schema) != 2 or "null" not in schema or len(args) != 1:
+            return None
+
+        # typing.Optional, the values that are not None are checked
+        check_not_null = column_check(args[0], schema[1] if schema[0] == "null" else schema[0])
+        if check_not_null is None:
+            return None
+
+        is_not_none = functools.partial(operator.is_not, None)
+        return lambda column: check_not_null(list(filter(is_not_none, column)))  # type: ignore
+    elif isinstance(schema, dict) and "logicalType" in schema:
+        return None
+
+    avro_type = schema if isinstance(schema, str) else schema["type"]
+
+    if avro_type in COLUMN_TYPES:
+        types = COLUMN_TYPES[avro_type]
+        limits = COLUMN_LIMITS.get(avro_type)
+
+        def check_primitive(column: typing.List[typing.Any]) -> bool:
+            if not set(map(type, column)) <= types:
+                return False
+            # NaN makes the comparisons fail, then the values are checked one by one
+            return limits is None or not column or limits[0] <= min(column) and max(column) <= limits[1]
+
+        return check_primitive
+    elif inspect.isclass(a_type) and issubclass(a_type, enum.Enum):
+        members = [member for member in a_type if member.name != "Meta"]
+        symbols = frozenset(members) | frozenset(member.value for member in members)
+
+        def check_enum(column: typing.List[typing.Any]) -> bool:
+            try:
+                return set(column) <= symbols
+            except TypeError:
+                # values that can not be hashed
+                return False
+
+        return check_enum
+    elif avro_type == field_utils.FIXED:
+        sizes = frozenset({schema["size"]})
+
+        def check_fixed(column: typing.List[typing.Any]) -> bool:
+            return set(map(type, column)) <= {bytes} and set(map(len, column)) <= sizes
+
+        return check_fixed
+    return None
+
+
+def compile_column_checks(
+    model: typing.Type["schema_generator.AvroModel"],
+) -> typing.Dict[str, typing.Optional[ColumnCheck]]:
+    field_types = codegen.get_field_types(model)
+
+    return {
+        field["name"]: column_check(field_types.get(field["name"]), field["type"])
+        for field in model._parsed_schema()["fields"]
+    }
+
+
+def validate_rows(
+    model: typing.Type["schema_generator.AvroModel"],
+    instances: typing.Sequence[typing.Any],
+    collect_errors: bool = True,
+    offset: int = 0,
+) -> ValidationReport:
+    """
+    Validate the instances in the current process. Row indexes start at `offset`.
+
+    With `collect_errors=False` only the errors of the first invalid value are reported: the one
+    with the lowest row and, in that row, the first field.
+    """
+    schema = model._parsed_schema()
+    validators = model._compiled_field_validators()
+    column_checks = model._from_cache("column_checks", lambda: compile_column_checks(model))
+    errors: typing.List[RowError] = []
+    # rows to validate, when the validation stops with the first error only the rows before it
+    rows = len(instances)
+
+    for field in schema["fields"]:
+        name = field["name"]
+        column = list(map(operator.attrgetter(name), itertools.islice(instances, rows)))
+
+        check_column = column_checks[name]
+        if check_column is not None and check_column(column):
+            continue
+
+        try:
+            results = list(map(validators[name], column))
+        except (ValueError, TypeError, OverflowError):
+            # only values validated by fastavro can raise, they are reported below
+            results = [False] * len(column)
+
+        for row in itertools.compress(itertools.count(), map(operator.not_, results)):
+            messages = field_errors(schema, field, column[row])
+
+            if not messages:
+                continue
+            elif not collect_errors:
+                errors = [RowError(row + offset, name, message) for message in messages]
+                rows = row
+                break
+            errors.extend(RowError(row + offset, name, message) for message in messages)
+
+    errors.sort(key=operator.attrgetter("row"))
+    return ValidationReport(total=len(instances), errors=errors)
+
+
+def validate_many(
+    model: typing.Type["schema_generator.AvroModel"],
+    instances: typing.Iterable[typing.Any],
+    collect_errors: bool = True,
+    processes: typing.Optional[int] = None,
+) -> ValidationReport:
+    """
+    Validate many instances of `model`.
+
+    When `processes` is bigger than 1 and the batch is big enough, the instances are split into chunks
+    that are validated in a process pool. The model and the instances must be picklable.
+    """
+    instances = list(instances)
+    processes = min(processes or 1, len(instances) // MIN_ROWS_PER_PROCESS)
+
+    if processes <= 1:
+        return validate_rows(model, instances, collect_errors=collect_errors)
+
+    chunk_size = math.ceil(len(instances) / processes)
+    chunks = range(0, len(instances), chunk_size)
+    errors: typing.List[RowError] = []
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        reports = executor.map(
+            validate_rows,
+            [model] * len(chunks),
+            [instances[start : start + chunk_size] for start in chunks],
+            [collect_errors] * len(chunks),
+            chunks,
+        )
+        for report in reports:
+            errors.extend(report.errors)
+            if errors and not collect_errors:
+                break
+
+    return ValidationReport(total=len(instances), errors=errors)
@@ -0,0 +1,205 @@
+import dataclasses
+import enum
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import typing
+import warnings
+from unittest import mock
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, disk_cache
+
+
+@pytest.fixture
+def schema_cache(tmp_path):
+    yield disk_cache.enable(tmp_path)
+    disk_cache.disable()
+
+
+def build_model(
+    street_type: type = str, doc: str = "An User", default: str = "john", color_namespace: str = "colors"
+) -> typing.Type[AvroModel]:
+    """
+    Models with the same qualified name, like the same model in different processes
+    """
+
+    class Color(enum.Enum):
+        BLUE = "BLUE"
+        YELLOW = "YELLOW"
+
+        class Meta:
+            namespace = color_namespace
+
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: street_type  # type: ignore
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        address: Address
+        color: Color = Color.BLUE
+        name: str = default
+
+    User.__doc__ = doc
+    return User
+
+
+def test_schema_is_loaded_from_disk(schema_cache):
+    schema = build_model().avro_schema_to_python()
+    model = build_model()
+
+    with mock.patch.object(model, "_generate_avro_schema") as generate:
+        assert model.avro_schema_to_python() == schema
+        assert model.avro_schema() == json.dumps(schema)
+
+    generate.assert_not_called()
+    assert schema_cache.get_schema(model) == schema
+
+
+@pytest.mark.parametrize(
+    "changes",
+    ({"street_type": int}, {"doc": "Another doc"}, {"default": "peter"}, {"color_namespace": "other.colors"}),
+    ids=("nested model", "doc", "default", "enum meta"),
+)
+def test_changed_model_is_generated_again(schema_cache, changes):
+    schema = build_model().avro_schema_to_python()
+
+    with mock.patch.object(disk_cache, "cache", None):
+        expected = build_model(**changes).avro_schema_to_python()
+    assert expected != schema
+
+    assert build_model(**changes).avro_schema_to_python() == expected
+    assert schema_cache.get_schema(build_model(**changes)) == expected
+
+
+def test_other_version_is_generated_again(schema_cache):
+    build_model().avro_schema_to_python()
+    model = build_model()
+
+    with mock.patch.object(disk_cache, "VERSION", "other"), mock.patch.object(
+        model, "_generate_avro_schema", wraps=model._generate_avro_schema
+    ) as generate:
+        model.avro_schema_to_python()
+
+    generate.assert_called_once()
+
+
+def test_invalid_file_is_ignored(schema_cache):
+    model = build_model()
+    schema = model.avro_schema_to_python()
+
+    with open(schema_cache.get_path(model), "w") as fo:
+        fo.write('{"key": ')
+
+    model = build_model()
+    assert schema_cache.get_schema(model) is None
+    assert model.avro_schema_to_python() == schema
+    assert schema_cache.get_schema(model) == schema
+
+
+def test_disk_cache_is_disabled(tmp_path):
+    model = build_model()
+    model.avro_schema_to_python()
+
+    assert disk_cache.cache is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_clear(schema_cache, tmp_path):
+    build_model().avro_schema_to_python()
+    assert len(list(tmp_path.iterdir())) == 1
+
+    schema_cache.clear()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_directory_is_created_lazily(tmp_path):
+    directory = tmp_path / "schemas"
+    schema_cache = disk_cache.DiskCache(directory)
+    assert not directory.exists()
+
+    schema_cache.clear()
+    schema_cache.set_schema(build_model(), build_model().avro_schema_to_python())
+    assert len(list(directory.iterdir())) == 1
+
+
+def test_unusable_directory(tmp_path):
+    (tmp_path / "file").write_text("")
+    schema_cache = disk_cache.enable(tmp_path / "file" / "schemas")
+
+    try:
+        with pytest.warns(UserWarning, match="disk cache is disabled"):
+            schema = build_model().avro_schema_to_python()
+        assert schema_cache.get_schema(build_model()) is None
+
+        # the warning is shown only once
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", UserWarning)
+            assert build_model().avro_schema_to_python() == schema
+    finally:
+        disk_cache.disable()
+
+
+def test_unusable_directory_on_import(tmp_path):
+    (tmp_path / "file").write_text("")
+    env = {**os.environ, disk_cache.CACHE_DIR_ENV: str(tmp_path / "file" / "schemas")}
+
+    subprocess.run([sys.executable, "-c", "import dataclasses_avroschema"], env=env, check=True)
+
+
+MODEL_WITH_CALLABLES = textwrap.dedent(
+    """
+    import dataclasses
+    import datetime
+    import uuid
+
+    from dataclasses_avroschema import AvroModel
+
+
+    @dataclasses.dataclass
+    class Event(AvroModel):
+        id: uuid.UUID = dataclasses.field(default_factory=uuid.uuid4)
+        created_at: datetime.datetime = dataclasses.field(default_factory=datetime.datetime.now)
+
+        class Meta:
+            dacite_config = {"type_hooks": {datetime.datetime: lambda value: value}, "strict": True}
+    """
+)
+
+
+def test_definition_hash_is_stable(tmp_path, monkeypatch):
+    (tmp_path / "events_module.py").write_text(MODEL_WITH_CALLABLES)
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    from events_module import Event
+
+    assert disk_cache.model_definition_hash(Event) == disk_cache.model_definition_hash(Event)
+
+    # other interpreters, with a different hash seed
+    script = "from dataclasses_avroschema import disk_cache; import events_module; "
+    script += "print(disk_cache.model_definition_hash(events_module.Event))"
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(tmp_path), root]), PYTHONHASHSEED="random")
+
+    hashes = {
+        subprocess.run(
+            [sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True
+        ).stdout.strip()
+        for _ in range(2)
+    }
+    assert hashes == {disk_cache.model_definition_hash(Event)}
+
+
+def test_stable_repr():
+    @dataclasses.dataclass
+    class Model:
+        name: str
+
+    assert disk_cache.stable_repr(dataclasses.MISSING) == "MISSING"
+    assert disk_cache.stable_repr(Model) == disk_cache.qualified_name(Model)
+    assert disk_cache.stable_repr({"b": 1, "a": [object()]}) == "{'a': [builtins.object], 'b': 1}"
+    assert disk_cache.stable_repr(Model(name="john")) == repr(Model(name="john"))
@@ -1,6 +1,10 @@
+import dataclasses
+import enum
 import json
 import typing
 
+import fastavro
+
 from dataclasses_avroschema import AvroModel
 
 
@@ -139,3 +143,32 @@ def test_alias_nested_item_with_map(user_map_address_alias):
             alias_nested_items = {"address": "MySuperAddress"}
 
     assert User.avro_schema() == json.dumps(user_map_address_alias)
+
+
+def test_schema_with_many_named_types():
+    """
+    Each named type is defined the first time that it appears and referenced by name after that
+    """
+    width = 300
+    models = []
+
+    for index in range(width):
+        kind = enum.Enum(f"Kind{index}", {"ONE": "ONE", "TWO": "TWO"})
+        models.append(dataclasses.make_dataclass(f"Record{index}", [("kind", kind)], bases=(AvroModel,)))
+
+    fields = [(f"first_{index}", model) for index, model in enumerate(models)]
+    fields += [(f"second_{index}", model) for index, model in enumerate(models)]
+    Wide = dataclasses.make_dataclass("Wide", fields, bases=(AvroModel,))
+
+    schema = Wide.avro_schema_to_python()
+    first, second = schema["fields"][:width], schema["fields"][width:]
+
+    for index, (first_field, second_field) in enumerate(zip(first, second)):
+        assert first_field["type"] == {
+            "type": "record",
+            "name": f"Record{index}",
+            "fields": [{"name": "kind", "type": {"type": "enum", "name": f"Kind{index}", "symbols": ["ONE", "TWO"]}}],
+        }
+        assert second_field["type"] == f"Record{index}"
+
+    assert fastavro.parse_schema(schema)
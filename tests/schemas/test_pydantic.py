@@ -366,6 +366,28 @@ def test_serialization(color_enum):
     assert UserAdvance.deserialize(data=event) == user
 
 
+def test_deserialize_many(color_enum):
+    class Address(AvroBaseModel):
+        street: str
+        street_number: int
+
+    class User(AvroBaseModel):
+        name: str
+        age: int
+        address: Address
+        favorite_colors: color_enum = color_enum.BLUE
+        pets: typing.List[str] = Field(default_factory=lambda: ["dog", "cat"])
+
+    users = [
+        User(name="bond", age=50, address=Address(street="test", street_number=10)),
+        User(name="john", age=20, address=Address(street="test", street_number=20), favorite_colors=color_enum.GREEN),
+    ]
+    events = [user.serialize() for user in users]
+
+    assert list(User.deserialize_many(events)) == users
+    assert list(User.deserialize_many(events, create_instance=False)) == [user.dict() for user in users]
+
+
 def test_not_pydantic_not_installed(monkeypatch):
     monkeypatch.setattr(utils, "pydantic", None)
 
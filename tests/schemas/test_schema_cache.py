@@ -0,0 +1,283 @@
+import dataclasses
+import hashlib
+import json
+import typing
+from unittest import mock
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import AvroModel, case, warmup
+
+
+def build_nested_models(depth: int) -> typing.Type[AvroModel]:
+    @dataclasses.dataclass
+    class Level0(AvroModel):
+        name: str
+
+    model = Level0
+    for level in range(1, depth):
+        model = dataclasses.make_dataclass(f"Level{level}", [("name", str), ("child", model)], bases=(AvroModel,))
+
+    return model
+
+
+def build_instance(model: typing.Type[AvroModel]) -> AvroModel:
+    fields = {field.name: field.type for field in dataclasses.fields(model)}
+
+    if "child" in fields:
+        return model(name=model.__name__, child=build_instance(fields["child"]))
+    return model(name=model.__name__)
+
+
+def test_schema_is_compiled_once(user_dataclass, user_avro_json):
+    with mock.patch.object(
+        user_dataclass, "_generate_avro_schema", wraps=user_dataclass._generate_avro_schema
+    ) as generate:
+        assert user_dataclass.avro_schema_to_python() == user_avro_json
+        assert user_dataclass.avro_schema() == json.dumps(user_avro_json)
+        assert user_dataclass.avro_schema_to_python() == user_avro_json
+
+    assert generate.call_count == 1
+
+
+def test_cached_schema_can_not_be_modified(user_dataclass, user_avro_json):
+    schema = user_dataclass.avro_schema_to_python()
+    schema["name"] = "Modified"
+
+    assert user_dataclass.avro_schema_to_python() == user_avro_json
+
+
+def test_generated_schema_can_not_be_modified(user_dataclass, user_avro_json):
+    schema = user_dataclass.generate_schema()
+    schema["fields"].clear()
+
+    assert user_dataclass.avro_schema_to_python() == user_avro_json
+
+
+def test_case_schema_does_not_modify_the_cached_schema():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        first_name: str
+        age: int
+
+    event = User(first_name="a", age=1).serialize()
+    User.clear_cache()
+
+    camelcase_schema = User.avro_schema_to_python(case_type=case.CAMELCASE)
+    assert [field["name"] for field in camelcase_schema["fields"]] == ["firstName", "age"]
+
+    assert [field["name"] for field in User.avro_schema_to_python()["fields"]] == ["first_name", "age"]
+    assert User(first_name="a", age=1).serialize() == event == b"\x02a\x02"
+    assert User.deserialize(event) == User(first_name="a", age=1)
+
+
+def test_serialization_does_not_generate_the_schema_again():
+    for depth in (1, 5, 20):
+        model = build_nested_models(depth)
+        instance = build_instance(model)
+        event = instance.serialize()
+
+        with mock.patch("dataclasses_avroschema.schema_definition.AvroSchemaDefinition.render") as render, mock.patch(
+            "dataclasses_avroschema.schema_definition.AvroSchemaDefinition.parse_dataclasses_fields"
+        ) as parse_fields:
+            for _ in range(10):
+                assert instance.serialize() == event
+                assert model.deserialize(event) == instance
+                assert instance.validate()
+
+        render.assert_not_called()
+        parse_fields.assert_not_called()
+
+
+def test_clear_cache(user_dataclass, user_avro_json):
+    user_dataclass.avro_schema()
+
+    with mock.patch.object(
+        user_dataclass, "_generate_avro_schema", wraps=user_dataclass._generate_avro_schema
+    ) as generate:
+        user_dataclass.clear_cache()
+        assert user_dataclass.avro_schema_to_python() == user_avro_json
+
+    assert generate.call_count == 1
+
+
+def test_cache_is_not_shared_with_subclasses():
+    @dataclasses.dataclass
+    class Parent(AvroModel):
+        name: str
+
+    @dataclasses.dataclass
+    class Child(Parent):
+        age: int
+
+    assert Parent.avro_schema_to_python()["name"] == "Parent"
+    assert Child.avro_schema_to_python()["name"] == "Child"
+    assert len(Child.avro_schema_to_python()["fields"]) == 2
+    assert len(Parent.avro_schema_to_python()["fields"]) == 1
+
+
+def test_nested_model_as_root_after_being_a_child():
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        address: Address
+        previous_address: Address
+
+    user_schema = User.avro_schema_to_python()
+    assert user_schema["fields"][2]["type"] == "Address"
+    assert Address.avro_schema_to_python() == {
+        "type": "record",
+        "name": "Address",
+        "fields": [{"name": "street", "type": "string"}],
+    }
+    assert User.avro_schema_to_python() == user_schema
+
+
+def test_precompile():
+    model = build_nested_models(5)
+    instance = build_instance(model)
+    model.precompile()
+
+    with mock.patch("dataclasses_avroschema.schema_definition.AvroSchemaDefinition.render") as render, mock.patch(
+        "fastavro.parse_schema"
+    ) as parse_schema, mock.patch(
+        "dataclasses_avroschema.codegen.compile_dict_converter"
+    ) as compile_dict_converter, mock.patch.object(
+        model, "_create_config"
+    ) as create_config:
+        assert model.deserialize(instance.serialize()) == instance
+        assert instance.validate()
+
+    render.assert_not_called()
+    parse_schema.assert_not_called()
+    compile_dict_converter.assert_not_called()
+    create_config.assert_not_called()
+
+
+@pytest.mark.parametrize("max_workers", (1, 4))
+def test_warmup(max_workers):
+    models = [build_nested_models(depth) for depth in range(1, 10)]
+
+    timings = warmup(models, max_workers=max_workers)
+
+    assert list(timings) == models
+    assert all(seconds > 0 for seconds in timings.values())
+    assert all("parsed_schema" in model._get_cache() for model in models)
+
+
+def test_warmup_precompile_models():
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+        address: Address
+
+        class Meta:
+            precompile = True
+
+    timings = warmup()
+
+    assert User in timings
+    assert Address not in timings
+    assert "parsed_schema" in User._get_cache()
+
+
+def test_parsed_schema_is_cached(user_dataclass):
+    user = user_dataclass("test", 20, True, 10.4, b"test")
+
+    with mock.patch("fastavro.parse_schema", wraps=fastavro.parse_schema) as parse_schema:
+        event = user.serialize()
+        assert user_dataclass.deserialize(event) == user
+        assert user_dataclass.deserialize(event, writer_schema=user_dataclass) == user
+        assert user.validate()
+
+    assert parse_schema.call_count == 1
+    assert "__fastavro_parsed" in user_dataclass._parsed_schema()
+    assert user_dataclass._parsed_schema() is user_dataclass._parsed_schema()
+
+
+def test_parsed_schema_with_writer_model():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+
+    @dataclasses.dataclass
+    class UserCompatible(AvroModel):
+        name: str
+        age: int = 10
+
+        class Meta:
+            schema_name = "User"
+
+    event = User(name="john").serialize()
+
+    for _ in range(2):
+        assert UserCompatible.deserialize(event, writer_schema=User) == UserCompatible(name="john")
+
+
+def test_parsing_canonical_form(user_dataclass):
+    assert user_dataclass.parsing_canonical_form() == (
+        '{"name":"User","type":"record","fields":[{"name":"name","type":"string"},{"name":"age","type":"long"},'
+        '{"name":"has_pets","type":"boolean"},{"name":"money","type":"double"},{"name":"encoded","type":"bytes"}]}'
+    )
+
+
+def test_fingerprint(user_dataclass):
+    canonical_form = user_dataclass.parsing_canonical_form()
+
+    assert user_dataclass.fingerprint() == fastavro.schema.fingerprint(canonical_form, "CRC-64-AVRO")
+    assert len(user_dataclass.fingerprint()) == 16
+    assert user_dataclass.fingerprint("MD5") == hashlib.md5(canonical_form.encode()).hexdigest()
+    assert user_dataclass.fingerprint("SHA-256") == hashlib.sha256(canonical_form.encode()).hexdigest()
+
+    with pytest.raises(ValueError):
+        user_dataclass.fingerprint("unknown")
+
+
+def test_fingerprint_is_cached(user_dataclass):
+    fingerprint = user_dataclass.fingerprint()
+
+    with mock.patch("fastavro.schema.fingerprint") as fastavro_fingerprint, mock.patch(
+        "fastavro.schema.to_parsing_canonical_form"
+    ) as to_parsing_canonical_form:
+        for _ in range(10):
+            assert user_dataclass.fingerprint() == fingerprint
+
+    fastavro_fingerprint.assert_not_called()
+    to_parsing_canonical_form.assert_not_called()
+
+
+def test_fingerprint_of_equivalent_schemas():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        "An User"
+        name: str
+        age: int = 20
+
+    @dataclasses.dataclass
+    class UserWithoutDefaults(AvroModel):
+        name: str
+        age: int
+
+        class Meta:
+            schema_name = "User"
+
+    @dataclasses.dataclass
+    class UserWithAddress(AvroModel):
+        name: str
+        age: int
+        address: str
+
+        class Meta:
+            schema_name = "User"
+
+    assert User.fingerprint() == UserWithoutDefaults.fingerprint()
+    assert User.fingerprint() != UserWithAddress.fingerprint()
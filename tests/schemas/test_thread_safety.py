@@ -0,0 +1,150 @@
+import dataclasses
+import sys
+import threading
+import typing
+from concurrent import futures
+
+import pytest
+
+from dataclasses_avroschema import AvroModel
+
+THREADS = 16
+ROUNDS = 100
+
+
+@pytest.fixture(autouse=True)
+def switch_threads_often():
+    # switch between threads as often as possible, so the races are not hidden by the GIL
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def build_models() -> typing.Tuple[typing.Type[AvroModel], ...]:
+    """
+    New classes for each round, so the schemas are generated again
+    """
+
+    @dataclasses.dataclass
+    class Address(AvroModel):
+        street: str
+        number: int
+
+    @dataclasses.dataclass
+    class Person(AvroModel):
+        name: str
+        address: Address
+        previous_addresses: typing.List[Address]
+
+    @dataclasses.dataclass
+    class Company(AvroModel):
+        name: str
+        owner: Person
+        employees: typing.List[Person]
+        headquarters: Address
+
+        class Meta:
+            alias_nested_items = {"headquarters": "Headquarters"}
+
+    return Address, Person, Company
+
+
+def expected_schemas() -> typing.Dict[str, typing.Any]:
+    models = build_models()
+
+    return {model.__name__: model.avro_schema_to_python() for model in models}
+
+
+def hammer(
+    models: typing.Tuple[typing.Type[AvroModel], ...], barrier: threading.Barrier, worker: int
+) -> typing.Dict[str, typing.Any]:
+    Address, Person, Company = models
+    address = Address(street="the street", number=worker)
+    person = Person(name=f"person {worker}", address=address, previous_addresses=[address])
+    company = Company(name="the company", owner=person, employees=[person, person], headquarters=address)
+
+    barrier.wait()
+
+    # each worker starts with a different model, so nested models are roots and children at the same time
+    ordered_models = models[worker % 3 :] + models[: worker % 3]
+    schemas = {model.__name__: model.avro_schema_to_python() for model in ordered_models}
+
+    for instance in (address, person, company):
+        assert type(instance).deserialize(instance.serialize()) == instance
+        assert instance.validate()
+
+    return schemas
+
+
+def test_schema_generation_from_many_threads():
+    expected = expected_schemas()
+
+    with futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+        for _ in range(ROUNDS):
+            models = build_models()
+            barrier = threading.Barrier(THREADS)
+            results = executor.map(hammer, [models] * THREADS, [barrier] * THREADS, range(THREADS))
+
+            for schemas in results:
+                assert schemas == expected
+
+            for model in models:
+                assert [field.name for field in model.get_fields()] == [
+                    field["name"] for field in expected[model.__name__]["fields"]
+                ]
+
+
+def test_schema_generation_while_clearing_the_cache():
+    models = build_models()
+    expected = expected_schemas()
+    barrier = threading.Barrier(THREADS)
+
+    def clear_cache() -> None:
+        barrier.wait()
+        for _ in range(ROUNDS):
+            for model in models:
+                model.clear_cache()
+
+    with futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+        clearing = executor.submit(clear_cache)
+        results = executor.map(hammer, [models] * (THREADS - 1), [barrier] * (THREADS - 1), range(THREADS - 1))
+
+        for schemas in results:
+            assert schemas == expected
+        clearing.result()
+
+
+def test_models_are_compiled_in_parallel():
+    Address, Person, _ = build_models()
+    creating = threading.Event()
+    release = threading.Event()
+
+    def slow_factory() -> str:
+        creating.set()
+        assert release.wait(5)
+        return "value"
+
+    with futures.ThreadPoolExecutor(max_workers=2) as executor:
+        slow = executor.submit(Person._from_cache, "slow", slow_factory)
+        assert creating.wait(5)
+
+        # other models are compiled while the first value is being created
+        assert executor.submit(Address.avro_schema_to_python).result(timeout=5)["name"] == "Address"
+        release.set()
+
+        assert slow.result(timeout=5) == "value"
+
+
+def test_value_created_by_many_threads_is_published_once():
+    model = build_models()[0]
+    barrier = threading.Barrier(THREADS)
+
+    def create() -> object:
+        barrier.wait()
+        return model._from_cache("value", object)
+
+    with futures.ThreadPoolExecutor(max_workers=THREADS) as executor:
+        values = list(executor.map(lambda _: create(), range(THREADS)))
+
+    assert all(value is model._get_cache()["value"] for value in values)
@@ -0,0 +1,70 @@
+"""
+Models shared by the tests of the compiled functions
+"""
+import dataclasses
+import datetime
+import decimal
+import enum
+import typing
+import uuid
+
+from dataclasses_avroschema import AvroModel, types
+
+
+class FavoriteColor(str, enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class Car(AvroModel):
+    total: int
+
+
+@dataclasses.dataclass
+class Bus(AvroModel):
+    driver: str
+    total: int
+
+
+@dataclasses.dataclass
+class Person(AvroModel):
+    name: str
+    age: types.Int32
+    color: FavoriteColor
+    address: Address
+    addresses: typing.List[Address]
+    addresses_map: typing.Dict[str, Address]
+    colors: typing.Tuple[FavoriteColor]
+    transport: typing.Union[Car, Bus]
+    identifier: typing.Union[int, str, FavoriteColor]
+    optional_address: typing.Optional[Address] = None
+    optional_color: typing.Optional[FavoriteColor] = None
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+    money: types.condecimal(max_digits=5, decimal_places=2) = decimal.Decimal("10.50")
+    birthday: datetime.date = datetime.date(2019, 10, 12)
+    event_uuid: uuid.UUID = uuid.UUID("09f00184-7721-4266-a955-21048a5cc235")
+
+    class Meta:
+        compiled_parser = True
+
+
+person_data = {
+    "name": "john",
+    "age": 20,
+    "color": "BLUE",
+    "address": {"street": "test", "street_number": 10},
+    "addresses": [{"street": "test", "street_number": 10}],
+    "addresses_map": {"home": {"street": "test", "street_number": 10}},
+    "colors": ["BLUE", "YELLOW"],
+    "transport": {"driver": "Marcos", "total": 10},
+    "identifier": "YELLOW",
+    "optional_address": None,
+    "optional_color": "YELLOW",
+}
@@ -0,0 +1,195 @@
+import dataclasses
+import datetime
+import enum
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, types
+from dataclasses_avroschema.avrodantic import AvroBaseModel
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class Measure(AvroModel):
+    count: int
+    small_count: types.Int32
+    value: float
+    ratio: types.Float32
+    name: str
+    color: Color
+    address: Address
+    created_at: datetime.datetime
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+    note: typing.Optional[str] = None
+
+
+created_at = datetime.datetime(2023, 1, 1, 10, 30, tzinfo=datetime.timezone.utc)
+columns = {
+    "count": [1, 2, 3],
+    "small_count": [4, 5, 6],
+    "value": [0.5, 1.5, 2.5],
+    "ratio": [0.25, 0.5, 0.75],
+    "name": ["a", "b", "c"],
+    "color": [Color.BLUE, "YELLOW", Color.YELLOW],
+    "address": [Address(street="x", street_number=1), {"street": "y", "street_number": 2}, Address("z", 3)],
+    "created_at": [created_at] * 3,
+}
+
+
+def build_instances(data: typing.Dict[str, typing.Any]) -> typing.List[Measure]:
+    rows = [dict(zip(data, row)) for row in zip(*data.values())]
+    for row in rows:
+        row["color"] = Color(row["color"])
+        if isinstance(row["address"], dict):
+            row["address"] = Address(**row["address"])
+    return [Measure(**row) for row in rows]
+
+
+@pytest.mark.parametrize("serialization_type", ("avro", "avro-json", "avro-single-object"))
+def test_serialize_columns(serialization_type):
+    events = Measure.serialize_columns(columns, serialization_type=serialization_type)
+
+    assert events == Measure.serialize_many(build_instances(columns), serialization_type=serialization_type)
+    assert Measure.deserialize(events[1], serialization_type=serialization_type).color == Color.YELLOW
+
+
+def test_serialize_columns_concatenate():
+    data, offsets = Measure.serialize_columns(columns, concatenate=True)
+
+    assert (data, offsets) == Measure.serialize_many(build_instances(columns), concatenate=True)
+    assert len(offsets) == 4
+
+
+def test_columns_with_values():
+    data = dict(columns, tags=[["one"], [], ["two", "three"]], note=["a note", None, None])
+    events = Measure.serialize_columns(data)
+
+    assert events == Measure.serialize_many(build_instances(data))
+    assert Measure.deserialize(events[2]).tags == ["two", "three"]
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip("numpy")
+
+    data = dict(
+        columns,
+        count=numpy.array([1, 2, 3], dtype=numpy.int64),
+        small_count=numpy.array([4, 5, 6], dtype=numpy.int32),
+        value=numpy.array([0.5, 1.5, 2.5], dtype=numpy.float64),
+        ratio=numpy.array([0.25, 0.5, 0.75], dtype=numpy.float32),
+    )
+
+    assert Measure.serialize_columns(data) == Measure.serialize_columns(columns)
+
+
+def test_empty_columns():
+    assert Measure.serialize_columns({name: [] for name in columns}) == []
+    assert Measure.serialize_columns({name: [] for name in columns}, concatenate=True) == (b"", [0])
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    (
+        (dict(columns, count=[1, 2]), r"All the columns must have the same length, got lengths \[2, 3\]"),
+        (dict(columns, other=[1, 2, 3]), r"Columns \['other'\] are not fields of Measure"),
+        ({"count": [1]}, "Column small_count is required, the field does not have a default value"),
+    ),
+)
+def test_invalid_columns(data, message):
+    with pytest.raises(ValueError, match=message):
+        Measure.serialize_columns(data)
+
+
+def test_pydantic_serialize_columns():
+    class User(AvroBaseModel):
+        name: str
+        age: int = 20
+        tags: typing.List[str] = []
+
+    events = User.serialize_columns({"name": ["john", "peter"]})
+
+    assert events == [User(name="john").serialize(), User(name="peter").serialize()]
+
+
+@pytest.mark.parametrize("serialization_type", ("avro", "avro-json", "avro-single-object"))
+def test_deserialize_columns(serialization_type):
+    events = Measure.serialize_columns(columns, serialization_type=serialization_type)
+    result = Measure.deserialize_columns(events, serialization_type=serialization_type)
+
+    assert list(result) == [field.name for field in dataclasses.fields(Measure)]
+    assert result["count"] == [1, 2, 3]
+    assert result["color"] == ["BLUE", "YELLOW", "YELLOW"]
+    assert result["address"][1] == {"street": "y", "street_number": 2}
+    assert result["created_at"] == [created_at] * 3
+    assert result["tags"] == [[], [], []]
+    assert result["note"] == [None, None, None]
+
+
+def test_deserialize_columns_as_numpy():
+    numpy = pytest.importorskip("numpy")
+
+    @dataclasses.dataclass
+    class Event(AvroModel):
+        count: int
+        small_count: types.Int32
+        value: float
+        ratio: types.Float32
+        active: bool
+        day: datetime.date
+        created_at: datetime.datetime
+        created_at_micro: types.DateTimeMicro
+        name: str
+        total: typing.Optional[int] = None
+
+    timestamp = datetime.datetime(2023, 1, 1, 10, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    events = [
+        Event(1, 2, 0.5, 0.25, True, timestamp.date(), timestamp, timestamp, "a").serialize(),
+        Event(3, 4, 1.5, 0.75, False, timestamp.date(), timestamp, timestamp, "b", total=10).serialize(),
+    ]
+    result = Event.deserialize_columns(events, as_numpy=True)
+
+    assert result["count"].dtype == numpy.int64
+    assert result["small_count"].tolist() == [2, 4]
+    assert result["small_count"].dtype == numpy.int32
+    assert result["value"].dtype == numpy.float64
+    assert result["ratio"].dtype == numpy.float32
+    assert result["active"].tolist() == [True, False]
+    assert result["day"][0] == numpy.datetime64("2023-01-01")
+    assert result["created_at"][0] == numpy.datetime64("2023-01-01T10:30:15.123")
+    assert result["created_at"].dtype == numpy.dtype("datetime64[ms]")
+    assert result["created_at_micro"][0] == numpy.datetime64("2023-01-01T10:30:15.123456")
+    assert result["name"] == ["a", "b"]
+    assert result["total"] == [None, 10]
+
+    empty = Event.deserialize_columns([], as_numpy=True)
+    assert empty["count"].dtype == numpy.int64
+    assert len(empty["count"]) == 0
+
+
+def test_deserialize_columns_with_writer_schema():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+
+    @dataclasses.dataclass
+    class UserV2(AvroModel):
+        name: str
+        age: int = 20
+
+        class Meta:
+            schema_name = "User"
+
+    events = User.serialize_columns({"name": ["john", "peter"]})
+
+    assert UserV2.deserialize_columns(events, writer_schema=User) == {"name": ["john", "peter"], "age": [20, 20]}
@@ -0,0 +1,78 @@
+import dataclasses
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.utils import standardize_custom_type
+from tests.serialization.models import Address, FavoriteColor, Person, person_data
+from tests.serialization.test_serialization import CLASSES_DATA_BINARY
+
+
+def to_lists(value: typing.Any) -> typing.Any:
+    # the compiled converter returns lists for tuples
+    if isinstance(value, dict):
+        return {key: to_lists(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [to_lists(item) for item in value]
+    return value
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_compiled_dict_converter(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instance = klass(**data)
+    to_dict = klass._compiled_dict_converter()
+
+    assert to_dict(instance) == instance.asdict(standardize_factory=standardize_custom_type)
+    assert klass._dict_converter() is to_dict
+
+
+def test_compiled_dict_converter_nested_types():
+    person = Person.parse_obj(person_data)
+    result = Person._compiled_dict_converter()(person)
+
+    assert result == to_lists(person.asdict(standardize_factory=standardize_custom_type))
+    assert result["color"] == "BLUE"
+    assert result["colors"] == ["BLUE", "YELLOW"]
+    assert result["address"] == {"street": "test", "street_number": 10}
+    assert result["addresses_map"] == {"home": {"street": "test", "street_number": 10}}
+    assert result["transport"] == {"total": 10}
+    assert result["optional_color"] == "YELLOW"
+
+
+def test_compiled_dict_converter_does_not_copy_immutable_values():
+    person = Person.parse_obj(person_data)
+    result = Person._compiled_dict_converter()(person)
+
+    assert result["tags"] is person.tags
+    assert result["money"] is person.money
+    assert result["event_uuid"] is person.event_uuid
+
+
+def test_compiled_dict_converter_with_unexpected_values():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        color: FavoriteColor
+        address: Address
+        friend: typing.Optional[typing.Type["User"]] = None
+
+    friend = User(color="BLUE", address=Address(street="test", street_number=1))
+    user = User(color=FavoriteColor.YELLOW, address=Address(street="test", street_number=1), friend=friend)
+
+    assert User._compiled_dict_converter()(user) == user.asdict(standardize_factory=standardize_custom_type)
+    assert User.deserialize(user.serialize(), create_instance=False) == {
+        "color": "YELLOW",
+        "address": {"street": "test", "street_number": 1},
+        "friend": {"color": "BLUE", "address": {"street": "test", "street_number": 1}, "friend": None},
+    }
+
+
+def test_custom_asdict_is_used_to_serialize():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: str
+
+        def asdict(self, standardize_factory=None):
+            return {"name": self.name.upper()}
+
+    assert User.deserialize(User(name="john").serialize()) == User(name="JOHN")
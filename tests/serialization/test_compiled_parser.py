@@ -0,0 +1,83 @@
+import dataclasses
+import typing
+
+import pytest
+from dacite import MissingValueError, from_dict
+
+from dataclasses_avroschema import AvroModel
+from tests.serialization.models import Address, Bus, Car, FavoriteColor, Person, person_data
+from tests.serialization.test_serialization import CLASSES_DATA_BINARY
+
+
+def test_compiled_parser_is_used():
+    assert Person.parse_obj(person_data) is not None
+    assert Person._object_parser() is Person._compiled_parser()
+    assert Person._compiled_parser() is Person._compiled_parser()
+
+    # opt-in
+    assert Address._object_parser() is not Address._compiled_parser()
+
+
+def test_compiled_parser_same_result_as_dacite():
+    person = Person.parse_obj(person_data)
+
+    assert person == from_dict(data_class=Person, data=person_data, config=Person.config())
+    assert person.color is FavoriteColor.BLUE
+    assert person.address == Address(street="test", street_number=10)
+    assert person.addresses_map == {"home": Address(street="test", street_number=10)}
+    assert person.colors == (FavoriteColor.BLUE, FavoriteColor.YELLOW)
+    assert person.transport == Car(total=10)
+    # str is the first type in the union that matches
+    assert person.identifier == "YELLOW"
+    assert person.optional_color is FavoriteColor.YELLOW
+    assert person.tags == []
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_compiled_parser_deserialization(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    parse = klass._compiled_parser()
+
+    assert parse(klass.deserialize(avro_binary, create_instance=False)) == klass(**data)
+    assert parse(python_dict) == from_dict(data_class=klass, data=python_dict, config=klass.config())
+
+
+def test_compiled_parser_roundtrip():
+    person = Person.parse_obj(person_data)
+    event = person.serialize()
+
+    assert Person.deserialize(event) == person
+    assert list(Person.deserialize_many([event, event])) == [person, person]
+
+
+def test_compiled_parser_missing_value():
+    data = dict(person_data)
+    data.pop("name")
+
+    with pytest.raises(MissingValueError):
+        Person.parse_obj(data)
+
+
+def test_compiled_parser_optional_without_default():
+    @dataclasses.dataclass
+    class User(AvroModel):
+        name: typing.Optional[str]
+
+        class Meta:
+            compiled_parser = True
+
+    assert User.parse_obj({}) == User(name=None)
+
+
+def test_compiled_parser_not_used_with_dacite_config():
+    @dataclasses.dataclass
+    class Trip(AvroModel):
+        transport: typing.Union[Car, Bus]
+
+        class Meta:
+            compiled_parser = True
+            dacite_config = {"strict": True}
+
+    assert Trip._object_parser() is not Trip._compiled_parser()
+    assert Trip.parse_obj({"transport": {"driver": "Marcos", "total": 10}}) == Trip(
+        transport=Bus(driver="Marcos", total=10)
+    )
@@ -0,0 +1,152 @@
+import dataclasses
+import enum
+import json
+import typing
+
+import pytest
+from fastavro.validation import ValidationError, validate
+
+from dataclasses_avroschema import AvroModel, types
+from dataclasses_avroschema.avrodantic import AvroBaseModel
+from dataclasses_avroschema.utils import standardize_custom_type
+from tests.serialization.models import Address, Car, Person, person_data
+from tests.serialization.test_serialization import CLASSES_DATA_BINARY
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    color: Color
+    address: Address
+    addresses: typing.List[Address]
+    scores: typing.Dict[str, float]
+    code: types.confixed(size=2)
+    nickname: typing.Optional[str] = None
+
+
+def build_user(**kwargs: typing.Any) -> User:
+    data = {
+        "name": "john",
+        "age": 20,
+        "color": Color.BLUE,
+        "address": Address(street="test", street_number=10),
+        "addresses": [Address(street="test", street_number=10)],
+        "scores": {"math": 10.5},
+        "code": b"ab",
+    }
+    data.update(kwargs)
+    return User(**data)
+
+
+def fastavro_errors(instance: AvroModel) -> typing.List[str]:
+    """
+    Errors of the validation with the instance converted into a dict
+    """
+    datum = type(instance)._dict_converter()(instance)
+
+    with pytest.raises(ValidationError) as exc:
+        validate(datum, type(instance).avro_schema_to_python())
+    return json.loads(str(exc.value))
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_compiled_validator(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instance = klass(**data)
+
+    assert klass._compiled_validator()(instance)
+    assert instance.validate()
+    assert validate(instance.asdict(standardize_factory=standardize_custom_type), klass.avro_schema_to_python())
+
+
+def test_compiled_validator_nested_types():
+    person = Person.parse_obj(person_data)
+
+    assert Person._compiled_validator()(person)
+    assert person.validate()
+    assert build_user().validate()
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    (
+        {"name": 1},
+        {"age": "20"},
+        {"age": True},
+        {"age": 1 << 63},
+        {"color": "RED"},
+        {"address": Car(total=1)},
+        {"addresses": [Address(street="test", street_number="10")]},
+        {"scores": {"math": "10"}},
+        {"scores": {1: 10.5}},
+        {"code": b"abc"},
+        {"nickname": 1},
+    ),
+)
+def test_invalid_instance(invalid):
+    user = build_user(**invalid)
+
+    assert not User._compiled_validator()(user)
+
+    with pytest.raises(ValidationError) as exc:
+        user.validate()
+    assert json.loads(str(exc.value)) == fastavro_errors(user)
+
+
+def test_values_validated_by_fastavro():
+    # dicts instead of model instances and enum symbols are valid, like when they are serialized
+    user = build_user(
+        address={"street": "test", "street_number": 10},
+        addresses=({"street": "test", "street_number": 10},),
+        color="YELLOW",
+    )
+
+    assert user.validate()
+    assert User.deserialize(user.serialize()) == build_user(color=Color.YELLOW)
+
+
+def test_collect_errors():
+    user = build_user(name=1, age="20")
+
+    with pytest.raises(ValidationError) as exc:
+        user.validate()
+    assert json.loads(str(exc.value)) == ["User.name is <1> of type <class 'int'> expected string"]
+
+    with pytest.raises(ValidationError) as exc:
+        user.validate(collect_errors=True)
+    assert json.loads(str(exc.value)) == [
+        "User.name is <1> of type <class 'int'> expected string",
+        "User.age is <20> of type <class 'str'> expected long",
+    ]
+
+
+def test_self_relationship():
+    @dataclasses.dataclass
+    class Node(AvroModel):
+        value: int
+        next: typing.Optional[typing.Type["Node"]] = None
+
+    assert Node(value=1, next=Node(value=2)).validate()
+
+    with pytest.raises(ValidationError):
+        Node(value=1, next=Node(value="2")).validate()
+
+
+def test_pydantic_validate_avro():
+    class Account(AvroBaseModel):
+        name: str
+        address: Address
+
+    account = Account(name="john", address=Address(street="test", street_number=10))
+    assert account.validate_avro()
+
+    account.name = 1
+    account.address.street_number = "10"
+    with pytest.raises(ValidationError) as exc:
+        account.validate_avro(collect_errors=True)
+    assert len(exc.value.errors) == 2
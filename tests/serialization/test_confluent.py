@@ -0,0 +1,130 @@
+import dataclasses
+import typing
+from unittest import mock
+
+import pytest
+
+from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema.confluent import HTTPSchemaResolver, InMemorySchemaResolver, SchemaResolver, WireFormat
+from dataclasses_avroschema.exceptions import InvalidWireFormat, SchemaIdLookupNotSupported, UnknownSchemaId
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+
+
+@dataclasses.dataclass
+class UserV2(AvroModel):
+    name: str
+    age: int
+    country: str = "Argentina"
+
+    class Meta:
+        schema_name = "User"
+
+
+def test_encode():
+    resolver = InMemorySchemaResolver()
+    schema_id = resolver.register(User)
+    user = User(name="john", age=20)
+
+    event = WireFormat(resolver).encode(user, schema_id=schema_id)
+
+    assert event == b"\x00\x00\x00\x00\x01" + user.serialize()
+    assert WireFormat(resolver).encode(user) == event
+
+
+def test_decode():
+    resolver = InMemorySchemaResolver({1: User.avro_schema_to_python(), 2: UserV2.avro_schema_to_python()})
+    wire_format = WireFormat(resolver)
+    user = User(name="john", age=20)
+    event = wire_format.encode(user, schema_id=1)
+
+    assert wire_format.decode(event, User) == user
+    assert wire_format.decode(memoryview(event), User, create_instance=False) == {"name": "john", "age": 20}
+
+    # schema evolution, the event was written with the schema 1
+    assert wire_format.decode(event, UserV2) == UserV2(name="john", age=20)
+    assert wire_format.decode(wire_format.encode(UserV2(name="jane", age=30)), UserV2) == UserV2(name="jane", age=30)
+
+
+def test_schemas_are_resolved_once():
+    resolver = InMemorySchemaResolver()
+    schema_id = resolver.register(User)
+    wire_format = WireFormat(resolver)
+    user = User(name="john", age=20)
+
+    with mock.patch.object(resolver, "get_schema", wraps=resolver.get_schema) as get_schema, mock.patch.object(
+        resolver, "get_schema_id", wraps=resolver.get_schema_id
+    ) as get_schema_id:
+        events = [wire_format.encode(user) for _ in range(10)]
+        assert [wire_format.decode(event, UserV2) for event in events] == [UserV2(name="john", age=20)] * 10
+
+    assert get_schema.call_count == 1
+    assert get_schema_id.call_count == 1
+    assert wire_format.schemas.cache_info().hits == 9
+    assert wire_format.get_writer_schema(schema_id) is wire_format.get_writer_schema(schema_id)
+
+
+def test_schema_cache_is_bounded():
+    resolver = InMemorySchemaResolver()
+    schema_ids = [resolver.register({**User.avro_schema_to_python(), "doc": str(number)}) for number in range(3)]
+    wire_format = WireFormat(resolver, cache_size=2)
+
+    for schema_id in schema_ids:
+        wire_format.get_writer_schema(schema_id)
+
+    assert schema_ids == [1, 2, 3]
+    assert wire_format.schemas.cache_info().currsize == 2
+
+
+def test_in_memory_resolver():
+    resolver = InMemorySchemaResolver()
+
+    assert resolver.register(User) == 1
+    assert resolver.register(User.avro_schema_to_python()) == 1
+    assert resolver.register(UserV2) == 2
+    assert resolver.register(UserV2, schema_id=10) == 10
+    assert resolver.get_schema(10) == UserV2.avro_schema_to_python()
+    assert resolver.get_schema_id(UserV2.avro_schema_to_python()) == 2
+
+    with pytest.raises(UnknownSchemaId) as excinfo:
+        resolver.get_schema(3)
+    assert excinfo.value.schema_id == 3
+
+    with pytest.raises(ValueError):
+        resolver.get_schema_id({"type": "record", "name": "Unknown", "fields": []})
+
+
+def test_custom_resolver():
+    class Resolver(SchemaResolver):
+        def get_schema(self, schema_id: int) -> typing.Dict:
+            return User.avro_schema_to_python()
+
+    wire_format = WireFormat(Resolver())
+    event = wire_format.encode(User(name="john", age=20), schema_id=7)
+
+    assert wire_format.decode(event, User) == User(name="john", age=20)
+
+    with pytest.raises(SchemaIdLookupNotSupported, match="Resolver: it can not look up the ids of the schemas"):
+        wire_format.encode(User(name="john", age=20))
+
+
+def test_http_resolver_without_subject():
+    resolver = HTTPSchemaResolver("http://localhost:8081")
+
+    with pytest.raises(SchemaIdLookupNotSupported, match="the subject is needed to look up the ids"):
+        WireFormat(resolver).encode(User(name="john", age=20))
+
+
+@pytest.mark.parametrize("event", [b"", b"\x00\x00\x00", b"\x01\x00\x00\x00\x01\x08john("])
+def test_invalid_wire_format(event):
+    with pytest.raises(InvalidWireFormat):
+        WireFormat(InMemorySchemaResolver()).decode(event, User)
+
+
+def test_unknown_schema_id():
+    with pytest.raises(UnknownSchemaId):
+        WireFormat(InMemorySchemaResolver()).decode(b"\x00\x00\x00\x00\x01\x08john(", User)
@@ -0,0 +1,137 @@
+import dataclasses
+import enum
+import io
+import typing
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import AvroModel
+
+
+class FavoriteColor(str, enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    favorite_color: FavoriteColor
+    addresses: typing.List[Address]
+    nickname: typing.Optional[str] = None
+
+
+def build_users(total: int) -> typing.Iterator[User]:
+    for number in range(total):
+        yield User(
+            name=f"user {number}",
+            age=number,
+            favorite_color=FavoriteColor.BLUE,
+            addresses=[Address(street="test", street_number=number)],
+        )
+
+
+@pytest.mark.parametrize("codec", ["null", "deflate", "bzip2"])
+def test_write_and_read_container(codec):
+    fo = io.BytesIO()
+
+    assert User.write_container(fo, build_users(100), codec=codec) == 100
+
+    fo.seek(0)
+    assert list(User.read_container(fo)) == list(build_users(100))
+
+
+def test_container_is_a_standard_avro_file():
+    fo = io.BytesIO()
+    User.write_container(fo, build_users(2), codec="deflate", metadata={"producer": "tests"})
+    fo.seek(0)
+
+    reader = fastavro.reader(fo)
+    assert reader.codec == "deflate"
+    assert reader.metadata["producer"] == "tests"
+    assert reader.writer_schema["name"] == "User"
+    assert next(reader) == {
+        "name": "user 0",
+        "age": 0,
+        "favorite_color": "BLUE",
+        "addresses": [{"street": "test", "street_number": 0}],
+        "nickname": None,
+    }
+
+
+def test_read_container_as_dict():
+    fo = io.BytesIO()
+    User.write_container(fo, build_users(1))
+    fo.seek(0)
+
+    assert list(User.read_container(fo, create_instance=False)) == [
+        {
+            "name": "user 0",
+            "age": 0,
+            "favorite_color": FavoriteColor.BLUE,
+            "addresses": [{"street": "test", "street_number": 0}],
+            "nickname": None,
+        }
+    ]
+
+
+def test_read_container_is_lazy():
+    fo = io.BytesIO()
+    User.write_container(fo, build_users(1000), sync_interval=100)
+    size = fo.tell()
+    fo.seek(0)
+
+    users = User.read_container(fo)
+    assert next(users) == next(build_users(1))
+    assert fo.tell() < size
+
+
+def test_write_container_consumes_instances_lazily():
+    consumed = []
+
+    def instances():
+        for user in build_users(1000):
+            consumed.append(user)
+            yield user
+
+    class Output(io.BytesIO):
+        def write(self, data):
+            # when the first block is written not all the instances have been consumed
+            written.append(len(consumed))
+            return super().write(data)
+
+    written: typing.List[int] = []
+    User.write_container(Output(), instances(), sync_interval=100)
+
+    assert written[0] < 1000
+    assert len(consumed) == 1000
+
+
+def test_read_container_with_schema_evolution():
+    @dataclasses.dataclass
+    class UserV2(AvroModel):
+        name: str
+        age: int
+        country: str = "Argentina"
+
+        class Meta:
+            schema_name = "User"
+
+    fo = io.BytesIO()
+    User.write_container(fo, build_users(2))
+    fo.seek(0)
+
+    assert list(UserV2.read_container(fo)) == [UserV2(name="user 0", age=0), UserV2(name="user 1", age=1)]
+
+
+def test_write_container_with_unknown_codec():
+    with pytest.raises(ValueError):
+        User.write_container(io.BytesIO(), build_users(1), codec="unknown")
@@ -0,0 +1,128 @@
+import dataclasses
+import enum
+import io
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, serialization
+
+
+class FavoriteColor(enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    favorite_color: FavoriteColor
+    address: typing.Optional[Address] = None
+
+
+def build_users(total: int) -> typing.Iterator[User]:
+    for number in range(total):
+        yield User(
+            name=f"user {number}",
+            age=number,
+            favorite_color=FavoriteColor.BLUE,
+            address=Address(street="test", street_number=number) if number % 2 else None,
+        )
+
+
+def test_write_and_iter_json():
+    fo = io.StringIO()
+
+    assert User.write_json(fo, build_users(10)) == 10
+
+    events = [user.serialize(serialization_type="avro-json").decode() for user in build_users(10)]
+    assert fo.getvalue() == "".join(f"{event}\n" for event in events)
+
+    fo.seek(0)
+    assert list(User.iter_json(fo)) == list(build_users(10))
+
+
+def test_iter_json_binary_stream_and_empty_lines():
+    users = list(build_users(2))
+    fo = io.BytesIO(b"\n" + users[0].serialize("avro-json") + b"\n\n" + users[1].serialize("avro-json") + b"\n")
+
+    assert list(User.iter_json(fo)) == users
+
+
+def test_iter_json_as_dict():
+    fo = io.StringIO()
+    User.write_json(fo, build_users(1))
+    fo.seek(0)
+
+    assert list(User.iter_json(fo, create_instance=False)) == [
+        {"name": "user 0", "age": 0, "favorite_color": FavoriteColor.BLUE, "address": None}
+    ]
+
+
+def test_iter_json_is_lazy():
+    user = next(build_users(1))
+
+    def lines():
+        yield user.serialize("avro-json").decode() + "\n"
+        raise AssertionError("only one line should be read")
+
+    assert next(User.iter_json(lines())) == user
+
+
+def test_write_json_writes_each_instance():
+    written: typing.List[int] = []
+    consumed: typing.List[User] = []
+
+    class Output(io.StringIO):
+        def write(self, data):
+            written.append(len(consumed))
+            return super().write(data)
+
+    def instances():
+        for user in build_users(3):
+            consumed.append(user)
+            yield user
+
+    User.write_json(Output(), instances())
+
+    assert written[0] < 3
+    assert len(consumed) == 3
+
+
+def test_deserialize_decodes_only_the_first_record():
+    user = next(build_users(1))
+    event = user.serialize("avro-json") + b"\nnot a json record"
+
+    assert User.deserialize(event, serialization_type="avro-json") == user
+
+
+def test_deserialize_empty_avro_json():
+    with pytest.raises(ValueError):
+        User.deserialize(b"", serialization_type="avro-json")
+
+
+def test_write_and_iter_json_in_chunks(monkeypatch):
+    monkeypatch.setattr(serialization, "JSON_CHUNK_SIZE", 4)
+    fo = io.StringIO()
+
+    assert User.write_json(fo, build_users(20)) == 20
+
+    events = [user.serialize(serialization_type="avro-json").decode() for user in build_users(20)]
+    assert fo.getvalue() == "".join(f"{event}\n" for event in events)
+
+    fo.seek(0)
+    assert list(User.iter_json(fo)) == list(build_users(20))
+
+
+def test_iter_chunks(monkeypatch):
+    monkeypatch.setattr(serialization, "JSON_CHUNK_SIZE", 4)
+
+    assert [len(chunk) for chunk in serialization.iter_chunks(range(20))] == [1, 2, 4, 4, 4, 4, 1]
+    assert list(serialization.iter_chunks([])) == []
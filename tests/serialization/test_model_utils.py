@@ -79,3 +79,29 @@ def test_custom_dacite_config():
     }
     instance = Trip.deserialize(serialized_val)
     assert instance.transport == bus
+
+
+def test_dacite_config_is_cached():
+    @dataclass
+    class User(AvroModel):
+        name: str
+
+        class Meta:
+            dacite_config = {
+                "strict": True,
+                "cast": [],
+            }
+
+    config = User.config()
+
+    for _ in range(3):
+        assert User.config() is config
+        User.parse_obj({"name": "john"})
+
+    assert config.strict
+    assert list(config.cast) == [typing.Tuple, tuple, enum.Enum]
+    assert User.Meta.dacite_config["cast"] == []
+
+    User.clear_cache()
+    assert User.config() is not config
+    assert list(User.config().cast) == [typing.Tuple, tuple, enum.Enum]
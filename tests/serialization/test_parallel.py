@@ -0,0 +1,112 @@
+import dataclasses
+import datetime
+import decimal
+import enum
+import typing
+
+import pytest
+
+from dataclasses_avroschema import AvroCodecPool, AvroModel, parallel, types
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+    color: Color
+    address: Address
+    created_at: datetime.datetime
+    balance: types.condecimal(max_digits=10, decimal_places=2)
+    tags: typing.List[str] = dataclasses.field(default_factory=list)
+
+
+created_at = datetime.datetime(2023, 1, 1, 10, 30, tzinfo=datetime.timezone.utc)
+users = [
+    User(
+        name=f"user-{index}",
+        age=index,
+        color=Color.BLUE if index % 2 else Color.YELLOW,
+        address=Address(street="test", street_number=index),
+        created_at=created_at,
+        balance=decimal.Decimal("10.25"),
+        tags=["a"] * (index % 3),
+    )
+    for index in range(23)
+]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with AvroCodecPool(User, processes=2, chunk_size=5) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("serialization_type", ("avro", "avro-json", "avro-single-object"))
+def test_serialize_many(pool, serialization_type):
+    events = pool.serialize_many(users, serialization_type=serialization_type)
+
+    assert events == User.serialize_many(users, serialization_type=serialization_type)
+    assert pool.serialize_many(users, serialization_type=serialization_type, concatenate=True) == User.serialize_many(
+        users, serialization_type=serialization_type, concatenate=True
+    )
+
+
+@pytest.mark.parametrize("serialization_type", ("avro", "avro-json", "avro-single-object"))
+def test_deserialize_many(pool, serialization_type):
+    events = User.serialize_many(users, serialization_type=serialization_type)
+
+    assert list(pool.deserialize_many(events, serialization_type=serialization_type)) == users
+    assert list(pool.deserialize_many(events, serialization_type=serialization_type, create_instance=False)) == list(
+        User.deserialize_many(events, serialization_type=serialization_type, create_instance=False)
+    )
+
+
+def test_deserialize_memoryviews(pool):
+    buffer, offsets = User.serialize_many(users, concatenate=True)
+    view = memoryview(buffer)
+
+    assert list(pool.deserialize_many(view[start:end] for start, end in zip(offsets, offsets[1:]))) == users
+
+
+def test_empty_batch(pool):
+    assert pool.serialize_many([]) == []
+    assert pool.serialize_many([], concatenate=True) == (b"", [0])
+    assert list(pool.deserialize_many([])) == []
+
+
+def test_writer_schema():
+    @dataclasses.dataclass
+    class UserV1(AvroModel):
+        name: str
+
+        class Meta:
+            schema_name = "User"
+
+    @dataclasses.dataclass
+    class UserV2(AvroModel):
+        name: str
+        age: int = 20
+
+        class Meta:
+            schema_name = "User"
+
+    events = UserV1.serialize_many([UserV1(name="john"), UserV1(name="peter")])
+
+    with AvroCodecPool(UserV2, processes=1, writer_schema=UserV1) as pool:
+        assert list(pool.deserialize_many(events)) == [UserV2(name="john"), UserV2(name="peter")]
+
+
+def test_worker_is_not_initialized():
+    with pytest.raises(RuntimeError):
+        parallel.serialize_chunk([], "avro", None)
@@ -0,0 +1,141 @@
+import dataclasses
+import typing
+from unittest import mock
+
+import fastavro
+import pytest
+
+from dataclasses_avroschema import AvroModel, resolution
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+
+
+@dataclasses.dataclass
+class UserV2(AvroModel):
+    name: str
+    age: int
+    country: str = "Argentina"
+
+    class Meta:
+        schema_name = "User"
+
+
+@pytest.fixture(autouse=True)
+def clear_writer_schema_cache() -> typing.Iterator[None]:
+    resolution.writer_schema_cache.cache_clear()
+    resolution.dict_fingerprints.cache_clear()
+    yield
+    resolution.writer_schema_cache.cache_clear()
+    resolution.dict_fingerprints.cache_clear()
+
+
+def test_writer_model_is_resolved_once():
+    event = User(name="john", age=20).serialize()
+
+    for _ in range(5):
+        assert UserV2.deserialize(event, writer_schema=User) == UserV2(name="john", age=20)
+
+    assert list(UserV2.deserialize_many([event, event], writer_schema=User)) == [UserV2(name="john", age=20)] * 2
+    assert resolution.writer_schema_cache.cache_info() == resolution.CacheInfo(
+        hits=5, misses=1, maxsize=resolution.WRITER_SCHEMA_CACHE_SIZE, currsize=1
+    )
+
+
+def test_writer_dict_is_parsed_once():
+    event = User(name="john", age=20).serialize()
+    writer_schema = User.avro_schema_to_python()
+
+    with mock.patch("fastavro.parse_schema", wraps=fastavro.parse_schema) as parse_schema:
+        for _ in range(5):
+            assert UserV2.deserialize(event, writer_schema=writer_schema) == UserV2(name="john", age=20)
+
+        # a different dict with the same schema shares the resolved schemas
+        assert UserV2.deserialize(event, writer_schema=User.avro_schema_to_python()) == UserV2(name="john", age=20)
+
+    assert parse_schema.call_count == 1
+    assert resolution.writer_schema_cache.cache_info().misses == 1
+    assert resolution.writer_schema_cache.cache_info().hits == 5
+
+
+def test_modified_writer_dict_is_resolved_again():
+    event = User(name="john", age=20).serialize()
+    writer_schema = User.avro_schema_to_python()
+    assert UserV2.deserialize(event, writer_schema=writer_schema) == UserV2(name="john", age=20)
+
+    writer_schema["fields"].append({"name": "country", "type": "string", "default": "Uruguay"})
+    event = UserV2(name="john", age=20, country="Chile").serialize()
+
+    assert UserV2.deserialize(event, writer_schema=writer_schema) == UserV2(name="john", age=20, country="Chile")
+    assert resolution.dict_fingerprint(writer_schema) == resolution.schema_fingerprint(writer_schema)
+    assert resolution.writer_schema_cache.cache_info().misses == 2
+
+
+def test_dict_fingerprint_of_reused_id():
+    schema = User.avro_schema_to_python()
+    other_schema = UserV2.avro_schema_to_python()
+    resolution.dict_fingerprint(schema)
+
+    # another dict with the id of a freed dict
+    resolution.dict_fingerprints.set(id(other_schema), (schema, schema, resolution.schema_fingerprint(schema)))
+    assert resolution.dict_fingerprint(other_schema) == resolution.schema_fingerprint(other_schema)
+
+
+def test_cache_is_keyed_by_reader_class():
+    event = User(name="john", age=20).serialize()
+
+    assert User.deserialize(event, writer_schema=User) == User(name="john", age=20)
+    assert UserV2.deserialize(event, writer_schema=User) == UserV2(name="john", age=20)
+    assert resolution.writer_schema_cache.cache_info().currsize == 2
+
+
+def test_same_writer_and_reader_schema():
+    schemas = User._resolve_schemas(User.avro_schema_to_python())
+
+    # fastavro does not resolve the schemas when the writer is the reader schema
+    assert schemas.writer_schema is schemas.reader_schema is User._parsed_schema()
+    assert UserV2._resolve_schemas(User).writer_schema is not UserV2._parsed_schema()
+    assert User._resolve_schemas().writer_schema is User._parsed_schema()
+
+
+def test_clear_cache_removes_resolved_schemas():
+    event = User(name="john", age=20).serialize()
+    UserV2.deserialize(event, writer_schema=User)
+    User.deserialize(event, writer_schema=User)
+    UserV2.deserialize(event, writer_schema=User)
+
+    UserV2.clear_cache()
+
+    # only the schemas resolved for the class are removed
+    assert resolution.writer_schema_cache.cache_info() == resolution.CacheInfo(
+        hits=1, misses=2, maxsize=resolution.WRITER_SCHEMA_CACHE_SIZE, currsize=1
+    )
+    assert User._resolve_schemas(User).reader_schema is User._parsed_schema()
+    assert resolution.writer_schema_cache.cache_info().hits == 2
+
+
+def test_lru_cache():
+    cache = resolution.LRUCache(maxsize=2)
+
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("b", lambda: 2) == 2
+    assert cache.get("a", lambda: 10) == 1
+    assert cache.get("c", lambda: 3) == 3
+
+    # "b" is the least recently used
+    assert cache.get("b", lambda: 20) == 20
+    assert cache.get("c", lambda: 30) == 3
+    assert cache.cache_info() == resolution.CacheInfo(hits=2, misses=4, maxsize=2, currsize=2)
+
+    cache.set("c", 40)
+    assert cache.get("c", lambda: 50) == 40
+    assert cache.cache_info() == resolution.CacheInfo(hits=3, misses=4, maxsize=2, currsize=2)
+
+    assert cache.remove(lambda key: key == "b") == 1
+    assert cache.cache_info() == resolution.CacheInfo(hits=3, misses=4, maxsize=2, currsize=1)
+
+    cache.cache_clear()
+    assert cache.cache_info() == resolution.CacheInfo(hits=0, misses=0, maxsize=2, currsize=0)
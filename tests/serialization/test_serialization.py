@@ -1,5 +1,7 @@
 import datetime
 import enum
+import io
+import mmap
 import typing
 import uuid
 from dataclasses import dataclass
@@ -7,7 +9,8 @@ from dataclasses import dataclass
 import pytest
 from dateutil.tz import UTC
 
-from dataclasses_avroschema import AvroModel
+from dataclasses_avroschema import AvroModel, serialization
+from dataclasses_avroschema.exceptions import BufferTooSmall
 from dataclasses_avroschema.schema_generator import AVRO, AVRO_JSON
 
 a_datetime = datetime.datetime(2019, 10, 12, 17, 57, 42, tzinfo=UTC)
@@ -219,3 +222,207 @@ def test_deserialization_with_writer_schema_dict():
 def test_deserialization_with_writer_schema_avro_model():
     user = User(**data_user)
     UserCompatible.deserialize(user.serialize(), writer_schema=User)
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_serialize_many(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instances = [klass(**data) for _ in range(3)]
+
+    assert klass.serialize_many(instances) == [avro_binary] * 3
+    assert klass.serialize_many(instances, serialization_type="avro-json") == [avro_json] * 3
+    assert klass.serialize_many([]) == []
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_serialize_many_concatenated(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instances = (klass(**data) for _ in range(3))
+    buffer, offsets = klass.serialize_many(instances, concatenate=True)
+
+    assert buffer == avro_binary * 3
+    assert offsets == [0, len(avro_binary), len(avro_binary) * 2, len(avro_binary) * 3]
+    assert klass.deserialize(buffer[offsets[1] : offsets[2]]) == klass(**data)
+
+    instances = (klass(**data) for _ in range(3))
+    buffer, offsets = klass.serialize_many(instances, serialization_type="avro-json", concatenate=True)
+
+    assert buffer == (avro_json + b"\n") * 3
+    assert offsets == [0, len(avro_json) + 1, (len(avro_json) + 1) * 2, (len(avro_json) + 1) * 3]
+    assert klass.deserialize(buffer[offsets[2] : offsets[3]], serialization_type="avro-json") == klass(**data)
+
+
+def test_invalid_serialize_many_type():
+    with pytest.raises(ValueError):
+        User.serialize_many([User(**data_user)], serialization_type="json")
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_deserialize_many(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instance = klass(**data)
+
+    assert list(klass.deserialize_many([avro_binary] * 3)) == [instance] * 3
+    assert list(klass.deserialize_many([avro_json] * 3, serialization_type="avro-json")) == [instance] * 3
+    assert list(klass.deserialize_many([avro_binary] * 3, create_instance=False)) == [python_dict] * 3
+    assert list(klass.deserialize_many([])) == []
+
+
+def test_deserialize_many_is_lazy():
+    def payloads():
+        yield user_avro_binary
+        raise AssertionError("only one payload should be consumed")
+
+    users = User.deserialize_many(payloads())
+    assert next(users) == User(**data_user)
+
+
+def test_deserialize_many_with_writer_schema():
+    user = User(**data_user)
+    events = User.serialize_many([user, user])
+    expected = [UserCompatible(**data_user)] * 2
+
+    assert list(UserCompatible.deserialize_many(events, writer_schema=User)) == expected
+    assert list(UserCompatible.deserialize_many(events, writer_schema=User.avro_schema_to_python())) == expected
+
+
+def test_invalid_deserialize_many_type():
+    with pytest.raises(ValueError):
+        next(User.deserialize_many([user_avro_binary], serialization_type="json"))
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_deserialize_buffers(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instance = klass(**data)
+
+    for buffer_type in (bytearray, memoryview):
+        assert klass.deserialize(buffer_type(avro_binary)) == instance
+        assert klass.deserialize(buffer_type(avro_json), serialization_type="avro-json") == instance
+        assert list(klass.deserialize_many([buffer_type(avro_binary)] * 2)) == [instance] * 2
+
+
+def test_deserialize_memoryview_slices():
+    buffer, offsets = User.serialize_many([User(**data_user)] * 3, concatenate=True)
+    view = memoryview(buffer)
+    events = (view[start:end] for start, end in zip(offsets, offsets[1:]))
+
+    assert list(User.deserialize_many(events)) == [User(**data_user)] * 3
+
+
+def test_deserialize_mmap(tmp_path):
+    path = tmp_path / "event.avro"
+    path.write_bytes(user_avro_binary)
+
+    with open(path, "rb") as event_file:
+        with mmap.mmap(event_file.fileno(), 0, access=mmap.ACCESS_READ) as event:
+            user = User.deserialize(event)
+
+    # nothing is left pointing to the mmap after it is closed
+    assert user == User(**data_user)
+
+
+def test_deserialize_big_mmap(tmp_path, monkeypatch):
+    @dataclass
+    class Measures(AvroModel):
+        name: str
+        values: typing.List[int]
+        content: bytes
+
+    measures = Measures(name="measures", values=list(range(100_000)), content=b"x" * 100_000)
+    path = tmp_path / "measures.avro"
+    path.write_bytes(measures.serialize())
+
+    def get_input_stream(data):
+        raise AssertionError("the mmap must not be copied")
+
+    monkeypatch.setattr(serialization, "get_input_stream", get_input_stream)
+
+    with open(path, "rb") as event_file:
+        with mmap.mmap(event_file.fileno(), 0, access=mmap.ACCESS_READ) as event:
+            event.seek(10)
+
+            assert Measures.deserialize(event) == measures
+            assert Measures.deserialize(event) == measures
+            # the position of the mmap is restored
+            assert event.tell() == 10
+
+
+def test_deserialize_single_object_mmap(tmp_path):
+    path = tmp_path / "event.avro"
+    path.write_bytes(User(**data_user).serialize(serialization_type="avro-single-object"))
+
+    with open(path, "rb") as event_file:
+        with mmap.mmap(event_file.fileno(), 0, access=mmap.ACCESS_READ) as event:
+            user = User.deserialize(event, serialization_type="avro-single-object")
+            assert event.tell() == 0
+
+    assert user == User(**data_user)
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_serialize_into_file_like(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instance = klass(**data)
+    buffer = io.BytesIO()
+    buffer.write(b"header")
+
+    assert instance.serialize_into(buffer) == len(avro_binary)
+    assert instance.serialize_into(buffer, serialization_type="avro-json") == len(avro_json)
+    assert buffer.getvalue() == b"header" + avro_binary + avro_json
+
+
+@pytest.mark.parametrize("klass, data, avro_binary, avro_json, instance_json, python_dict", CLASSES_DATA_BINARY)
+def test_serialize_into_bytearray(klass, data, avro_binary, avro_json, instance_json, python_dict):
+    instance = klass(**data)
+    buffer = bytearray(4096)
+    buffer[:5] = b"\x00\x00\x00\x00\x01"
+
+    end = instance.serialize_into(buffer, offset=5)
+    assert end == 5 + len(avro_binary)
+    assert instance.serialize_into(buffer, serialization_type="avro-json", offset=end) == end + len(avro_json)
+
+    # the buffer is not resized, but it can be resized after writing into it
+    assert len(buffer) == 4096
+    buffer.append(0)
+    assert buffer[: end + len(avro_json)] == b"\x00\x00\x00\x00\x01" + avro_binary + avro_json
+    assert klass.deserialize(memoryview(buffer)[5:end]) == instance
+
+
+def test_serialize_into_memoryview():
+    buffer = bytearray(4096)
+    view = memoryview(buffer)[100:200]
+    event = User(**data_user).serialize()
+
+    assert User(**data_user).serialize_into(view) == len(event)
+    assert buffer[100 : 100 + len(event)] == event
+    assert not any(buffer[:100])
+
+
+def test_serialize_into_small_buffer():
+    buffer = bytearray(10)
+    event = User(**data_user).serialize()
+
+    with pytest.raises(BufferTooSmall) as excinfo:
+        User(**data_user).serialize_into(buffer, offset=5)
+
+    assert excinfo.value.size == 10
+    assert excinfo.value.needed == 5 + len(event)
+    assert len(buffer) == 10
+
+    assert User(**data_user).serialize_into(bytearray(len(event))) == len(event)
+
+
+def test_invalid_serialize_into_type():
+    buffer = bytearray(100)
+
+    with pytest.raises(ValueError):
+        User(**data_user).serialize_into(buffer, serialization_type="json")
+
+    assert buffer == bytes(100)
+
+
+def test_invalid_serialize_into_buffer():
+    with pytest.raises(ValueError, match="writable"):
+        User(**data_user).serialize_into(memoryview(bytes(100)))
+
+    with pytest.raises(ValueError, match="out of the buffer"):
+        User(**data_user).serialize_into(bytearray(100), offset=101)
+
+    with pytest.raises(ValueError, match="offset"):
+        User(**data_user).serialize_into(io.BytesIO(), offset=10)
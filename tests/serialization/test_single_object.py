@@ -0,0 +1,222 @@
+import dataclasses
+import typing
+from unittest import mock
+
+import pytest
+
+from dataclasses_avroschema import AvroModel, ModelRegistry, SchemaStore
+from dataclasses_avroschema.confluent import InMemorySchemaResolver, WireFormat
+from dataclasses_avroschema.exceptions import InvalidSingleObjectEncoding, UnknownSchemaFingerprint, UnknownSchemaId
+from dataclasses_avroschema.schema_generator import AVRO_SINGLE_OBJECT
+
+
+@dataclasses.dataclass
+class User(AvroModel):
+    name: str
+    age: int
+
+
+@dataclasses.dataclass
+class UserV2(AvroModel):
+    name: str
+    age: int
+    country: str = "Argentina"
+
+    class Meta:
+        schema_name = "User"
+
+
+@dataclasses.dataclass
+class Address(AvroModel):
+    street: str
+    street_number: int
+
+
+def test_single_object_encoding():
+    user = User(name="john", age=20)
+    event = user.serialize(serialization_type=AVRO_SINGLE_OBJECT)
+
+    assert event[:2] == b"\xc3\x01"
+    assert event[2:10] == bytes.fromhex(User.fingerprint())
+    assert event[10:] == user.serialize()
+
+
+def rabin_fingerprint(data: bytes) -> int:
+    """
+    64 bit Rabin fingerprint as defined in the avro specification
+    """
+    empty = 0xC15D213AA4D7A795
+    table = []
+    for byte in range(256):
+        value = byte
+        for _ in range(8):
+            value = (value >> 1) ^ (empty & -(value & 1))
+        table.append(value)
+
+    fingerprint = empty
+    for byte in data:
+        fingerprint = (fingerprint >> 8) ^ table[(fingerprint ^ byte) & 0xFF]
+    return fingerprint
+
+
+def test_single_object_header_fingerprint():
+    event = User(name="john", age=20).serialize(serialization_type=AVRO_SINGLE_OBJECT)
+    fingerprint = rabin_fingerprint(User.parsing_canonical_form().encode())
+
+    # the fingerprint is written in little endian order
+    assert event[2:10] == fingerprint.to_bytes(8, "little")
+
+
+def test_single_object_round_trip():
+    user = User(name="john", age=20)
+    event = user.serialize(serialization_type=AVRO_SINGLE_OBJECT)
+
+    assert User.deserialize(event, serialization_type=AVRO_SINGLE_OBJECT) == user
+    assert User.deserialize(memoryview(event), serialization_type=AVRO_SINGLE_OBJECT) == user
+    assert User.deserialize(event, serialization_type=AVRO_SINGLE_OBJECT, create_instance=False) == {
+        "name": "john",
+        "age": 20,
+    }
+    assert UserV2.deserialize(event, serialization_type=AVRO_SINGLE_OBJECT, writer_schema=User) == UserV2(
+        name="john", age=20
+    )
+
+
+def test_single_object_batches():
+    users = [User(name="john", age=20), User(name="jane", age=30)]
+    events = User.serialize_many(users, serialization_type=AVRO_SINGLE_OBJECT)
+
+    assert events == [user.serialize(serialization_type=AVRO_SINGLE_OBJECT) for user in users]
+    assert list(User.deserialize_many(events, serialization_type=AVRO_SINGLE_OBJECT)) == users
+
+    buffer = bytearray(len(events[0]))
+    assert users[0].serialize_into(buffer, serialization_type=AVRO_SINGLE_OBJECT) == len(events[0])
+    assert buffer == events[0]
+
+
+def test_single_object_with_other_schema():
+    event = User(name="john", age=20).serialize(serialization_type=AVRO_SINGLE_OBJECT)
+
+    with pytest.raises(UnknownSchemaFingerprint) as excinfo:
+        UserV2.deserialize(event, serialization_type=AVRO_SINGLE_OBJECT)
+
+    assert excinfo.value.fingerprint == User.fingerprint()
+    assert User.fingerprint() in str(excinfo.value)
+
+
+@pytest.mark.parametrize("event", [b"", b"\xc3\x01\x00", b"\x00" * 20])
+def test_invalid_single_object(event):
+    with pytest.raises(InvalidSingleObjectEncoding):
+        User.deserialize(event, serialization_type=AVRO_SINGLE_OBJECT)
+
+
+def test_schema_store_decode():
+    store = SchemaStore([User, Address])
+    user = User(name="john", age=20)
+    address = Address(street="test", street_number=10)
+
+    assert store.decode(user.serialize(serialization_type=AVRO_SINGLE_OBJECT)) == user
+    assert store.decode(address.serialize(serialization_type=AVRO_SINGLE_OBJECT)) == address
+    assert store.decode(bytearray(address.serialize(serialization_type=AVRO_SINGLE_OBJECT)), create_instance=False) == {
+        "street": "test",
+        "street_number": 10,
+    }
+
+
+def test_schema_store_register():
+    store = SchemaStore()
+
+    @store.register
+    @dataclasses.dataclass
+    class Event(AvroModel):
+        name: str
+
+    assert Event in store
+    assert User not in store
+    assert len(store) == 1
+    assert store.get_model(Event.fingerprint()) is Event
+
+    with pytest.raises(UnknownSchemaFingerprint):
+        store.decode(User(name="john", age=20).serialize(serialization_type=AVRO_SINGLE_OBJECT))
+
+    with pytest.raises(InvalidSingleObjectEncoding):
+        store.decode(Event(name="test").serialize())
+
+
+def test_schema_store_decode_does_not_try_other_models(monkeypatch):
+    store = SchemaStore([User, Address])
+    calls: typing.List[str] = []
+    monkeypatch.setattr(Address, "deserialize", classmethod(lambda *args, **kwargs: calls.append("address")))
+
+    store.decode(User(name="john", age=20).serialize(serialization_type=AVRO_SINGLE_OBJECT))
+
+    assert calls == []
+
+
+def test_model_registry_single_object():
+    registry = ModelRegistry([User, Address])
+    user = User(name="john", age=20)
+    address = Address(street="test", street_number=10)
+    events = [
+        user.serialize(serialization_type=AVRO_SINGLE_OBJECT),
+        address.serialize(serialization_type=AVRO_SINGLE_OBJECT),
+    ]
+
+    assert registry.decode(events[0]) == user
+    assert list(registry.decode_many(events)) == [user, address]
+    assert list(registry.decode_many(events, create_instance=False)) == [
+        {"name": "john", "age": 20},
+        {"street": "test", "street_number": 10},
+    ]
+
+    # without a resolver only single object events can be decoded
+    with pytest.raises(InvalidSingleObjectEncoding):
+        registry.decode(b"\x00\x00\x00\x00\x01" + user.serialize())
+
+
+def test_model_registry_wire_format():
+    resolver = InMemorySchemaResolver()
+    wire_format = WireFormat(resolver)
+    registry = ModelRegistry([UserV2, Address], resolver=resolver)
+
+    user_id = resolver.register(User)
+    address_id = resolver.register(Address)
+    address = Address(street="test", street_number=10)
+    events = [
+        # written with a previous version of the schema, the model is found by its name
+        wire_format.encode(User(name="john", age=20), schema_id=user_id),
+        wire_format.encode(address, schema_id=address_id),
+        # single object and wire format events can be mixed
+        address.serialize(serialization_type=AVRO_SINGLE_OBJECT),
+    ]
+
+    with mock.patch.object(resolver, "get_schema", wraps=resolver.get_schema) as get_schema:
+        for _ in range(3):
+            assert list(registry.decode_many(events)) == [UserV2(name="john", age=20), address, address]
+
+    assert get_schema.call_count == 2
+    assert registry.get_model_by_schema_id(user_id)[0] is UserV2
+
+
+def test_model_registry_unknown_schema_id():
+    @dataclasses.dataclass
+    class Event(AvroModel):
+        name: str
+
+    resolver = InMemorySchemaResolver()
+    event_id = resolver.register(Event)
+    registry = ModelRegistry([User], resolver=resolver)
+    event = WireFormat(resolver).encode(Event(name="test"), schema_id=event_id)
+
+    with pytest.raises(UnknownSchemaFingerprint):
+        registry.decode(event)
+
+    with pytest.raises(UnknownSchemaId):
+        registry.decode(b"\x00\x00\x00\x00\x09" + Event(name="test").serialize())
+
+    # when the model is registered, the schema id is resolved again
+    registry.register(Event)
+    assert registry.decode(event) == Event(name="test")
+
+    with pytest.raises(ValueError):
+        ModelRegistry([User]).get_model_by_schema_id(1)
@@ -0,0 +1,206 @@
+import dataclasses
+import decimal
+import enum
+import json
+import typing
+from unittest import mock
+
+import pytest
+from fastavro.validation import ValidationError
+
+from dataclasses_avroschema import AvroModel, types, validation
+
+
+class Color(enum.Enum):
+    BLUE = "BLUE"
+    YELLOW = "YELLOW"
+
+
+@dataclasses.dataclass
+class Measure(AvroModel):
+    count: types.Int32
+    ratio: types.Float32
+    amount: types.condecimal(max_digits=4, decimal_places=2)
+    code: types.confixed(size=2)
+    color: Color
+    samples: typing.List[types.Float32] = dataclasses.field(default_factory=list)
+
+
+def build_measure(**kwargs: typing.Any) -> Measure:
+    data = {
+        "count": 1,
+        "ratio": 0.5,
+        "amount": decimal.Decimal("10.25"),
+        "code": b"ab",
+        "color": Color.BLUE,
+        "samples": [1.5],
+    }
+    data.update(kwargs)
+    return Measure(**data)
+
+
+def test_valid_instances():
+    report = Measure.validate_many(build_measure() for _ in range(10))
+
+    assert report.valid
+    assert report
+    assert report.total == 10
+    assert report.invalid_rows == []
+    report.raise_for_errors()
+
+
+@pytest.mark.parametrize(
+    "field, value, message",
+    (
+        ("count", 1 << 31, "Measure.count is <2147483648> of type <class 'int'> expected int"),
+        ("count", "1", "Measure.count is <1> of type <class 'str'> expected int"),
+        ("ratio", 1e39, "Measure.ratio is <1e+39> of type <class 'float'> expected float"),
+        (
+            "amount",
+            decimal.Decimal("100.25"),
+            "Measure.amount is <100.25> of type <class 'decimal.Decimal'>: "
+            "The decimal precision is bigger than allowed by schema",
+        ),
+        (
+            "amount",
+            decimal.Decimal("1.255"),
+            "Measure.amount is <1.255> of type <class 'decimal.Decimal'>: "
+            "Scale provided in schema does not match the decimal",
+        ),
+        ("code", b"abc", "Measure.code is <b'abc'> of type <class 'bytes'> expected "),
+        ("color", "RED", "Measure.color is <RED> of type <class 'str'> expected "),
+        ("samples", [-1e39], "Measure.samples is <[-1e+39]> of type <class 'list'> expected "),
+    ),
+)
+def test_invalid_values(field, value, message):
+    instances = [build_measure(), build_measure(**{field: value}), build_measure()]
+    report = Measure.validate_many(instances)
+
+    assert not report.valid
+    assert report.invalid_rows == [1]
+    assert len(report.errors) == 1
+
+    error = report.errors[0]
+    assert (error.row, error.field) == (1, field)
+    assert error.message.startswith(message)
+
+
+def test_errors_are_sorted_by_row():
+    instances = [
+        build_measure(),
+        build_measure(color="RED", count="1"),
+        build_measure(ratio=1e39),
+        build_measure(code=b"a"),
+    ]
+    report = Measure.validate_many(instances)
+
+    assert report.invalid_rows == [1, 2, 3]
+    assert [(error.row, error.field) for error in report.errors] == [
+        (1, "count"),
+        (1, "color"),
+        (2, "ratio"),
+        (3, "code"),
+    ]
+
+    with pytest.raises(ValidationError) as exc:
+        report.raise_for_errors()
+    assert json.loads(str(exc.value))[0] == "row 1: Measure.count is <1> of type <class 'str'> expected int"
+
+
+def test_stop_with_first_error():
+    # a later field fails in an earlier row
+    instances = [build_measure(), build_measure(color="RED"), build_measure(count="1"), build_measure(count="2")]
+    report = Measure.validate_many(instances, collect_errors=False)
+
+    assert [(error.row, error.field) for error in report.errors] == [(1, "color")]
+
+    # in the same row the first field is reported
+    instances[1] = build_measure(color="RED", count="1")
+    report = Measure.validate_many(instances, collect_errors=False)
+
+    assert [(error.row, error.field) for error in report.errors] == [(1, "count")]
+
+
+@dataclasses.dataclass
+class Reading(AvroModel):
+    name: str
+    value: types.Float32
+    total: float
+    enabled: bool
+    level: typing.Optional[types.Int32] = None
+
+
+READING = {"name": "john", "value": 1.5, "total": 2.5, "enabled": False}
+
+
+@pytest.mark.parametrize(
+    "values",
+    (
+        {"value": float("nan")},
+        {"value": float("inf")},
+        {"level": 2},
+        {"name": type("Name", (str,), {})("john")},
+    ),
+    ids=("nan", "inf", "optional", "str subclass"),
+)
+def test_valid_values_checked_one_by_one(values):
+    instances = [Reading(name="john", value=1.5, total=1, enabled=True), Reading(**{**READING, **values})]
+
+    assert all(instance.validate() for instance in instances)
+    assert Reading.validate_many(instances).valid
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    (
+        ("name", 1),
+        ("value", -1e39),
+        ("enabled", 1),
+        ("total", True),
+        ("level", 1 << 31),
+        ("level", "1"),
+    ),
+)
+def test_invalid_column_values(field, value):
+    instances = [Reading(**READING), Reading(**{**READING, field: value}), Reading(**READING, level=1)]
+    report = Reading.validate_many(instances)
+
+    assert report.invalid_rows == [1]
+    assert {error.field for error in report.errors} == {field}
+
+
+@pytest.mark.parametrize("value", ("BLUE", Color.YELLOW))
+def test_valid_enum_column(value):
+    assert Measure.validate_many([]).valid
+    assert Measure.validate_many([build_measure(), build_measure(color=value)]).valid
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    (("color", ["BLUE"]), ("color", "RED"), ("code", "ab"), ("code", b"a")),
+)
+def test_invalid_column_of_named_types(field, value):
+    report = Measure.validate_many([build_measure(), build_measure(**{field: value})])
+
+    assert [(error.row, error.field) for error in report.errors] == [(1, field)]
+
+
+def test_validate_matches_validate_many():
+    measure = build_measure(ratio=1e39)
+
+    with pytest.raises(ValidationError) as exc:
+        measure.validate()
+    assert json.loads(str(exc.value)) == [error.message for error in Measure.validate_many([measure]).errors]
+
+
+@pytest.mark.parametrize("collect_errors", (True, False))
+def test_validate_in_processes(collect_errors):
+    instances = [build_measure() for _ in range(20)]
+    instances[7] = build_measure(count="1")
+    instances[15] = build_measure(color="RED")
+
+    with mock.patch.object(validation, "MIN_ROWS_PER_PROCESS", 5):
+        report = Measure.validate_many(instances, collect_errors=collect_errors, processes=2)
+
+    assert report.total == 20
+    assert report.invalid_rows == ([7, 15] if collect_errors else [7])